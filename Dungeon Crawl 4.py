@@ -5,12 +5,26 @@ import os
 import random
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
 import pygame
 import numpy as np
 
+# pygame-ce's fblits skips building the per-blit result list; classic pygame only has blits
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+try:
+    from numba import njit  # optional: JIT-compiles the steering, hit-test and particle kernels when available
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # optional: faster save file reads and writes when available
+except ImportError:
+    orjson = None
+
 # ======================= CONFIG =======================
 WIDTH, HEIGHT = 1920, 1080
 FPS = 60
@@ -60,6 +74,17 @@ ELITE_PACK_CHANCE = 0.35
 PACK_SIZE_RANGE = (4, 8)
 ELITE_MULT = {"hp": 2.6, "dmg": 1.8, "spd": 1.08, "radius": 26}
 AURA_RADIUS = 300
+ENEMY_GRID_SHIFT = 8  # enemy spatial hash cell = 256px (1 << 8)
+CHAIN_LIGHTNING_RANGE = 150
+ENEMY_ACTIVE_RADIUS = 2 * WIDTH  # enemies farther than ~2 screens from the player are frozen
+ENEMY_DESPAWN_TIME = 8.0  # seconds a non-boss enemy stays frozen before it is dropped to free its spawn slot
+ENEMY_AI_DT = 1.0 / 30  # fixed step for enemy decisions (steering, auras, shots)
+# Enemy class tags (Enemy.kind_flags), cheaper than isinstance in per-frame loops
+KIND_NORMAL = 0
+KIND_ELITE = 1
+KIND_BOSS = 2
+KIND_GOBLIN = 4
+ENEMY_SPRITE_KINDS = (0, 1, 2, 3)  # skeleton, fallen, spider and wraith bodies come from cached sprites
 AURAS = {
     "haste":    {"speed":1.28,"damage":1.00,"taken":1.00,"color":(120,200,255)},
     "frenzy":   {"speed":1.00,"damage":1.35,"taken":1.00,"color":(255,150,90)},
@@ -116,6 +141,9 @@ GOBLIN_MIN_INTERVAL = 660.0  # minimum 11 minutes between goblin spawns
 
 TILE = 48
 MAP_W, MAP_H = 560, 440
+TILE_CHUNK = 16  # tiles per side of a pre-rendered map chunk (768px)
+TILE_CHUNK_CACHE = 20  # chunks kept alive; a 1080p view touches at most 12
+DECOR_GRID_SHIFT = 3  # static decorations (scenery, torches, pools, portals) bucketed in 8x8-tile cells
 WALL = 1
 FLOOR = 0
 
@@ -135,6 +163,18 @@ WALL_ROCK = "rock"
 WALL_WATER = "water"
 WALL_CLIFF = "cliff"
 WALL_DEFAULT = "wall"
+
+# Texture classes for pre-rendered tile chunks; each class owns TILE_VARIANTS consecutive atlas slots
+TILE_VARIANTS = 8
+TILE_CLASS_UNSEEN_WALL = 0
+TILE_CLASS_UNSEEN_FLOOR = 1
+TILE_CLASS_WALLS = (WALL_TREE, WALL_ROCK, WALL_WATER)  # classes 2..4, any other wall type is class 5
+TILE_CLASS_WALL = 5
+TILE_CLASS_WATER = 2 + TILE_CLASS_WALLS.index(WALL_WATER)
+TILE_CLASS_TERRAINS = (TERRAIN_GRASS, TERRAIN_DIRT, TERRAIN_ROAD, TERRAIN_SAND,
+                       TERRAIN_SNOW, TERRAIN_LAVA_ROCK, TERRAIN_MUD, TERRAIN_STONE)  # classes 6..13
+TILE_CLASS_FLOOR = 6 + len(TILE_CLASS_TERRAINS)  # floor with an unlisted terrain
+TILE_CLASS_COUNT = TILE_CLASS_FLOOR + 1
 BIOME_COLORS = {
     "crypt":      {"wall_base": 38, "floor_r": 34, "floor_g": 52, "floor_b": 28,
                    "wall_tint": (0, 6, -4), "floor_tint": (0, 4, -2),
@@ -171,6 +211,19 @@ BIOME_NAMES = {
 BIOME_HAZARD = {
     "crypt": "poison", "cave": None, "firepit": "lava", "icecavern": "ice", "swamp": "poison",
 }
+HAZARD_BUBBLE_COLORS = {"lava": (255, 120, 20), "ice": (140, 200, 255), "poison": (60, 180, 40)}
+HAZARD_FRAMES = 32  # pre-rendered pulse phases per hazard pool kind
+CORPSE_FADE_STEPS = 16  # quantised fade levels for pre-rendered corpse blobs
+PARTICLE_FADE_STEPS = 8  # quantised fade levels for pre-rendered particle blobs
+PARTICLE_COLOR_MASK = ~7  # particle colours are snapped to steps of 8 so their blobs can be shared
+BLOB_CACHE_MAX = 4096  # circle sprites kept before the blob cache is flushed
+WORLD_LABEL_CACHE_MAX = 256  # rendered name tags kept before the cache is flushed
+UI_LABEL_CACHE_MAX = 512  # rendered HUD and menu strings kept before the cache is flushed
+TOOLTIP_CACHE_MAX = 64  # composed item tooltips kept before the cache is flushed
+MODAL_SETTLE_FRAMES = 3  # redraws after a change so the translucent backdrop fully covers the last frame
+MODAL_FPS = 60  # input polling rate of the menu screens; they only redraw when something changed
+FLOATING_TEXT_FADE_STEPS = 16  # quantised fade levels for cached floating text renders
+FLOATING_TEXT_CACHE_MAX = 256  # rendered damage numbers kept before the cache is flushed
 PORTALS_PER_LEVEL = 1  # single portal to next area (linear progression)
 
 # ============ D2R ACT PROGRESSION SYSTEM ============
@@ -216,13 +269,185 @@ PLAYER_LIGHT_COLOR = (240, 215, 170)
 TORCH_LIGHT_RADIUS = 220
 TORCH_LIGHT_COLOR = (230, 160, 65)
 PROJ_LIGHT_RADIUS = 80
+STATIC_LIGHT_MARGIN = TORCH_LIGHT_RADIUS // TILE + 2  # tiles around a repainted region whose lights can reach it
 MAX_PARTICLES = 350
+RANDOM_POOL_SIZE = 4096  # uniforms drawn per NumPy refill of a RandomPool
 SCREEN_SHAKE_DECAY = 14.0
 MINIMAP_MODES = ["small", "large", "hidden"]
 MINIMAP_SCALE_MIN = 0.65
 MINIMAP_SCALE_MAX = 1.85
 MINIMAP_SCALE_STEP = 0.15
 
+# Sine lookup table for cosmetic animation (glows, walk bob) - avoids libm calls per frame
+SIN_LUT_SIZE = 1024
+SIN_LUT_SCALE = SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(i * 2 * math.pi / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE)]
+
+
+def fast_sin(a: float) -> float:
+    """Approximate sin(a) from the lookup table (cosmetic use only)."""
+    return _SIN_LUT[int(a * SIN_LUT_SCALE) & (SIN_LUT_SIZE - 1)]
+
+
+def _within(ax: float, ay: float, bx: float, by: float, r: float) -> bool:
+    """True if (ax, ay) is closer than r to (bx, by) - squared distance, no sqrt or Vec."""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy < r * r
+
+
+def _grid_query(grid: dict, x: float, y: float, radius: float):
+    """Yield entries of a spatial hash (cells of 1 << ENEMY_GRID_SHIFT px) overlapping +/- radius around (x, y)."""
+    cx0 = int(x - radius) >> ENEMY_GRID_SHIFT
+    cx1 = int(x + radius) >> ENEMY_GRID_SHIFT
+    cy0 = int(y - radius) >> ENEMY_GRID_SHIFT
+    cy1 = int(y + radius) >> ENEMY_GRID_SHIFT
+    for cx in range(cx0, cx1 + 1):
+        for cy in range(cy0, cy1 + 1):
+            bucket = grid.get((cx, cy))
+            if bucket:
+                yield from bucket
+
+
+def _on_screen(objs, cam_x: float, cam_y: float, margin: int) -> List[int]:
+    """Indices of objects whose .pos is within margin px of the screen, culled in one NumPy pass."""
+    if not objs:
+        return []
+    xy = np.array([(o.pos.x, o.pos.y) for o in objs])
+    sx = xy[:, 0] - cam_x
+    sy = xy[:, 1] - cam_y
+    return np.flatnonzero((sx > -margin) & (sx < WIDTH + margin)
+                          & (sy > -margin) & (sy < HEIGHT + margin)).tolist()
+
+
+def _bucket_by_tile(items) -> dict:
+    """Bucket (tx, ty, ...) tuples into DECOR_GRID_SHIFT cells for view-range lookups."""
+    grid = {}
+    for item in items:
+        grid.setdefault((item[0] >> DECOR_GRID_SHIFT, item[1] >> DECOR_GRID_SHIFT), []).append(item)
+    return grid
+
+
+def _build_move_lut() -> List[Tuple[float, float]]:
+    """Unit movement vectors indexed by the key mask W | S<<1 | A<<2 | D<<3."""
+    lut = []
+    for mask in range(16):
+        mx = ((mask >> 3) & 1) - ((mask >> 2) & 1)
+        my = ((mask >> 1) & 1) - (mask & 1)
+        n = math.hypot(mx, my) or 1.0
+        lut.append((mx / n, my / n))
+    return lut
+
+
+_MOVE_LUT = _build_move_lut()
+
+# Unit vectors for the 8-way wall push-out probes (every 45 degrees)
+_PUSH_DIRS = tuple((math.cos(i * math.pi / 4), math.sin(i * math.pi / 4)) for i in range(8))
+
+
+def _seek_step_numpy(px, py, ex, ey, vx, vy, spd, jx, jy, blend):
+    """Blend enemy velocities toward the player in place (vectorized NumPy path)."""
+    dx = px - ex
+    dy = py - ey
+    dist = np.hypot(dx, dy)
+    dist[dist == 0] = 0.0001
+    ax = dx / dist + jx
+    ay = dy / dist + jy
+    scale = spd / np.maximum(np.hypot(ax, ay), 1e-8)
+    vx += (ax * scale - vx) * blend
+    vy += (ay * scale - vy) * blend
+
+
+def _seek_step_loop(px, py, ex, ey, vx, vy, spd, jx, jy, blend):
+    """Scalar-loop form of _seek_step_numpy, written for numba to compile."""
+    for i in range(ex.shape[0]):
+        dx = px - ex[i]
+        dy = py - ey[i]
+        dist = math.sqrt(dx * dx + dy * dy)
+        if dist == 0.0:
+            dist = 0.0001
+        ax = dx / dist + jx[i]
+        ay = dy / dist + jy[i]
+        scale = spd[i] / max(math.sqrt(ax * ax + ay * ay), 1e-8)
+        vx[i] += (ax * scale - vx[i]) * blend
+        vy[i] += (ay * scale - vy[i]) * blend
+
+
+_seek_step = njit(cache=True, fastmath=True)(_seek_step_loop) if njit else _seek_step_numpy
+
+
+def _hit_pairs_numpy(px, py, pr, ex, ey, er):
+    """(projectile, enemy) index arrays of every overlapping pair, ordered by projectile."""
+    dx = px[:, None] - ex[None, :]
+    dy = py[:, None] - ey[None, :]
+    reach = pr[:, None] + er[None, :]
+    return np.nonzero(dx * dx + dy * dy < reach * reach)
+
+
+def _hit_pairs_loop(px, py, pr, ex, ey, er):
+    """Scalar-loop form of _hit_pairs_numpy, written for numba to compile."""
+    n, m = px.shape[0], ex.shape[0]
+    pis = np.empty(n * m, np.int64)
+    eis = np.empty(n * m, np.int64)
+    k = 0
+    for i in range(n):
+        for j in range(m):
+            dx = px[i] - ex[j]
+            dy = py[i] - ey[j]
+            reach = pr[i] + er[j]
+            if dx * dx + dy * dy < reach * reach:
+                pis[k] = i
+                eis[k] = j
+                k += 1
+    return pis[:k], eis[:k]
+
+
+_hit_pairs = njit(cache=True, fastmath=True)(_hit_pairs_loop) if njit else _hit_pairs_numpy
+
+
+def _step_particles_numpy(dt, n, x, y, vx, vy, r, g, b, life, max_life, size, gravity):
+    """Advance the first n particles and compact out the dead ones in place; returns the new count."""
+    lv = life[:n]
+    lv -= dt
+    vy_n = vy[:n]
+    vy_n += gravity[:n] * dt
+    x[:n] += vx[:n] * dt
+    y[:n] += vy_n * dt
+    alive = lv > 0
+    if alive.all():
+        return n
+    keep = np.flatnonzero(alive)
+    k = len(keep)
+    for arr in (x, y, vx, vy, r, g, b, life, max_life, size, gravity):
+        arr[:k] = arr[keep]
+    return k
+
+
+def _step_particles_loop(dt, n, x, y, vx, vy, r, g, b, life, max_life, size, gravity):
+    """Scalar-loop form of _step_particles_numpy (one fused pass), written for numba to compile."""
+    w = 0
+    for i in range(n):
+        li = life[i] - dt
+        if li <= 0:
+            continue
+        nvy = vy[i] + gravity[i] * dt
+        x[w] = x[i] + vx[i] * dt
+        y[w] = y[i] + nvy * dt
+        vx[w] = vx[i]
+        vy[w] = nvy
+        r[w] = r[i]
+        g[w] = g[i]
+        b[w] = b[i]
+        life[w] = li
+        max_life[w] = max_life[i]
+        size[w] = size[i]
+        gravity[w] = gravity[i]
+        w += 1
+    return w
+
+
+_step_particles = njit(cache=True, fastmath=True)(_step_particles_loop) if njit else _step_particles_numpy
+
 # ============ COLOR PALETTE (D2R dark fantasy) ============
 C_BLOOD = (140, 18, 18)
 C_BLOOD_DARK = (85, 8, 8)
@@ -239,6 +464,26 @@ C_LAVA = (220, 65, 15)
 C_GOTHIC_FRAME = (80, 65, 42)
 C_GOTHIC_FRAME_LIGHT = (125, 105, 70)
 C_GOTHIC_BG = (10, 8, 12)
+C_TRAIL_HOSTILE = (200, 80, 70)
+C_TRAIL_BASIC = (100, 160, 255)
+C_TRAIL_POWER = (160, 120, 255)
+C_TEXT_DODGE = (140, 255, 140)
+C_TEXT_HURT = (255, 60, 60)
+C_TEXT_HIT = (220, 220, 220)
+TEXT_DODGE = "DODGE!"
+
+# Damage numbers are rendered constantly; reuse their strings instead of formatting each hit
+DMG_STR_CACHE = 1000
+_DMG_STR = [str(i) for i in range(DMG_STR_CACHE)]
+_NEG_STR = ["-" + t for t in _DMG_STR]
+
+
+def _dmg_str(n: int) -> str:
+    return _DMG_STR[n] if 0 <= n < DMG_STR_CACHE else str(n)
+
+
+def _neg_dmg_str(n: int) -> str:
+    return _NEG_STR[n] if 0 <= n < DMG_STR_CACHE else f"-{n}"
 
 BIOME_PORTAL_COLORS = {
     "crypt": (180, 160, 120), "cave": (160, 130, 80), "firepit": (255, 120, 40),
@@ -266,6 +511,36 @@ RARITY_DROP_WEIGHTS = {
     RARITY_NORMAL: 55, RARITY_MAGIC: 28, RARITY_RARE: 12,
     RARITY_UNIQUE: 2, RARITY_SET: 3,
 }
+VENDOR_RARITY_MULT = {  # vendor buy price multiplier
+    RARITY_NORMAL: 1, RARITY_MAGIC: 3, RARITY_RARE: 8,
+    RARITY_UNIQUE: 15, RARITY_SET: 12,
+}
+SELL_RARITY_MULT = {  # backpack right-click sell price multiplier
+    RARITY_NORMAL: 1, RARITY_MAGIC: 2, RARITY_RARE: 4,
+    RARITY_UNIQUE: 8, RARITY_SET: 6,
+}
+MOD_LABELS: dict = {}  # mod key -> display label, filled the first time each key is shown
+
+
+def _mod_label(key: str) -> str:
+    """Display label for an item mod key, e.g. "fire_dmg" -> "Fire Dmg"."""
+    label = MOD_LABELS.get(key)
+    if label is None:
+        label = MOD_LABELS[key] = key.replace("_", " ").title()
+    return label
+
+
+ITEM_EDGE_COLORS = {c: (min(255, c[0] + 50), min(255, c[1] + 50), min(255, c[2] + 50))
+                    for c in RARITY_COLORS.values()}  # item colour -> brighter icon outline
+
+
+def _item_edge_color(c: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Outline colour for an item icon; jewel colours are added the first time they are seen."""
+    edge = ITEM_EDGE_COLORS.get(c)
+    if edge is None:
+        edge = ITEM_EDGE_COLORS[c] = (min(255, c[0] + 50), min(255, c[1] + 50), min(255, c[2] + 50))
+    return edge
+
 
 # ============ D2 CHARACTER STATS ============
 STAT_POINTS_PER_LEVEL = 5
@@ -688,20 +963,6 @@ VENDOR_RESTOCK_ON_LEVEL = True
 Vec = pygame.math.Vector2
 
 # ======================= DATA CLASSES =======================
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    r: int
-    g: int
-    b: int
-    life: float
-    max_life: float
-    size: float
-    gravity: float = 0.0
-
 @dataclass
 class FloatingText:
     x: float
@@ -745,20 +1006,31 @@ class Weapon:
     ilvl: int = 1  # item level
     sockets: int = 0
     jewels: list = field(default_factory=list)  # socketed Jewel items
+    # Display strings built on first use; everything they read is fixed once the weapon is rolled
+    _rarity_label: str = field(default="", init=False, repr=False, compare=False)
+    _tooltip_head: tuple = field(default=(), init=False, repr=False, compare=False)
     def roll_damage(self) -> int:
         base = random.randint(self.dmg_min, self.dmg_max)
         base += self.mods.get("fire_dmg", 0) + self.mods.get("ice_dmg", 0) + self.mods.get("lightning_dmg", 0)
         return base
     def get_color(self) -> Tuple[int, int, int]:
         return RARITY_COLORS.get(self.rarity, (180, 180, 180))
+    def rarity_label(self) -> str:
+        """One-line '[Rarity] Class  Dmg  Spd' summary used by the vendor list."""
+        if not self._rarity_label:
+            self._rarity_label = (f"[{RARITY_NAMES.get(self.rarity, 'Normal')}] {self.weapon_class.title()}"
+                                  f"  Dmg: {self.dmg_min}-{self.dmg_max}  Spd: {self.attack_speed:.1f}")
+        return self._rarity_label
     def get_tooltip_lines(self) -> List[str]:
-        lines = [self.name]
-        lines.append(f"{self.base_name or self.name}  ({self.weapon_class.title()})")
-        lines.append(f"Damage: {self.dmg_min}-{self.dmg_max}")
-        lines.append(f"Speed: {self.attack_speed:.1f}")
+        if not self._tooltip_head:
+            self._tooltip_head = (self.name,
+                                  f"{self.base_name or self.name}  ({self.weapon_class.title()})",
+                                  f"Damage: {self.dmg_min}-{self.dmg_max}",
+                                  f"Speed: {self.attack_speed:.1f}")
+        lines = list(self._tooltip_head)
         for k, v in self.mods.items():
             if v and k not in ("dmg_min", "dmg_max", "attack_speed"):
-                label = k.replace("_", " ").title()
+                label = _mod_label(k)
                 if isinstance(v, float):
                     lines.append(f"  +{v:.1f} {label}")
                 else:
@@ -795,7 +1067,7 @@ class Armor:
             lines.append(f"Sockets: {filled}/{self.sockets}")
         for k, v in self.mods.items():
             if v and k != "defense":
-                label = k.replace("_", " ").title()
+                label = _mod_label(k)
                 lines.append(f"  +{v} {label}" if isinstance(v, int) else f"  +{v:.1f} {label}")
         for j in self.jewels:
             lines.append(f"  [{j.name}]")
@@ -819,7 +1091,7 @@ class Ring:
         lines.append(f"{self.base_name or self.name}  ({slot_label})")
         for k, v in self.mods.items():
             if v:
-                label = k.replace("_", " ").title()
+                label = _mod_label(k)
                 lines.append(f"  +{v} {label}" if isinstance(v, int) else f"  +{v:.1f} {label}")
         return lines
 
@@ -834,7 +1106,7 @@ class Jewel:
         lines = [self.name]
         for k, v in self.mods.items():
             if v:
-                label = k.replace("_", " ").title()
+                label = _mod_label(k)
                 lines.append(f"  +{v} {label}" if isinstance(v, int) else f"  +{v:.1f} {label}")
         return lines
 
@@ -871,6 +1143,13 @@ class Projectile:
     is_arrow: bool = False
     angle: float = 0.0
     infusion: Optional[str] = None  # "fire", "ice", "lightning"
+    trail_col: Tuple[int, int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.hostile:
+            self.trail_col = C_TRAIL_HOSTILE
+        else:
+            self.trail_col = C_TRAIL_BASIC if self.radius <= BASIC_RADIUS else C_TRAIL_POWER
 
 @dataclass
 class Entity:
@@ -1054,23 +1333,28 @@ class Enemy(Entity):
     shot_cd: float = 0.0
     hit_flash: float = 0.0
     death_timer: float = -1.0
+    kind_flags: int = KIND_NORMAL
+    frozen_time: float = 0.0  # seconds spent outside ENEMY_ACTIVE_RADIUS
     def roll_damage(self) -> int:
         base = random.randint(self.dmg_min, self.dmg_max)
         return int(base * self.mult_damage)
 
 @dataclass
 class Elite(Enemy):
+    kind_flags: int = KIND_ELITE
     aura: str = "haste"
     aura_radius: int = AURA_RADIUS
     aura_pulse: float = 0.0
 
 @dataclass
 class Boss(Enemy):
+    kind_flags: int = KIND_BOSS
     shot_cd: float = 1.0
     is_uber: bool = False
 
 @dataclass
 class TreasureGoblin(Enemy):
+    kind_flags: int = KIND_GOBLIN
     flee_timer: float = 0.0
     loot_drop_timer: float = 0.0
     portal_timer: float = GOBLIN_DESPAWN_TIME
@@ -1081,14 +1365,12 @@ class Chest:
     hp: int = CHEST_HP
     alive: bool = True
     kind: str = "wood"  # wood, gold
-    hit_flash: float = 0.0
 
 @dataclass
 class Crate:
     pos: Vec
     hp: int = CRATE_HP
     alive: bool = True
-    hit_flash: float = 0.0
 
 @dataclass
 class Vendor:
@@ -1097,6 +1379,168 @@ class Vendor:
     name: str = "Gheed"
     interact_anim: float = 0.0
 
+class Pool:
+    """Free-list of recycled instances for short-lived dataclasses (floating texts, projectiles)."""
+
+    def __init__(self, cls, max_free: int = 512):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+
+    def acquire(self, **kw):
+        if self.free:
+            obj = self.free.pop()
+            obj.__init__(**kw)
+            return obj
+        return self.cls(**kw)
+
+    def release(self, obj):
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+
+class RandomPool:
+    """Uniform [0, 1) numbers drawn from NumPy in large chunks and handed out piecemeal."""
+
+    def __init__(self, size: int = RANDOM_POOL_SIZE):
+        self.size = size
+        self.refill()
+
+    def refill(self):
+        self.buf = np.random.random(self.size)
+        self.vals = self.buf.tolist()
+        self.i = 0
+
+    def take(self, k: int):
+        """Next k uniforms as an array view."""
+        if k > self.size:
+            return np.random.random(k)
+        if self.i + k > self.size:
+            self.refill()
+        i = self.i
+        self.i = i + k
+        return self.buf[i:i + k]
+
+    def uniform(self, lo: float, hi: float) -> float:
+        if self.i >= self.size:
+            self.refill()
+        v = self.vals[self.i]
+        self.i += 1
+        return lo + (hi - lo) * v
+
+    def random(self) -> float:
+        if self.i >= self.size:
+            self.refill()
+        v = self.vals[self.i]
+        self.i += 1
+        return v
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Integer in [lo, hi], both ends inclusive like random.randint."""
+        return lo + int((hi - lo + 1) * self.random())
+
+
+class ModalRedraw:
+    """Redraw gate for the menu screens: a few frames are drawn after each change, then the screen sits idle."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.left = MODAL_SETTLE_FRAMES  # frames left to draw before the screen sits idle
+        self.full = True  # present the whole screen; cleared once a redraw sequence settles
+        self.hover_rects = []  # screen areas drawn for the hover, all a hover-only change has to present
+
+    def invalidate(self, full: bool = True):
+        """Start a redraw sequence; full=False when only the hover moved and a partial present will do."""
+        self.left = MODAL_SETTLE_FRAMES
+        if full:
+            self.full = True
+
+    def should_draw(self) -> bool:
+        """Use up one settle frame; when none are left, idle for one input poll and return False."""
+        if not self.left:
+            self.clock.tick(MODAL_FPS)
+            return False
+        self.left -= 1
+        return True
+
+    def present(self, cur_rects):
+        """Show the frame; a hover-only change updates just the old and new hover areas, erasing the old ones."""
+        if self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.hover_rects + cur_rects)
+        self.hover_rects.extend(cur_rects)
+        if not self.left:
+            self.full = False
+            self.hover_rects = cur_rects
+        self.clock.tick(MODAL_FPS)
+
+
+class ParticleSystem:
+    """Fixed-capacity particles stored as parallel NumPy arrays, stepped in bulk."""
+
+    FIELDS = ("x", "y", "vx", "vy", "r", "g", "b", "life", "max_life", "size", "gravity")
+
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        self.capacity = capacity
+        self.n = 0
+        self.rng = RandomPool()
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, np.float32))
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def emit(self, x, y, count, color, speed, life, size, gravity, spread):
+        k = min(count, self.capacity - self.n)
+        if k <= 0:
+            return
+        i, j = self.n, self.n + k
+        u = self.rng.take(7 * k).reshape(7, k)
+        ang = u[0] * spread
+        spd = speed * (0.3 + 0.7 * u[1])
+        tint = np.floor(u[2:5] * 41) - 20  # integer colour jitter in [-20, 20]
+        self.x[i:j] = x
+        self.y[i:j] = y
+        self.vx[i:j] = np.cos(ang) * spd
+        self.vy[i:j] = np.sin(ang) * spd
+        self.r[i:j] = np.minimum(255, color[0] + tint[0])
+        self.g[i:j] = np.clip(color[1] + tint[1], 0, 255)
+        self.b[i:j] = np.clip(color[2] + tint[2], 0, 255)
+        self.life[i:j] = life * (0.5 + 0.5 * u[5])
+        self.max_life[i:j] = life
+        self.size[i:j] = size * (0.5 + u[6])
+        self.gravity[i:j] = gravity
+        self.n = j
+
+    def emit_one(self, x, y, color, speed, life, size, gravity):
+        """Single full-circle particle written straight into the arrays (projectile trails)."""
+        i = self.n
+        if i >= self.capacity:
+            return
+        u = self.rng.uniform
+        ang = u(0.0, math.tau)
+        spd = u(speed * 0.3, speed)
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(ang) * spd
+        self.vy[i] = math.sin(ang) * spd
+        self.r[i] = min(255, color[0] + math.floor(u(-20, 21)))
+        self.g[i] = min(255, max(0, color[1] + math.floor(u(-20, 21))))
+        self.b[i] = min(255, max(0, color[2] + math.floor(u(-20, 21))))
+        self.life[i] = life * u(0.5, 1.0)
+        self.max_life[i] = life
+        self.size[i] = size * u(0.5, 1.5)
+        self.gravity[i] = gravity
+        self.n = i + 1
+
+    def update(self, dt: float):
+        if self.n:
+            self.n = _step_particles(dt, self.n, *(getattr(self, name) for name in self.FIELDS))
+
 # ======================= DUNGEON =======================
 class Dungeon:
     def __init__(self, level: int = 1, biome: str = "crypt"):
@@ -1105,7 +1549,9 @@ class Dungeon:
         self.tiles = [[WALL for _ in range(MAP_H)] for _ in range(MAP_W)]
         self.terrain = [[TERRAIN_GRASS for _ in range(MAP_H)] for _ in range(MAP_W)]
         self.wall_type = [[WALL_DEFAULT for _ in range(MAP_H)] for _ in range(MAP_W)]
-        self.seen = [[True for _ in range(MAP_H)] for _ in range(MAP_W)]
+        self.seen = np.ones((MAP_W, MAP_H), dtype=bool)  # index as seen[tx, ty]
+        self.seen_chunks = set()  # pre-rendered chunks made stale by newly seen tiles
+        self.seen_version = 0  # bumped whenever tiles are revealed, so cached map views can tell they are stale
         self.rooms: List[pygame.Rect] = []
         self.scenery: List[Tuple[int, int, str]] = []
         self.torches: List[Tuple[int, int]] = []
@@ -1114,7 +1560,7 @@ class Dungeon:
         self.chest_positions: List[Tuple[int, int]] = []
         self.crate_positions: List[Tuple[int, int]] = []  # breakable crates
         self.hazard_pools: List[Tuple[int, int]] = []  # lava, poison, ice based on biome
-        self.tile_variants = [[random.randint(0, 7) for _ in range(MAP_H)] for _ in range(MAP_W)]
+        self.tile_variants = np.random.randint(0, TILE_VARIANTS, (MAP_W, MAP_H)).astype(np.uint8)
         self.generate()
 
     def _noise2d(self, x, y, seed=0):
@@ -1477,6 +1923,25 @@ class Dungeon:
             if best_room != self.rooms[-1]:
                 self.carve_tunnel(prev_cx, prev_cy, px, py)
 
+        # Freeze collision grid into a contiguous int8 array (index as tiles[tx, ty])
+        self.tiles = np.asarray(self.tiles, dtype=np.int8)
+        # Wall types and terrains are only read as whole-map masks from here on
+        self.wall_type = np.array(self.wall_type)
+        self.terrain = np.array(self.terrain)
+        # Flat byte copy for scalar probes: solid[tx * MAP_H + ty] (bytes indexing is far cheaper than NumPy's)
+        self.solid = self.tiles.tobytes()
+        self.tile_class = self._classify_tiles()
+        # Atlas indices regrouped so each render chunk is one contiguous TILE_CHUNK x TILE_CHUNK block
+        variants = self.tile_variants.astype(np.int32)
+        self.chunk_atlas = self._chunk_blocks(self.tile_class.astype(np.int32) * TILE_VARIANTS + variants)
+        unseen_cls = np.where(self.tiles == WALL, TILE_CLASS_UNSEEN_WALL, TILE_CLASS_UNSEEN_FLOOR)
+        self.chunk_atlas_unseen = self._chunk_blocks(unseen_cls * TILE_VARIANTS + variants)
+        # Static decorations never move after generation; bucket them for per-frame view queries
+        self.scenery_grid = _bucket_by_tile(self.scenery)
+        self.torch_grid = _bucket_by_tile(self.torches)
+        self.hazard_grid = _bucket_by_tile(self.hazard_pools)
+        self.portal_grid = _bucket_by_tile(self.portal_positions)
+
     def _place_torches(self, room: pygame.Rect, rng):
         walls = []
         for x in range(room.left, room.right):
@@ -1501,6 +1966,27 @@ class Dungeon:
             if not too_close:
                 self.torches.append((tx, ty))
 
+    def _classify_tiles(self) -> np.ndarray:
+        """Texture class (TILE_CLASS_*) of every seen tile, as a uint8 array indexed [tx, ty]."""
+        wall_types = self.wall_type
+        terrains = self.terrain
+        wall_cls = np.full((MAP_W, MAP_H), TILE_CLASS_WALL, dtype=np.uint8)
+        for i, wtype in enumerate(TILE_CLASS_WALLS):
+            wall_cls[wall_types == wtype] = 2 + i
+        floor_cls = np.full((MAP_W, MAP_H), TILE_CLASS_FLOOR, dtype=np.uint8)
+        for i, ttype in enumerate(TILE_CLASS_TERRAINS):
+            floor_cls[terrains == ttype] = 6 + i
+        return np.where(self.tiles == WALL, wall_cls, floor_cls)
+
+    def _chunk_blocks(self, grid: np.ndarray) -> np.ndarray:
+        """Copy a [tx, ty] map array into [cx, cy, x, y] order, padding the last row/column of chunks."""
+        ncx = -(-MAP_W // TILE_CHUNK)
+        ncy = -(-MAP_H // TILE_CHUNK)
+        padded = np.zeros((ncx * TILE_CHUNK, ncy * TILE_CHUNK), dtype=grid.dtype)
+        padded[:MAP_W, :MAP_H] = grid
+        blocks = padded.reshape(ncx, TILE_CHUNK, ncy, TILE_CHUNK).transpose(0, 2, 1, 3)
+        return np.ascontiguousarray(blocks)
+
     def carve_room(self, rect: pygame.Rect):
         for x in range(rect.left, rect.right):
             for y in range(rect.top, rect.bottom):
@@ -1534,24 +2020,42 @@ class Dungeon:
         return rect.left + rect.w // 2, rect.top + rect.h // 2
 
     def is_solid_at_px(self, pos: Vec) -> bool:
-        tx = int(pos.x // TILE)
-        ty = int(pos.y // TILE)
+        return self.is_solid_xy(pos.x, pos.y)
+
+    def is_solid_xy(self, x: float, y: float) -> bool:
+        tx = int(x // TILE)
+        ty = int(y // TILE)
         if tx < 0 or ty < 0 or tx >= MAP_W or ty >= MAP_H:
             return True
-        return self.tiles[tx][ty] == WALL
+        return self.solid[tx * MAP_H + ty] == WALL
+
+    def is_near_wall(self, x: float, y: float, reach: float) -> bool:
+        """True if any wall tile (or the map edge) lies within the square of +/- reach around (x, y)."""
+        tx0 = int((x - reach) // TILE)
+        tx1 = int((x + reach) // TILE)
+        ty0 = int((y - reach) // TILE)
+        ty1 = int((y + reach) // TILE)
+        if tx0 < 0 or ty0 < 0 or tx1 >= MAP_W or ty1 >= MAP_H:
+            return True
+        return bool((self.tiles[tx0:tx1 + 1, ty0:ty1 + 1] == WALL).any())
 
     def mark_seen_radius(self, pos: Vec, radius_px: int = 320):
-        r2 = radius_px * radius_px
         min_tx = max(0, int((pos.x - radius_px) // TILE))
         max_tx = min(MAP_W - 1, int((pos.x + radius_px) // TILE))
         min_ty = max(0, int((pos.y - radius_px) // TILE))
         max_ty = min(MAP_H - 1, int((pos.y + radius_px) // TILE))
-        for tx in range(min_tx, max_tx + 1):
-            for ty in range(min_ty, max_ty + 1):
-                cx = tx * TILE + TILE / 2
-                cy = ty * TILE + TILE / 2
-                if (cx - pos.x) ** 2 + (cy - pos.y) ** 2 <= r2:
-                    self.seen[tx][ty] = True
+        # Tile-centre distance test over the whole window at once
+        cx = np.arange(min_tx, max_tx + 1) * TILE + TILE / 2 - pos.x
+        cy = np.arange(min_ty, max_ty + 1) * TILE + TILE / 2 - pos.y
+        in_radius = cx[:, None] ** 2 + cy[None, :] ** 2 <= radius_px * radius_px
+        window = self.seen[min_tx:max_tx + 1, min_ty:max_ty + 1]
+        fresh = in_radius & ~window
+        if fresh.any():
+            window |= fresh
+            self.seen_version += 1
+            ftx, fty = np.nonzero(fresh)
+            self.seen_chunks.update(zip(((ftx + min_tx) // TILE_CHUNK).tolist(),
+                                        ((fty + min_ty) // TILE_CHUNK).tolist()))
 
 # ======================= WEAPON GENERATOR =======================
 def _pick_rarity(depth: int = 1, tier_bonus: int = 0) -> str:
@@ -1698,6 +2202,28 @@ def generate_weapon(depth: int = 1, force_rarity: Optional[str] = None, tier_bon
     )
 
 
+# ======================= SAVE FILES =======================
+def _read_json(path: str):
+    """Parse a JSON save file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data) -> None:
+    """Write data as indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        # NON_STR_KEYS matches json.dump turning int keys into strings
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=opts))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
 # ======================= GAME =======================
 class Game:
     def __init__(self):
@@ -1737,15 +2263,59 @@ class Game:
         self.enemies: List[Enemy] = []
         self.projectiles: List[Projectile] = []
         self.loots: List[Loot] = []
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem()
+        self._rng = RandomPool()
         self.floating_texts: List[FloatingText] = []
         self.corpses: List[Corpse] = []
+        self._text_pool = Pool(FloatingText)
+        self._projectile_pool = Pool(Projectile)
         self.spawn_timer = SPAWN_INTERVAL
         self.wave = 1
         self.running = True
         self.paused = False
         self.cam_x = 0
         self.cam_y = 0
+        self._last_seen_tile = (-1, -1)
+        self._enemy_grid: dict = {}  # (cell_x, cell_y) -> [Enemy], rebuilt each tick
+        self._corpse_grid: dict = {}  # (cell_x, cell_y) -> [(list index, Corpse)], same cell size as the enemy grid
+        self._corpse_version = 0  # bumped whenever a corpse is added, expires or the list is cleared
+        self._corpse_grid_key = None  # _corpse_version the grid was built from
+        self._breakable_grid: dict = {}  # (cell_x, cell_y) -> [(is_chest, index, obj)], built per level
+        self._ai_accum = 0.0  # time banked toward the next enemy AI tick
+        self._tile_chunks = OrderedDict()  # (chunk_x, chunk_y) -> (surface, water tiles), LRU order
+        self._tile_chunk_owner = None
+        self._tile_backbuffer = None  # last frame's tile layer, scrolled and patched instead of redrawn
+        self._tile_backbuffer_origin = None  # world pixel shown at the backbuffer's top-left
+        self._static_lights = None  # ambient + torch/portal/hazard lights, scrolled like the tile backbuffer
+        self._static_lights_origin = None
+        self._light_batch = None  # (light_map, dynamic light blits) the light map was last composed from
+        self._view_bounds = (0, 0, 0, 0)  # (min_tx, max_tx, min_ty, max_ty) on screen, set by draw()
+        self._hazard_frames: dict = {}  # hazard kind -> [Surface] indexed by pulse phase
+        self._shimmer_surfs: dict = {}  # (color, alpha) -> 1px water shimmer line
+        self._scratch_surfs: dict = {}  # (name, size) -> reusable SRCALPHA surface for per-frame overlays
+        self._fill_overlays: dict = {}  # (size, rgba) -> flat translucent panel for menus and tooltips
+        self._ui_panel = None  # static bottom panel background, built on first draw
+        self._minimap_layer = None  # minimap background, frame and explored tiles
+        self._minimap_key = None  # (size, biome, dungeon, seen_version) the layer was built for
+        self._globe_fills: dict = {}  # (r, colors) -> (fill_height, Surface) for the HP/mana globes
+        self._portal_label = (None, None, None)  # (text, color, rendered Surface)
+        self._blobs: dict = {}  # (color, radius) -> filled circle Surface for corpses, bubbles and particles
+        self._world_labels: dict = {}  # (text, color) -> rendered name tag drawn in the world view
+        self._ui_labels: dict = {}  # (text, color, big) -> rendered HUD or menu string
+        self._floating_text_surfs: dict = {}  # (text, color, big) -> rendered floating combat text
+        self._enemy_sprites: dict = {}  # (kind, radius, flash) -> pre-rendered shadow + body Surface
+        self._frame_mouse = (0, 0)  # mouse position sampled once at the start of draw()
+        self._reticle = None  # pre-rendered crosshair, centred at (16, 16)
+        self._help_panel = None  # controls text for the F1 overlay, built on first open
+        self._inv_cells: dict = {}  # (size, bg, border) -> rounded inventory grid cell
+        self._item_icons: dict = {}  # (size, color, icon, text centre) -> item square with its icon letter
+        self._tooltips: dict = {}  # (tooltip lines, item color) -> composed tooltip panel
+        self._skill_tiles: dict = {}  # (skill id, level, max, locked) -> composed skill-tree box
+        self._arm_cache = (None, None)  # ((mouse - player) delta, arm/bow offsets from the player)
+        self._player_body_frames: dict = {}  # walk offset -> pre-rendered feet, armour and helmet
+        self._wraith_frames: dict = {}  # (radius, flash) -> [game_time, Surface] shared by every wraith this frame
+        self._waves_time = None
+        self._waves: dict = {}  # frame-constant sin/cos values shared by animated draws
         self.shake_x = 0.0
         self.shake_y = 0.0
         self.shake_intensity = 0.0
@@ -1758,6 +2328,9 @@ class Game:
         self.portal_angle = 0.0
         self.chests: List[Chest] = []
         self.crates: List[Crate] = []
+        # Hit-flash timers, parallel to self.chests / self.crates (decayed in one vector op)
+        self._chest_hit_flash = np.zeros(0, np.float32)
+        self._crate_hit_flash = np.zeros(0, np.float32)
         self.vendor: Optional[Vendor] = None
         self.show_vendor_hint = False
         self.minimap_mode_idx = 0  # 0=small, 1=large, 2=hidden
@@ -1788,10 +2361,13 @@ class Game:
         self.dungeon.mark_seen_radius(self.player.pos)
         self._build_texture_cache(self.current_biome)
         self._build_light_surfaces()
-        self.light_map = pygame.Surface((WIDTH, HEIGHT))
+        self.light_map = pygame.Surface((WIDTH, HEIGHT)).convert()
 
     # ---- Texture generation ----
     def _build_texture_cache(self, biome: str = "crypt"):
+        self._tile_chunks.clear()
+        self._tile_backbuffer_origin = None
+        self._static_lights_origin = None
         bc = BIOME_COLORS.get(biome, BIOME_COLORS["crypt"])
         wt = bc["wall_tint"]
         ft = bc["floor_tint"]
@@ -2046,11 +2622,37 @@ class Game:
         pygame.draw.ellipse(self.mushroom_surf, (60, 120, 50), (4, 4, TILE - 8, TILE // 2))
         pygame.draw.ellipse(self.mushroom_surf, (80, 160, 60), (8, 8, TILE - 16, TILE // 2 - 8))
 
+        # white overlay for chests and crates being hit
+        self.hit_flash_surf = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
+        self.hit_flash_surf.fill((255, 255, 255, 110))
+
         # torch texture
         self.torch_surf = pygame.Surface((17, 22), pygame.SRCALPHA)
         pygame.draw.rect(self.torch_surf, (90, 70, 40), (6, 8, 5, 14))
         pygame.draw.rect(self.torch_surf, (110, 85, 50), (4, 8, 9, 3))
 
+        # Store every texture in the display's pixel format so blits never convert on the fly
+        self.tree_tiles = [t.convert() for t in self.tree_tiles]
+        self.rock_tiles = [t.convert() for t in self.rock_tiles]
+        self.water_tiles = [t.convert() for t in self.water_tiles]
+        self.wall_tiles = [t.convert() for t in self.wall_tiles]
+        self._terrain_tiles = {k: [t.convert() for t in v] for k, v in self._terrain_tiles.items()}
+        self.floor_tiles = self._terrain_tiles.get(TERRAIN_GRASS, self._terrain_tiles[TERRAIN_DIRT])
+        self.unseen_wall = self.unseen_wall.convert()
+        self.unseen_floor = self.unseen_floor.convert()
+        for name in ("pillar_surf", "crate_surf", "chest_surf", "gold_chest_surf", "stalagmite_surf",
+                     "rock_surf", "ice_crystal_surf", "mushroom_surf", "torch_surf", "hit_flash_surf"):
+            setattr(self, name, getattr(self, name).convert_alpha())
+
+        # Flat atlas indexed by tile_class * TILE_VARIANTS + variant for chunk rendering
+        atlas = [self.unseen_wall] * TILE_VARIANTS + [self.unseen_floor] * TILE_VARIANTS
+        for tiles in (self.tree_tiles, self.rock_tiles, self.water_tiles, self.wall_tiles):
+            atlas += tiles
+        for ttype in TILE_CLASS_TERRAINS:
+            atlas += self._terrain_tiles.get(ttype, self.floor_tiles)
+        atlas += self.floor_tiles
+        self._tile_atlas = atlas
+
     # ---- Lighting surfaces ----
     def _build_light_surfaces(self):
         self.light_surfs = {}
@@ -2087,7 +2689,7 @@ class Game:
             g = min(255, int(color[1] * brightness))
             b = min(255, int(color[2] * brightness))
             pygame.draw.circle(surf, (r, g, b), (radius, radius), i)
-        return surf
+        return surf.convert()
 
     # ---- Sound generation ----
     def _build_sounds(self):
@@ -2330,7 +2932,7 @@ class Game:
 
     def _creature_sound_name(self, e) -> str:
         """Get sound suffix for an enemy kind."""
-        if isinstance(e, Boss):
+        if e.kind_flags & KIND_BOSS:
             return "boss"
         return self._CREATURE_SOUND_MAP.get(e.kind, "skeleton")
 
@@ -2352,8 +2954,7 @@ class Game:
         # Load save info for display
         save_info = ""
         try:
-            with open(self._get_save_path(), "r") as f:
-                data = json.load(f)
+            data = _read_json(self._get_save_path())
             pd = data["player"]
             gd = data["game"]
             act_num = gd.get('current_act', 1)
@@ -2503,7 +3104,7 @@ class Game:
                 is_sel = (i == idx)
                 # Selection box
                 if is_sel:
-                    glow = int(20 + 10 * math.sin(t * 4))
+                    glow = int(20 + 10 * fast_sin(t * 4))
                     pygame.draw.rect(screen, (glow + 30, glow + 20, glow), (bx - 90, by - 15, 180, 100), border_radius=8)
                     pygame.draw.rect(screen, C_GOLD, (bx - 90, by - 15, 180, 100), 2, border_radius=8)
                 col = C_GOLD if is_sel else (140, 135, 120)
@@ -2532,20 +3133,7 @@ class Game:
 
     # ---- Particle helpers ----
     def emit_particles(self, x, y, count, color, speed=80, life=0.6, size=2.5, gravity=120, spread=math.tau):
-        for _ in range(min(count, MAX_PARTICLES - len(self.particles))):
-            ang = random.uniform(0, spread)
-            spd = random.uniform(speed * 0.3, speed)
-            self.particles.append(Particle(
-                x=x, y=y,
-                vx=math.cos(ang) * spd, vy=math.sin(ang) * spd,
-                r=min(255, color[0] + random.randint(-20, 20)),
-                g=min(255, max(0, color[1] + random.randint(-20, 20))),
-                b=min(255, max(0, color[2] + random.randint(-20, 20))),
-                life=life * random.uniform(0.5, 1.0),
-                max_life=life,
-                size=size * random.uniform(0.5, 1.5),
-                gravity=gravity
-            ))
+        self.particles.emit(x, y, count, color, speed, life, size, gravity, spread)
 
     def emit_blood(self, x, y, count=5):
         self.emit_particles(x, y, count, C_BLOOD, speed=70, life=0.5, size=2.0, gravity=180)
@@ -2567,7 +3155,7 @@ class Game:
         self.emit_particles(x, y, count, C_FIRE_BRIGHT, speed=85, life=0.25, size=1.3, gravity=50)
 
     def add_floating_text(self, x, y, text, color, scale=1.0):
-        self.floating_texts.append(FloatingText(
+        self.floating_texts.append(self._text_pool.acquire(
             x=x, y=y, text=text,
             r=color[0], g=color[1], b=color[2],
             scale=scale
@@ -2591,7 +3179,7 @@ class Game:
             else:
                 tx = random.randint(1, MAP_W - 2)
                 ty = random.randint(1, MAP_H - 2)
-            if self.dungeon.tiles[tx][ty] == FLOOR:
+            if self.dungeon.tiles[tx, ty] == FLOOR:
                 pos = Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
                 if (pos - self.player.pos).length() > 200:
                     return pos
@@ -2638,7 +3226,7 @@ class Game:
         for _ in range(max_tries):
             tx = random.randint(room.left + 1, room.right - 2)
             ty = random.randint(room.top + 1, room.bottom - 2)
-            if self.dungeon.tiles[tx][ty] == FLOOR:
+            if self.dungeon.tiles[tx, ty] == FLOOR:
                 return Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
         return None
 
@@ -2760,17 +3348,22 @@ class Game:
     def spawn_pickup_near_player(self):
         base_tx = int(self.player.pos.x // TILE)
         base_ty = int(self.player.pos.y // TILE)
-        for _ in range(50):
-            tx = random.randint(max(1, base_tx - 10), min(MAP_W - 2, base_tx + 10))
-            ty = random.randint(max(1, base_ty - 8), min(MAP_H - 2, base_ty + 8))
-            if self.dungeon.tiles[tx][ty] == FLOOR:
-                pos = Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
-                if (pos - self.player.pos).length() > 140:
-                    if random.random() < 0.5:
-                        self.loots.append(Loot(pos=pos, dmg_boost=True))
-                    else:
-                        self.loots.append(Loot(pos=pos, shield_boost=True))
-                    return
+        # Pick directly from floor tiles in the window that are far enough away (no reject loop)
+        x0, x1 = max(1, base_tx - 10), min(MAP_W - 2, base_tx + 10)
+        y0, y1 = max(1, base_ty - 8), min(MAP_H - 2, base_ty + 8)
+        txs, tys = np.nonzero(self.dungeon.tiles[x0:x1 + 1, y0:y1 + 1] == FLOOR)
+        dx = (txs + x0) * TILE + TILE / 2 - self.player.pos.x
+        dy = (tys + y0) * TILE + TILE / 2 - self.player.pos.y
+        cand = np.flatnonzero(dx * dx + dy * dy > 140 * 140)
+        if not len(cand):
+            return
+        i = cand[random.randrange(len(cand))]
+        tx, ty = int(txs[i]) + x0, int(tys[i]) + y0
+        pos = Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
+        if random.random() < 0.5:
+            self.loots.append(Loot(pos=pos, dmg_boost=True))
+        else:
+            self.loots.append(Loot(pos=pos, shield_boost=True))
 
     # ---- Vendor NPC ----
     def _spawn_vendor(self):
@@ -2817,30 +3410,55 @@ class Game:
             base = sum(v for v in item.mods.values() if isinstance(v, (int, float))) * 3
         else:
             base = 5
-        rarity_mult = {RARITY_NORMAL: 1, RARITY_MAGIC: 3, RARITY_RARE: 8,
-                       RARITY_UNIQUE: 15, RARITY_SET: 12}
         rarity = getattr(item, 'rarity', RARITY_NORMAL)
-        return max(5, int(base * rarity_mult.get(rarity, 1)))
+        return max(5, int(base * VENDOR_RARITY_MULT.get(rarity, 1)))
 
     def _get_vendor_sell_price(self, item) -> int:
         """Price vendor pays for player's item (less than buy price)."""
         return max(1, self._get_vendor_buy_price(item) // 3)
 
     # ---- Chest system ----
+    def _tile_centers(self, positions) -> Tuple[list, list]:
+        """Convert (tx, ty) tile positions to pixel-center x and y lists in one pass."""
+        arr = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+        centers = arr * TILE + TILE / 2
+        return centers[:, 0].tolist(), centers[:, 1].tolist()
+
     def _spawn_chests(self):
         """Create chest objects from dungeon chest positions."""
-        self.chests = []
-        for tx, ty in self.dungeon.chest_positions:
-            pos = Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
-            kind = "gold" if random.random() < 0.15 else "wood"
-            self.chests.append(Chest(pos=pos, kind=kind))
+        xs, ys = self._tile_centers(self.dungeon.chest_positions)
+        is_gold = (np.random.random(len(xs)) < 0.15).tolist()
+        self.chests = [Chest(pos=Vec(x, y), kind="gold" if g else "wood")
+                       for x, y, g in zip(xs, ys, is_gold)]
+        self._chest_hit_flash = np.zeros(len(self.chests), np.float32)
+        self._build_breakable_grid()
 
     def _spawn_crates(self):
         """Create crate objects from dungeon crate positions."""
-        self.crates = []
-        for tx, ty in self.dungeon.crate_positions:
-            pos = Vec(tx * TILE + TILE / 2, ty * TILE + TILE / 2)
-            self.crates.append(Crate(pos=pos))
+        xs, ys = self._tile_centers(self.dungeon.crate_positions)
+        self.crates = [Crate(pos=Vec(x, y)) for x, y in zip(xs, ys)]
+        self._crate_hit_flash = np.zeros(len(self.crates), np.float32)
+        self._build_breakable_grid()
+
+    def _build_breakable_grid(self):
+        """Bucket chests and crates by grid cell; they never move, so this runs once per spawn."""
+        grid = {}
+        for is_chest, objs in ((True, self.chests), (False, self.crates)):
+            for i, obj in enumerate(objs):
+                key = (int(obj.pos.x) >> ENEMY_GRID_SHIFT, int(obj.pos.y) >> ENEMY_GRID_SHIFT)
+                grid.setdefault(key, []).append((is_chest, i, obj))
+        self._breakable_grid = grid
+
+    def _breakables_in_view(self, vx: float, vy: float, margin: int):
+        """Chest and crate indices (in list order) from grid cells overlapping the view at (vx, vy) plus margin."""
+        chests = []
+        crates = []
+        half = max(WIDTH, HEIGHT) // 2 + margin
+        for is_chest, i, _obj in _grid_query(self._breakable_grid, vx + WIDTH // 2, vy + HEIGHT // 2, half):
+            (chests if is_chest else crates).append(i)
+        chests.sort()
+        crates.sort()
+        return chests, crates
 
     def _on_crate_broken(self, crate: Crate):
         """Handle crate breaking - possible explosion and loot."""
@@ -2866,7 +3484,7 @@ class Game:
                     e.hit_flash = 0.15
                     e.vel += (e.pos - crate.pos).normalize() * 200
                     self.add_floating_text(e.pos.x, e.pos.y - e.radius - 5,
-                                           str(dmg), (255, 160, 40), 0.8)
+                                           _dmg_str(dmg), (255, 160, 40), 0.8)
                     if e.hp <= 0 and e.alive:
                         e.alive = False
                         self.on_enemy_dead(e)
@@ -2882,7 +3500,7 @@ class Game:
                 if pdmg > 0:
                     p.hp -= pdmg
                     p.hurt_flash = 0.35
-                    self.add_floating_text(p.pos.x, p.pos.y - 20, f"-{pdmg}", (255, 100, 40), 1.0)
+                    self.add_floating_text(p.pos.x, p.pos.y - 20, _neg_dmg_str(pdmg), (255, 100, 40), 1.0)
                     p.iframes = max(p.iframes, 0.3)
                     self.play_sound("hurt")
         else:
@@ -2919,7 +3537,7 @@ class Game:
         for _ in range(20):
             p = center + Vec(random.uniform(-spread, spread), random.uniform(-spread, spread))
             tx, ty = int(p.x // TILE), int(p.y // TILE)
-            if 0 <= tx < MAP_W and 0 <= ty < MAP_H and self.dungeon.tiles[tx][ty] == FLOOR:
+            if 0 <= tx < MAP_W and 0 <= ty < MAP_H and self.dungeon.tiles[tx, ty] == FLOOR:
                 return p
         # Fallback: search outward in a grid
         cx, cy = int(center.x // TILE), int(center.y // TILE)
@@ -2927,7 +3545,7 @@ class Game:
             for dx in range(-r, r + 1):
                 for dy in range(-r, r + 1):
                     nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < MAP_W and 0 <= ny < MAP_H and self.dungeon.tiles[nx][ny] == FLOOR:
+                    if 0 <= nx < MAP_W and 0 <= ny < MAP_H and self.dungeon.tiles[nx, ny] == FLOOR:
                         return Vec(nx * TILE + TILE / 2, ny * TILE + TILE / 2)
         return center.copy()
 
@@ -2989,14 +3607,12 @@ class Game:
                                weapon=self._gen_weapon(w_rarity)))
 
     def update_chests(self, dt: float):
-        for chest in self.chests:
-            if chest.alive:
-                chest.hit_flash = max(0.0, chest.hit_flash - dt)
+        np.subtract(self._chest_hit_flash, dt, out=self._chest_hit_flash)
+        np.maximum(self._chest_hit_flash, 0.0, out=self._chest_hit_flash)
 
     def update_crates(self, dt: float):
-        for crate in self.crates:
-            if crate.alive:
-                crate.hit_flash = max(0.0, crate.hit_flash - dt)
+        np.subtract(self._crate_hit_flash, dt, out=self._crate_hit_flash)
+        np.maximum(self._crate_hit_flash, 0.0, out=self._crate_hit_flash)
 
     def _drink_potion(self, kind: str) -> bool:
         """Consume one potion of the requested type from belt first, then stash."""
@@ -3052,18 +3668,9 @@ class Game:
     # ---- Input ----
     def handle_input(self, dt: float):
         keys = pygame.key.get_pressed()
-        move = Vec(0, 0)
-        if keys[pygame.K_w]:
-            move.y -= 1
-        if keys[pygame.K_s]:
-            move.y += 1
-        if keys[pygame.K_a]:
-            move.x -= 1
-        if keys[pygame.K_d]:
-            move.x += 1
-        if move.length_squared() > 0:
-            move = move.normalize()
-        self.player.vel = move * PLAYER_SPEED
+        mask = keys[pygame.K_w] | (keys[pygame.K_s] << 1) | (keys[pygame.K_a] << 2) | (keys[pygame.K_d] << 3)
+        mx, my = _MOVE_LUT[mask]
+        self.player.vel = Vec(mx * PLAYER_SPEED, my * PLAYER_SPEED)
 
         # Dash
         if keys[pygame.K_LSHIFT] and self.player.dash_cd <= 0 and self.player.dash_timer <= 0:
@@ -3115,14 +3722,17 @@ class Game:
         if random.random() * 100 < p.calc_crit_chance():
             dmg = int(dmg * 1.8)
             self.add_floating_text(p.pos.x, p.pos.y - 30, "CRIT!", (255, 255, 100), 0.8)
-        ang = math.atan2(direction.y, direction.x)
+        dx, dy = direction.x, direction.y
+        px, py = p.pos.x, p.pos.y
+        ang = math.atan2(dy, dx)
         arrow_speed = PROJECTILE_SPEED * (1.0 + p.dexterity * 0.01)
-        proj = Projectile(pos=p.pos + direction * 20, vel=direction * arrow_speed,
-                          dmg=dmg, ttl=0.9, radius=BASIC_RADIUS, pierce=p.calc_pierce(),
-                          is_arrow=True, angle=ang, infusion=p.infusion_type)
+        proj = self._projectile_pool.acquire(
+            pos=Vec(px + dx * 20, py + dy * 20), vel=Vec(dx * arrow_speed, dy * arrow_speed),
+            dmg=dmg, ttl=0.9, radius=BASIC_RADIUS, pierce=p.calc_pierce(),
+            is_arrow=True, angle=ang, infusion=p.infusion_type)
         self.projectiles.append(proj)
         self.play_sound("arrow")
-        self.emit_particles(p.pos.x + direction.x * 18, p.pos.y + direction.y * 18,
+        self.emit_particles(px + dx * 18, py + dy * 18,
                             3, (180, 160, 120), speed=40, life=0.25, gravity=0)
 
     def shoot_power(self, direction: Vec):
@@ -3138,14 +3748,16 @@ class Game:
         base_angle = math.atan2(direction.y, direction.x)
         arrow_count = p.calc_multishot_count()
         arrow_speed = PROJECTILE_SPEED * 0.92 * (1.0 + p.dexterity * 0.01)
+        px, py = p.pos.x, p.pos.y
+        pierce = p.calc_pierce()
         for i in range(arrow_count):
             offset = (i - arrow_count // 2) * (MULTISHOT_SPREAD / max(1, arrow_count - 1))
             a = base_angle + offset
-            arrow_dir = Vec(math.cos(a), math.sin(a))
-            proj = Projectile(pos=p.pos + arrow_dir * 22,
-                              vel=arrow_dir * arrow_speed,
-                              dmg=dmg, ttl=1.0, radius=BASIC_RADIUS, pierce=p.calc_pierce(),
-                              is_arrow=True, angle=a, infusion=p.infusion_type)
+            ca, sa = math.cos(a), math.sin(a)
+            proj = self._projectile_pool.acquire(pos=Vec(px + ca * 22, py + sa * 22),
+                                                 vel=Vec(ca * arrow_speed, sa * arrow_speed),
+                                                 dmg=dmg, ttl=1.0, radius=BASIC_RADIUS, pierce=pierce,
+                                                 is_arrow=True, angle=a, infusion=p.infusion_type)
             self.projectiles.append(proj)
         if is_crit:
             self.add_floating_text(p.pos.x, p.pos.y - 30, "CRIT!", (255, 255, 100), 0.8)
@@ -3207,18 +3819,25 @@ class Game:
             p.pos.y = test.y
         p.pos.x = max(p.radius, min(MAP_W * TILE - p.radius, p.pos.x))
         p.pos.y = max(p.radius, min(MAP_H * TILE - p.radius, p.pos.y))
-        self.dungeon.mark_seen_radius(p.pos)
+        ptx = int(p.pos.x // TILE)
+        pty = int(p.pos.y // TILE)
+        # Visibility only changes when the player crosses into a new tile
+        if (ptx, pty) != self._last_seen_tile:
+            self.dungeon.mark_seen_radius(p.pos)
+            self._last_seen_tile = (ptx, pty)
         self.cam_x = int(p.pos.x - WIDTH / 2)
         self.cam_y = int(p.pos.y - HEIGHT / 2)
         self.cam_x = max(0, min(self.cam_x, MAP_W * TILE - WIDTH))
         self.cam_y = max(0, min(self.cam_y, MAP_H * TILE - HEIGHT))
-        # Hazard pool damage
-        ptx = int(p.pos.x // TILE)
-        pty = int(p.pos.y // TILE)
-        for ppx, ppy in self.dungeon.hazard_pools:
+        # Hazard pool damage (pools within one tile, so at most the 3x3 buckets around the player)
+        hazard_grid = self.dungeon.hazard_grid
+        nearby_pools = [pool
+                        for cx in range((ptx - 1) >> DECOR_GRID_SHIFT, ((ptx + 1) >> DECOR_GRID_SHIFT) + 1)
+                        for cy in range((pty - 1) >> DECOR_GRID_SHIFT, ((pty + 1) >> DECOR_GRID_SHIFT) + 1)
+                        for pool in hazard_grid.get((cx, cy), ())]
+        for ppx, ppy in nearby_pools:
             if abs(ptx - ppx) <= 1 and abs(pty - ppy) <= 1:
-                pool_center = Vec(ppx * TILE + TILE / 2, ppy * TILE + TILE / 2)
-                if (pool_center - p.pos).length() < TILE * 1.2:
+                if _within(ppx * TILE + TILE / 2, ppy * TILE + TILE / 2, p.pos.x, p.pos.y, TILE * 1.2):
                     if p.iframes <= 0:
                         hazard = BIOME_HAZARD.get(self.current_biome, "poison")
                         dmg_rate = 3 if hazard == "lava" else 2
@@ -3232,41 +3851,179 @@ class Game:
 
         # Portal collision
         for ptx, pty, _dest in self.dungeon.portal_positions:
-            portal_pos = Vec(ptx * TILE + TILE / 2, pty * TILE + TILE / 2)
-            if (portal_pos - p.pos).length() < 24:
+            if _within(ptx * TILE + TILE / 2, pty * TILE + TILE / 2, p.pos.x, p.pos.y, 24):
                 self.next_level()
                 break
 
     def _circle_collides(self, pos: Vec, radius: int) -> bool:
-        for ang in (0, math.pi * 0.5, math.pi, math.pi * 1.5):
-            pt = Vec(pos.x + math.cos(ang) * radius, pos.y + math.sin(ang) * radius)
-            if self.dungeon.is_solid_at_px(pt):
-                return True
-        return False
+        return self._circle_collides_xy(pos.x, pos.y, radius)
+
+    def _circle_collides_xy(self, x: float, y: float, radius: int) -> bool:
+        solid_xy = self.dungeon.is_solid_xy
+        return (solid_xy(x + radius, y) or solid_xy(x, y + radius) or
+                solid_xy(x - radius, y) or solid_xy(x, y - radius))
+
+    # ---- Enemy spatial hash ----
+    def _rebuild_enemy_grid(self):
+        """Bucket living enemies by grid cell for neighbour queries."""
+        grid = {}
+        for e in self.enemies:
+            if e.alive:
+                key = (int(e.pos.x) >> ENEMY_GRID_SHIFT, int(e.pos.y) >> ENEMY_GRID_SHIFT)
+                bucket = grid.get(key)
+                if bucket is None:
+                    grid[key] = [e]
+                else:
+                    bucket.append(e)
+        self._enemy_grid = grid
+
+    def _enemies_near(self, x: float, y: float, radius: float):
+        """Yield enemies from every grid cell overlapping the square of +/- radius around (x, y)."""
+        return _grid_query(self._enemy_grid, x, y, radius)
+
+    def _steer_enemies(self, movers: List[Enemy], blend: float):
+        """Seek-the-player steering for all chasing enemies in one NumPy pass."""
+        n = len(movers)
+        if not n:
+            return
+        p = self.player
+        state = np.array([(e.pos.x, e.pos.y, e.vel.x, e.vel.y, e.speed * e.mult_speed) for e in movers])
+        ex, ey, vx, vy, spd = (np.ascontiguousarray(col) for col in state.T)
+        jitter = (self._rng.take(2 * n).reshape(2, n) - 0.5) * 0.4
+        _seek_step(float(p.pos.x), float(p.pos.y), ex, ey, vx, vy, spd, jitter[0], jitter[1], blend)
+        for e, nvx, nvy in zip(movers, vx.tolist(), vy.tolist()):
+            e.vel.x = nvx
+            e.vel.y = nvy
+
+    def _resolve_touch_damage(self, chasers: List[Enemy], dt: float):
+        """Roll contact hits for every chasing enemy at once; only actual hits run per-enemy code."""
+        p = self.player
+        n = len(chasers)
+        if not n or p.iframes > 0:
+            return
+        state = np.array([(e.pos.x, e.pos.y, e.radius) for e in chasers])
+        dx = p.pos.x - state[:, 0]
+        dy = p.pos.y - state[:, 1]
+        reach = state[:, 2] + p.radius
+        rolls = self._rng.take(2 * n).reshape(2, n)
+        hits = np.flatnonzero((dx * dx + dy * dy < reach * reach) & (rolls[0] < 0.02))
+        if not hits.size:
+            return
+        dodged = (rolls[1] * 100 < p.calc_dodge_chance()).tolist()
+        for i in hits.tolist():
+            e = chasers[i]
+            if dodged[i]:
+                self.add_floating_text(p.pos.x, p.pos.y - 20, TEXT_DODGE, C_TEXT_DODGE, 0.8)
+            else:
+                dmg = e.roll_damage()
+                # Apply armor damage reduction
+                dmg = max(1, int(dmg * (1.0 - p.damage_reduction())))
+                if p.shield > 0:
+                    absorb = min(p.shield, dmg)
+                    p.shield -= absorb
+                    dmg -= absorb
+                if dmg > 0:
+                    p.hp -= dmg
+                    p.hurt_flash = 0.35
+                    self.add_floating_text(p.pos.x, p.pos.y - 20, _neg_dmg_str(dmg), C_TEXT_HURT, 1.2)
+                    self.add_screen_shake(4)
+                    self.emit_blood(p.pos.x, p.pos.y, 6)
+                    self.play_sound("hurt")
+            # Shove the player away from the attacker
+            kx = p.pos.x - e.pos.x
+            ky = p.pos.y - e.pos.y
+            d = math.hypot(kx, ky)
+            if d > 0:
+                p.pos.x += kx / d * 150 * dt
+                p.pos.y += ky / d * 150 * dt
 
     def update_enemies(self, dt: float):
+        # Decisions run at a fixed 30 Hz; movement, timers and contact every frame
+        self._ai_accum = min(self._ai_accum + dt, ENEMY_AI_DT * 4)
+        while self._ai_accum >= ENEMY_AI_DT:
+            self._ai_accum -= ENEMY_AI_DT
+            self._tick_enemies_ai(ENEMY_AI_DT)
+        self._tick_enemies_frame(dt)
+
+    def _tick_enemies_ai(self, ai_dt: float):
+        """Fixed-rate enemy decisions: aura buffs, seek steering and ranged attacks."""
         p = self.player
         for e in self.enemies:
             e.mult_speed = 1.0
             e.mult_damage = 1.0
             e.mult_taken = 1.0
+        self._rebuild_enemy_grid()
         for e in self.enemies:
-            if isinstance(e, Elite) and e.alive:
-                e.aura_pulse += dt * 2.0
+            if e.alive and e.kind_flags & KIND_ELITE:
                 aura = AURAS[e.aura]
-                for m in self.enemies:
-                    if m is e or not m.alive:
+                ex, ey = e.pos.x, e.pos.y
+                r2 = e.aura_radius * e.aura_radius
+                for m in self._enemies_near(ex, ey, e.aura_radius):
+                    if m is e:
                         continue
-                    if (m.pos - e.pos).length() <= e.aura_radius:
+                    dx = m.pos.x - ex
+                    dy = m.pos.y - ey
+                    if dx * dx + dy * dy <= r2:
                         m.mult_speed *= aura["speed"]
                         m.mult_damage *= aura["damage"]
                         m.mult_taken *= aura["taken"]
+        px, py = p.pos.x, p.pos.y
+        active = [e for e in self.enemies
+                  if e.alive and not e.kind_flags & KIND_GOBLIN
+                  and _within(e.pos.x, e.pos.y, px, py, ENEMY_ACTIVE_RADIUS)]
+        # Same per-second convergence as the old 60 Hz blend of 0.1
+        self._steer_enemies(active, 1.0 - 0.9 ** (ai_dt * 60))
+        for e in active:
+            ex, ey = e.pos.x, e.pos.y
+            dx = px - ex
+            dy = py - ey
+            # spitter ranged attack
+            if e.kind == 3:
+                e.shot_cd -= ai_dt
+                if e.shot_cd <= 0:
+                    d = math.hypot(dx, dy)
+                    if d > 0:
+                        ux, uy = dx / d, dy / d
+                        pr = self._projectile_pool.acquire(
+                            pos=Vec(ex + ux * 14, ey + uy * 14), vel=Vec(ux * 320, uy * 320),
+                            dmg=e.roll_damage(), ttl=1.6, radius=4, pierce=1, hostile=True)
+                        self.projectiles.append(pr)
+                        self.emit_particles(ex, ey, 3, (200, 80, 80), speed=30, life=0.3, gravity=0)
+                    e.shot_cd = random.uniform(1.2, 2.0)
+            # Boss shooting
+            if e.kind_flags & KIND_BOSS:
+                e.shot_cd -= ai_dt
+                if e.shot_cd <= 0:
+                    d = math.hypot(dx, dy)
+                    if d > 0:
+                        ux, uy = dx / d, dy / d
+                        pr = self._projectile_pool.acquire(
+                            pos=Vec(ex + ux * 18, ey + uy * 18),
+                            vel=Vec(ux * BOSS_PROJ_SPEED, uy * BOSS_PROJ_SPEED),
+                            dmg=e.roll_damage(), ttl=2.0, radius=5, pierce=1, hostile=True)
+                        self.projectiles.append(pr)
+                        self.emit_particles(ex, ey, 6, C_FIRE, speed=50, life=0.4, gravity=0)
+                        self.add_screen_shake(3)
+                    e.shot_cd = random.uniform(*BOSS_SHOT_CD)
+
+    def _tick_enemies_frame(self, dt: float):
+        """Per-frame enemy work: timers, goblin flight, movement with wall collision, contact damage."""
+        p = self.player
+        px, py = p.pos.x, p.pos.y
+        chasers = []
+        # Bound methods called per enemy, looked up once
+        collides = self._circle_collides_xy
+        near_wall = self.dungeon.is_near_wall
+        solid_xy = self.dungeon.is_solid_xy
+        drag = 0.98 ** (dt * 60)  # 2% velocity loss per 60 Hz frame, whatever the frame rate
         for e in self.enemies:
             if not e.alive:
                 continue
             e.hit_flash = max(0.0, e.hit_flash - dt)
+            if e.kind_flags & KIND_ELITE:
+                e.aura_pulse += dt * 2.0
             # Treasure goblin: flee from player, drop loot
-            if isinstance(e, TreasureGoblin) and e.alive:
+            if e.kind_flags & KIND_GOBLIN:
                 e.portal_timer -= dt
                 if e.portal_timer <= 0:
                     e.alive = False
@@ -3275,34 +4032,35 @@ class Game:
                     self.emit_particles(e.pos.x, e.pos.y, 8, C_GOLD, speed=50, life=0.4, gravity=-25)
                     self.add_floating_text(e.pos.x, e.pos.y - 20, "ESCAPED!", (200, 180, 60), 1.2)
                     continue
-                # Flee from player — with wall avoidance
-                flee_dir = (e.pos - p.pos)
-                if flee_dir.length_squared() > 0:
-                    flee_dir = flee_dir.normalize()
+                # Flee from player — with wall avoidance (scalar unit vector fx, fy)
+                ex, ey = e.pos.x, e.pos.y
+                fx = ex - p.pos.x
+                fy = ey - p.pos.y
+                d = math.hypot(fx, fy)
+                if d > 0:
+                    fx /= d
+                    fy /= d
                 else:
-                    flee_dir = Vec(1, 0)
+                    fx, fy = 1.0, 0.0
                 # Wall avoidance: probe ahead and to sides, redirect if blocked
                 probe_dist = TILE * 1.5
-                probe_ahead = e.pos + flee_dir * probe_dist
-                if self.dungeon.is_solid_at_px(probe_ahead):
-                    # Try perpendicular directions to find open path
-                    perp1 = Vec(-flee_dir.y, flee_dir.x)
-                    perp2 = Vec(flee_dir.y, -flee_dir.x)
-                    p1_ok = not self.dungeon.is_solid_at_px(e.pos + perp1 * probe_dist)
-                    p2_ok = not self.dungeon.is_solid_at_px(e.pos + perp2 * probe_dist)
-                    if p1_ok and p2_ok:
-                        flee_dir = random.choice([perp1, perp2])
-                    elif p1_ok:
-                        flee_dir = perp1
+                if solid_xy(ex + fx * probe_dist, ey + fy * probe_dist):
+                    # Try perpendicular directions (already unit length) to find open path
+                    p1_ok = not solid_xy(ex - fy * probe_dist, ey + fx * probe_dist)
+                    p2_ok = not solid_xy(ex + fy * probe_dist, ey - fx * probe_dist)
+                    if p1_ok and (not p2_ok or random.random() < 0.5):
+                        fx, fy = -fy, fx
                     elif p2_ok:
-                        flee_dir = perp2
+                        fx, fy = fy, -fx
                     else:
                         # Fully blocked, try random direction
                         ang = random.uniform(0, math.tau)
-                        flee_dir = Vec(math.cos(ang), math.sin(ang))
-                jitter = Vec(random.uniform(-0.3, 0.3), random.uniform(-0.3, 0.3))
-                acc = (flee_dir + jitter).normalize() * (e.speed * 1.1)
-                e.vel += (acc - e.vel) * 0.2
+                        fx, fy = math.cos(ang), math.sin(ang)
+                ax = fx + self._rng.uniform(-0.3, 0.3)
+                ay = fy + self._rng.uniform(-0.3, 0.3)
+                k = e.speed * 1.1 / math.hypot(ax, ay)
+                e.vel.x += (ax * k - e.vel.x) * 0.2
+                e.vel.y += (ay * k - e.vel.y) * 0.2
                 # Drop loot periodically
                 e.loot_drop_timer -= dt
                 if e.loot_drop_timer <= 0:
@@ -3328,96 +4086,88 @@ class Game:
                     e.alive = False
                     self.on_enemy_dead(e)
                 continue
-            desired = (p.pos - e.pos)
-            dist = desired.length() or 0.0001
-            desired = desired / dist
-            jitter = Vec(random.uniform(-0.2, 0.2), random.uniform(-0.2, 0.2))
-            acc = (desired + jitter).normalize() * (e.speed * e.mult_speed)
-            e.vel += (acc - e.vel) * 0.1
-            new_epos = e.pos + e.vel * dt
+            # Outside the active area: freeze AI, only tick timers
+            if not _within(e.pos.x, e.pos.y, px, py, ENEMY_ACTIVE_RADIUS):
+                e.knockback = max(0.0, e.knockback - 200 * dt)
+                e.frozen_time += dt
+                if e.hp <= 0:
+                    e.alive = False
+                    self.on_enemy_dead(e)
+                elif e.frozen_time >= ENEMY_DESPAWN_TIME and not e.kind_flags & KIND_BOSS:
+                    # Left behind: drop it unscored so it stops holding a MAX_ACTIVE_ENEMIES slot
+                    e.alive = False
+                continue
+            e.frozen_time = 0.0
+            # Velocity already steered toward the player by _steer_enemies
+            # Plain float math from here on; pos/vel are written back once
+            ex, ey = e.pos.x, e.pos.y
+            vx, vy = e.vel.x, e.vel.y
+            r = e.radius
             # axis-separated wall collision with wall sliding
-            test_x = Vec(new_epos.x, e.pos.y)
-            if not self._circle_collides(test_x, e.radius):
-                e.pos.x = test_x.x
+            nx = ex + vx * dt
+            if not collides(nx, ey, r):
+                ex = nx
             else:
-                e.vel.x = 0
-            test_y = Vec(e.pos.x, new_epos.y)
-            if not self._circle_collides(test_y, e.radius):
-                e.pos.y = test_y.y
+                vx = 0.0
+            ny = ey + vy * dt
+            if not collides(ex, ny, r):
+                ey = ny
             else:
-                e.vel.y = 0
+                vy = 0.0
             # Push away from nearby walls to prevent sticking
-            push = Vec(0, 0)
-            for ang_i in range(8):
-                ang = ang_i * math.pi / 4
-                probe = Vec(e.pos.x + math.cos(ang) * (e.radius + 2),
-                            e.pos.y + math.sin(ang) * (e.radius + 2))
-                if self.dungeon.is_solid_at_px(probe):
-                    push.x -= math.cos(ang)
-                    push.y -= math.sin(ang)
-            if push.length_squared() > 0:
-                push = push.normalize() * 60
-                e.pos.x += push.x * dt
-                e.pos.y += push.y * dt
+            reach = r + 2
+            if near_wall(ex, ey, reach):
+                push_x = push_y = 0.0
+                for cx, cy in _PUSH_DIRS:
+                    if solid_xy(ex + cx * reach, ey + cy * reach):
+                        push_x -= cx
+                        push_y -= cy
+                push_len = math.hypot(push_x, push_y)
+                if push_len > 0:
+                    k = 60 * dt / push_len
+                    ex += push_x * k
+                    ey += push_y * k
             # clamp to world bounds
-            e.pos.x = max(e.radius, min(MAP_W * TILE - e.radius, e.pos.x))
-            e.pos.y = max(e.radius, min(MAP_H * TILE - e.radius, e.pos.y))
-            # spitter ranged attack
-            if e.kind == 3 and e.alive:
-                e.shot_cd -= dt
-                if e.shot_cd <= 0:
-                    dirv = (p.pos - e.pos)
-                    if dirv.length_squared() > 0:
-                        dirv = dirv.normalize()
-                        pr = Projectile(pos=e.pos + dirv * 14, vel=dirv * 320,
-                                        dmg=e.roll_damage(), ttl=1.6, radius=4, pierce=1, hostile=True)
-                        self.projectiles.append(pr)
-                        self.emit_particles(e.pos.x, e.pos.y, 3, (200, 80, 80), speed=30, life=0.3, gravity=0)
-                    e.shot_cd = random.uniform(1.2, 2.0)
-            # Boss shooting
-            if isinstance(e, Boss):
-                e.shot_cd -= dt
-                if e.shot_cd <= 0:
-                    dirv = (p.pos - e.pos)
-                    if dirv.length_squared() > 0:
-                        dirv = dirv.normalize()
-                        pr = Projectile(pos=e.pos + dirv * 18, vel=dirv * BOSS_PROJ_SPEED,
-                                        dmg=e.roll_damage(), ttl=2.0, radius=5, pierce=1, hostile=True)
-                        self.projectiles.append(pr)
-                        self.emit_particles(e.pos.x, e.pos.y, 6, C_FIRE, speed=50, life=0.4, gravity=0)
-                        self.add_screen_shake(3)
-                    e.shot_cd = random.uniform(*BOSS_SHOT_CD)
-            # Touch damage
-            if (e.pos - p.pos).length() < e.radius + p.radius and p.iframes <= 0:
-                if random.random() < 0.02:
-                    # Dodge check
-                    if random.random() * 100 < p.calc_dodge_chance():
-                        self.add_floating_text(p.pos.x, p.pos.y - 20, "DODGE!", (140, 255, 140), 0.8)
-                    else:
-                        dmg = e.roll_damage()
-                        # Apply armor damage reduction
-                        dmg = max(1, int(dmg * (1.0 - p.damage_reduction())))
-                        if p.shield > 0:
-                            absorb = min(p.shield, dmg)
-                            p.shield -= absorb
-                            dmg -= absorb
-                        if dmg > 0:
-                            p.hp -= dmg
-                            p.hurt_flash = 0.35
-                            self.add_floating_text(p.pos.x, p.pos.y - 20, f"-{dmg}", (255, 60, 60), 1.2)
-                            self.add_screen_shake(4)
-                            self.emit_blood(p.pos.x, p.pos.y, 6)
-                            self.play_sound("hurt")
-                    kb = (p.pos - e.pos).normalize() * 150
-                    p.pos += kb * dt
+            ex = max(r, min(MAP_W * TILE - r, ex))
+            ey = max(r, min(MAP_H * TILE - r, ey))
+            e.pos.x = ex
+            e.pos.y = ey
+            e.vel.x = vx
+            e.vel.y = vy
+            chasers.append(e)
             e.knockback = max(0.0, e.knockback - 200 * dt)
-            e.vel *= 0.98
+            e.vel *= drag
             if e.hp <= 0 and e.alive:
                 e.alive = False
                 self.on_enemy_dead(e)
-        self.enemies = [e for e in self.enemies if e.alive or random.random() > 0.01]
+        self._resolve_touch_damage(chasers, dt)
+        # Dead enemies have already been scored by on_enemy_dead; drop them in place
+        enemies = self.enemies
+        w = 0
+        for e in enemies:
+            if e.alive:
+                enemies[w] = e
+                w += 1
+        del enemies[w:]
 
     def update_projectiles(self, dt: float):
+        self._rebuild_enemy_grid()
+        # Derived player stats can't change mid-pass; evaluate them once per frame
+        p = self.player
+        dodge_pct = p.calc_dodge_chance()
+        dmg_reduction = p.damage_reduction()
+        life_steal = p.calc_life_steal()
+        max_hp = p.max_hp()
+        emit_one = self.particles.emit_one
+        # Bound methods called per projectile / per hit, looked up once
+        emit = self.emit_particles
+        sparks = self.emit_sparks
+        blood = self.emit_blood
+        add_text = self.add_floating_text
+        shake = self.add_screen_shake
+        sound = self.play_sound
+        solid_xy = self.dungeon.is_solid_xy
+        arrows = []
         for pr in self.projectiles:
             pr.ttl -= dt
             pr.pos += pr.vel * dt
@@ -3426,139 +4176,152 @@ class Game:
             pr.trail_timer += dt
             # particle trail
             if pr.trail_timer > 0.03:
-                pr.trail_timer = 0.0
-                if pr.hostile:
-                    self.emit_particles(pr.pos.x, pr.pos.y, 1, (200, 80, 70), speed=15, life=0.2, size=1.5, gravity=0)
-                else:
-                    col = (100, 160, 255) if pr.radius <= BASIC_RADIUS else (160, 120, 255)
-                    self.emit_particles(pr.pos.x, pr.pos.y, 1, col, speed=15, life=0.2, size=1.5, gravity=0)
-            if self.dungeon.is_solid_at_px(pr.pos):
+                pr.trail_timer -= 0.03
+                emit_one(pr.pos.x, pr.pos.y, pr.trail_col, 15, 0.2, 1.5, 0)
+            if solid_xy(pr.pos.x, pr.pos.y):
                 pr.ttl = 0
-                self.emit_sparks(pr.pos.x, pr.pos.y, 4)
+                sparks(pr.pos.x, pr.pos.y, 4)
                 continue
             if pr.hostile:
-                if (self.player.pos - pr.pos).length() < self.player.radius + pr.radius and self.player.iframes <= 0:
+                if (_within(p.pos.x, p.pos.y, pr.pos.x, pr.pos.y, p.radius + pr.radius)
+                        and p.iframes <= 0):
                     # Dodge check
-                    if random.random() * 100 < self.player.calc_dodge_chance():
-                        self.add_floating_text(self.player.pos.x, self.player.pos.y - 20, "DODGE!", (140, 255, 140), 0.8)
+                    if random.random() * 100 < dodge_pct:
+                        add_text(p.pos.x, p.pos.y - 20, TEXT_DODGE, C_TEXT_DODGE, 0.8)
                         pr.ttl = 0
                         continue
-                    dmg = max(1, int(pr.dmg * (1.0 - self.player.damage_reduction())))
-                    if self.player.shield > 0:
-                        absorb = min(self.player.shield, dmg)
-                        self.player.shield -= absorb
+                    dmg = max(1, int(pr.dmg * (1.0 - dmg_reduction)))
+                    if p.shield > 0:
+                        absorb = min(p.shield, dmg)
+                        p.shield -= absorb
                         dmg -= absorb
                     if dmg > 0:
-                        self.player.hp -= dmg
-                        self.player.hurt_flash = 0.35
-                        self.player.iframes = max(self.player.iframes, 0.12)
-                        self.add_floating_text(self.player.pos.x, self.player.pos.y - 20, f"-{dmg}", (255, 60, 60))
-                        self.add_screen_shake(3)
-                        self.emit_blood(self.player.pos.x, self.player.pos.y, 4)
-                        self.play_sound("hurt")
+                        p.hp -= dmg
+                        p.hurt_flash = 0.35
+                        p.iframes = max(p.iframes, 0.12)
+                        add_text(p.pos.x, p.pos.y - 20, _neg_dmg_str(dmg), C_TEXT_HURT)
+                        shake(3)
+                        blood(p.pos.x, p.pos.y, 4)
+                        sound("hurt")
                     pr.ttl = 0
                     continue
             else:
-                for e in self.enemies:
-                    if not e.alive:
-                        continue
-                    if (e.pos - pr.pos).length() < e.radius + pr.radius:
-                        damage = max(1, int(pr.dmg * e.mult_taken))
-                        # Elemental infusion effects
-                        if pr.infusion == "fire":
-                            damage = int(damage * 1.35)
-                            self.emit_fire(e.pos.x, e.pos.y, 8)
-                        elif pr.infusion == "ice":
-                            e.vel *= 0.3
-                            e.mult_speed *= 0.5
-                            self.emit_particles(e.pos.x, e.pos.y, 6, C_ICE, speed=40, life=0.5, gravity=-20)
-                        elif pr.infusion == "lightning":
-                            damage = int(damage * 1.15)
-                            # Chain lightning to one nearby enemy
-                            for nearby in self.enemies:
-                                if nearby is e or not nearby.alive:
-                                    continue
-                                if (nearby.pos - e.pos).length() < 150:
-                                    chain_dmg = max(1, damage // 3)
-                                    nearby.hp -= chain_dmg
-                                    nearby.hit_flash = 0.1
-                                    self.add_floating_text(nearby.pos.x, nearby.pos.y - 10,
-                                                           str(chain_dmg), C_LIGHTNING, 0.9)
-                                    self.lightning_chains.append((
-                                        Vec(e.pos.x, e.pos.y),
-                                        Vec(nearby.pos.x, nearby.pos.y), 0.2))
-                                    self.emit_particles(nearby.pos.x, nearby.pos.y, 4,
-                                                        C_LIGHTNING, speed=50, life=0.3, gravity=0)
-                                    break
-                        e.hp -= damage
-                        e.knockback = 200
-                        e.vel += (e.pos - pr.pos).normalize() * 300
-                        e.hit_flash = 0.12
-                        dmg_col = INFUSION_COLORS.get(pr.infusion, C_GOLD if damage > 15 else (220, 220, 220))
-                        self.add_floating_text(e.pos.x, e.pos.y - e.radius - 8,
-                                               str(damage), dmg_col,
-                                               scale=1.3 if damage > 20 else 1.0)
-                        self.emit_blood(e.pos.x, e.pos.y, 4)
-                        self.play_sound(f"hit_{self._creature_sound_name(e)}")
-                        # Life steal
-                        ls = self.player.calc_life_steal()
-                        if ls > 0:
-                            heal = max(1, int(damage * ls / 100))
-                            self.player.hp = min(self.player.max_hp(), self.player.hp + heal)
-                        if pr.infusion == "lightning":
-                            self.play_sound("zap")
-                        if damage > 15:
-                            self.add_screen_shake(2)
-                        pr.pierce -= 1
-                        if pr.pierce <= 0:
-                            pr.ttl = 0
+                arrows.append(pr)
+        # Narrow phase: every player projectile against every living enemy in one kernel call
+        targets = [e for e in self.enemies if e.alive]
+        if arrows and targets:
+            pa = np.array([(pr.pos.x, pr.pos.y, pr.radius) for pr in arrows])
+            ea = np.array([(e.pos.x, e.pos.y, e.radius) for e in targets])
+            pis, eis = _hit_pairs(*(np.ascontiguousarray(col) for col in pa.T),
+                                  *(np.ascontiguousarray(col) for col in ea.T))
+            for i, j in zip(pis.tolist(), eis.tolist()):
+                pr = arrows[i]
+                e = targets[j]
+                # Only arrows used up by an earlier hit in this pass are skipped; one whose ttl ran out
+                # this frame still gets its last hit, as it always has
+                if pr.pierce <= 0 or not e.alive:
+                    continue
+                damage = max(1, int(pr.dmg * e.mult_taken))
+                # Elemental infusion effects
+                if pr.infusion == "fire":
+                    damage = int(damage * 1.35)
+                    self.emit_fire(e.pos.x, e.pos.y, 8)
+                elif pr.infusion == "ice":
+                    e.vel *= 0.3
+                    e.mult_speed *= 0.5
+                    emit(e.pos.x, e.pos.y, 6, C_ICE, speed=40, life=0.5, gravity=-20)
+                elif pr.infusion == "lightning":
+                    damage = int(damage * 1.15)
+                    # Chain lightning to one nearby enemy
+                    for nearby in self._enemies_near(e.pos.x, e.pos.y, CHAIN_LIGHTNING_RANGE):
+                        if nearby is e or not nearby.alive:
+                            continue
+                        cdx = nearby.pos.x - e.pos.x
+                        cdy = nearby.pos.y - e.pos.y
+                        if cdx * cdx + cdy * cdy < CHAIN_LIGHTNING_RANGE * CHAIN_LIGHTNING_RANGE:
+                            chain_dmg = max(1, damage // 3)
+                            nearby.hp -= chain_dmg
+                            nearby.hit_flash = 0.1
+                            add_text(nearby.pos.x, nearby.pos.y - 10,
+                                     _dmg_str(chain_dmg), C_LIGHTNING, 0.9)
+                            self.lightning_chains.append((
+                                Vec(e.pos.x, e.pos.y),
+                                Vec(nearby.pos.x, nearby.pos.y), 0.2))
+                            emit(nearby.pos.x, nearby.pos.y, 4,
+                                 C_LIGHTNING, speed=50, life=0.3, gravity=0)
                             break
-        # Projectile-chest collision (player projectiles only)
+                e.hp -= damage
+                e.knockback = 200
+                e.vel += (e.pos - pr.pos).normalize() * 300
+                e.hit_flash = 0.12
+                dmg_col = INFUSION_COLORS.get(pr.infusion, C_GOLD if damage > 15 else C_TEXT_HIT)
+                add_text(e.pos.x, e.pos.y - e.radius - 8,
+                         _dmg_str(damage), dmg_col,
+                         scale=1.3 if damage > 20 else 1.0)
+                blood(e.pos.x, e.pos.y, 4)
+                sound(f"hit_{self._creature_sound_name(e)}")
+                # Life steal
+                if life_steal > 0:
+                    heal = max(1, int(damage * life_steal / 100))
+                    p.hp = min(max_hp, p.hp + heal)
+                if pr.infusion == "lightning":
+                    sound("zap")
+                if damage > 15:
+                    shake(2)
+                pr.pierce -= 1
+                if pr.pierce <= 0:
+                    pr.ttl = 0
+        # Projectile-chest/crate collision (player projectiles only; at most one of each per arrow per frame)
+        breakables = self._breakable_grid
         for pr in self.projectiles:
             if pr.hostile or pr.ttl <= 0:
                 continue
-            for chest in self.chests:
-                if not chest.alive:
-                    continue
-                if (chest.pos - pr.pos).length() < 20 + pr.radius:
-                    chest.hp -= 1
-                    chest.hit_flash = 0.15
-                    self.emit_sparks(chest.pos.x, chest.pos.y, 5)
-                    self.add_screen_shake(1)
-                    pr.pierce -= 1
-                    if pr.pierce <= 0:
-                        pr.ttl = 0
-                    if chest.hp <= 0:
-                        chest.alive = False
-                        self._on_chest_broken(chest)
+            prx, pry = pr.pos.x, pr.pos.y
+            hit_chest = hit_crate = False
+            for is_chest, ci, obj in _grid_query(breakables, prx, pry, 20 + pr.radius):
+                if pr.ttl <= 0:
                     break
-
-        # Projectile-crate collision (player projectiles only)
-        for pr in self.projectiles:
-            if pr.hostile or pr.ttl <= 0:
-                continue
-            for crate in self.crates:
-                if not crate.alive:
+                if not obj.alive or (hit_chest if is_chest else hit_crate):
                     continue
-                if (crate.pos - pr.pos).length() < 20 + pr.radius:
-                    crate.hp -= 1
-                    crate.hit_flash = 0.12
-                    self.emit_sparks(crate.pos.x, crate.pos.y, 3)
-                    pr.pierce -= 1
-                    if pr.pierce <= 0:
-                        pr.ttl = 0
-                    if crate.hp <= 0:
-                        crate.alive = False
-                        self._on_crate_broken(crate)
-                    break
-
-        self.projectiles = [pr for pr in self.projectiles if pr.ttl > 0]
+                if not _within(obj.pos.x, obj.pos.y, prx, pry, 20 + pr.radius):
+                    continue
+                obj.hp -= 1
+                if is_chest:
+                    hit_chest = True
+                    self._chest_hit_flash[ci] = 0.15
+                    sparks(obj.pos.x, obj.pos.y, 5)
+                    shake(1)
+                else:
+                    hit_crate = True
+                    self._crate_hit_flash[ci] = 0.12
+                    sparks(obj.pos.x, obj.pos.y, 3)
+                pr.pierce -= 1
+                if pr.pierce <= 0:
+                    pr.ttl = 0
+                if obj.hp <= 0:
+                    obj.alive = False
+                    if is_chest:
+                        self._on_chest_broken(obj)
+                    else:
+                        self._on_crate_broken(obj)
+
+        # Compact in place, recycling spent projectiles
+        projs = self.projectiles
+        release = self._projectile_pool.release
+        w = 0
+        for pr in projs:
+            if pr.ttl > 0:
+                projs[w] = pr
+                w += 1
+            else:
+                release(pr)
+        del projs[w:]
 
     def update_loot(self, dt: float):
         for l in self.loots:
             l.ttl -= dt
             l.bob_phase += dt * 3.0
-            if (l.pos - self.player.pos).length() < 24:
+            if _within(l.pos.x, l.pos.y, self.player.pos.x, self.player.pos.y, 24):
                 if l.gold:
                     self.player.gold += l.gold
                     self.add_floating_text(l.pos.x, l.pos.y - 10, f"+{l.gold}g", C_GOLD, 0.8)
@@ -3654,7 +4417,13 @@ class Game:
                     self.play_sound("infusion")
                 self.emit_sparks(l.pos.x, l.pos.y, 3)
                 l.ttl = 0
-        self.loots = [l for l in self.loots if l.ttl > 0]
+        loots = self.loots
+        w = 0
+        for l in loots:
+            if l.ttl > 0:
+                loots[w] = l
+                w += 1
+        del loots[w:]
 
     def on_enemy_dead(self, e: Enemy):
         self.kills += 1
@@ -3677,7 +4446,7 @@ class Game:
             self.play_sound("levelup")
 
         # Treasure goblin: loot explosion
-        if isinstance(e, TreasureGoblin):
+        if e.kind_flags & KIND_GOBLIN:
             if self.treasure_goblin is e:
                 self.treasure_goblin = None
             self.emit_death_burst(e.pos.x, e.pos.y, C_GOLD, 25)
@@ -3706,15 +4475,16 @@ class Game:
                                        weapon=self._gen_weapon(gob_rarity)))
             self.corpses.append(Corpse(x=e.pos.x, y=e.pos.y, radius=e.radius, kind=e.kind,
                                        color=C_GOLD, is_boss=False, is_elite=False))
+            self._corpse_version += 1
             return
 
         # death effects
         death_color = (180, 60, 60)
-        if isinstance(e, Elite):
+        if e.kind_flags & KIND_ELITE:
             death_color = AURAS[e.aura]["color"]
             self.emit_death_burst(e.pos.x, e.pos.y, death_color, 16)
             self.add_screen_shake(3)
-        elif isinstance(e, Boss):
+        elif e.kind_flags & KIND_BOSS:
             if getattr(e, 'is_uber', False):
                 self.emit_death_burst(e.pos.x, e.pos.y, (180, 60, 180), 35)
                 self.emit_particles(e.pos.x, e.pos.y, 20, (200, 170, 60), speed=90, life=0.8, gravity=-25)
@@ -3741,8 +4511,9 @@ class Game:
 
         # corpse
         self.corpses.append(Corpse(x=e.pos.x, y=e.pos.y, radius=e.radius, kind=e.kind,
-                                   color=death_color, is_boss=isinstance(e, Boss),
-                                   is_elite=isinstance(e, Elite)))
+                                   color=death_color, is_boss=bool(e.kind_flags & KIND_BOSS),
+                                   is_elite=bool(e.kind_flags & KIND_ELITE)))
+        self._corpse_version += 1
 
         drops: List[Loot] = []
         sp = lambda: self._safe_loot_pos(e.pos)
@@ -3757,7 +4528,7 @@ class Game:
             # Elites: magic-rare, small chance unique
             # Bosses: rare-unique, small chance set
             force = None
-            if isinstance(e, Boss):
+            if e.kind_flags & KIND_BOSS:
                 roll = random.random()
                 if roll < 0.05:
                     force = RARITY_SET
@@ -3765,7 +4536,7 @@ class Game:
                     force = RARITY_UNIQUE
                 else:
                     force = RARITY_RARE
-            elif isinstance(e, Elite):
+            elif e.kind_flags & KIND_ELITE:
                 roll = random.random()
                 if roll < 0.03:
                     force = RARITY_UNIQUE
@@ -3804,7 +4575,7 @@ class Game:
             drops.append(Loot(pos=sp(), amulet=self._gen_amulet()))
         if random.random() < 0.03:
             drops.append(Loot(pos=sp(), jewel=self._gen_jewel()))
-        if isinstance(e, Elite):
+        if e.kind_flags & KIND_ELITE:
             drops.append(Loot(pos=sp(), gold=random.randint(15, 35)))
             if random.random() < 0.5:
                 drops.append(Loot(pos=sp(), dmg_boost=True))
@@ -3815,7 +4586,7 @@ class Game:
                 elite_rarity = RARITY_MAGIC if random.random() < 0.6 else RARITY_RARE
                 drops.append(Loot(pos=self._safe_loot_pos(e.pos, 15),
                                   weapon=self._gen_weapon(elite_rarity)))
-        if isinstance(e, Boss):
+        if e.kind_flags & KIND_BOSS:
             if getattr(e, 'is_uber', False):
                 # UBER BOSS - massive loot explosion, very high unique chance
                 for _ in range(3):
@@ -3893,31 +4664,26 @@ class Game:
             self.spawn_boss()
             # Uber boss chance (rare, only on later levels, after act boss is dead)
             if (self.current_level >= 8 and self.boss_spawned
-                    and not any(isinstance(e, Boss) for e in self.enemies if e.alive)
+                    and not any(e.kind_flags & KIND_BOSS for e in self.enemies if e.alive)
                     and random.random() < UBER_BOSS_CHANCE):
                 self.spawn_uber_boss()
 
     def update_particles(self, dt: float):
-        alive = []
-        for p in self.particles:
-            p.life -= dt
-            if p.life <= 0:
-                continue
-            p.vy += p.gravity * dt
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            alive.append(p)
-        self.particles = alive
+        self.particles.update(dt)
 
     def update_floating_texts(self, dt: float):
-        alive = []
-        for ft in self.floating_texts:
+        texts = self.floating_texts
+        release = self._text_pool.release
+        w = 0
+        for ft in texts:
             ft.life -= dt
             if ft.life <= 0:
+                release(ft)
                 continue
             ft.y += ft.vy * dt
-            alive.append(ft)
-        self.floating_texts = alive
+            texts[w] = ft
+            w += 1
+        del texts[w:]
 
     def update_corpses(self, dt: float):
         alive = []
@@ -3934,7 +4700,9 @@ class Game:
                                         (wisp_r, wisp_g, wisp_b),
                                         speed=5, life=0.6, size=1.5, gravity=-30)
                 alive.append(c)
-        self.corpses = alive
+        if len(alive) != len(self.corpses):
+            self.corpses = alive
+            self._corpse_version += 1
 
     def update_blood_stains(self, dt: float):
         alive = []
@@ -4231,6 +4999,7 @@ class Game:
         self.particles.clear()
         self.floating_texts.clear()
         self.corpses.clear()
+        self._corpse_version += 1
         self.chests.clear()
         self.crates.clear()
         self.treasure_goblin = None
@@ -4271,6 +5040,10 @@ class Game:
         s.fill(C_GOTHIC_BG)
         ox = int(self.shake_x)
         oy = int(self.shake_y)
+        # Visible tile range (with a 2-tile margin) shared by every _tile_in_view test this frame
+        self._view_bounds = (self.cam_x // TILE - 2, (self.cam_x + WIDTH) // TILE + 2,
+                             self.cam_y // TILE - 2, (self.cam_y + HEIGHT) // TILE + 2)
+        self._frame_mouse = pygame.mouse.get_pos()
 
         self._draw_tiles(s, ox, oy)
         self._draw_blood_stains(s, ox, oy)
@@ -4295,52 +5068,150 @@ class Game:
         self._draw_minimap(s)
         pygame.display.flip()
 
+    def _decor_in_view(self, grid: dict, bounds=None):
+        """Yield decorations from every bucket overlapping the current view bounds (or the given tile bounds)."""
+        vx0, vx1, vy0, vy1 = bounds or self._view_bounds
+        for cx in range(max(0, vx0) >> DECOR_GRID_SHIFT, (vx1 >> DECOR_GRID_SHIFT) + 1):
+            for cy in range(max(0, vy0) >> DECOR_GRID_SHIFT, (vy1 >> DECOR_GRID_SHIFT) + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
     def _tile_in_view(self, tx: int, ty: int) -> bool:
-        return ((self.cam_x // TILE) - 2 <= tx <= ((self.cam_x + WIDTH) // TILE) + 2 and
-                (self.cam_y // TILE) - 2 <= ty <= ((self.cam_y + HEIGHT) // TILE) + 2)
+        vx0, vx1, vy0, vy1 = self._view_bounds
+        return vx0 <= tx <= vx1 and vy0 <= ty <= vy1
+
+    def _render_tile_chunk(self, cx, cy):
+        """Draw one TILE_CHUNK x TILE_CHUNK block of the map into its own surface."""
+        d = self.dungeon
+        x0, y0 = cx * TILE_CHUNK, cy * TILE_CHUNK
+        x1, y1 = min(MAP_W, x0 + TILE_CHUNK), min(MAP_H, y0 + TILE_CHUNK)
+        surf = pygame.Surface((TILE_CHUNK * TILE, TILE_CHUNK * TILE)).convert()
+        # Atlas index for every tile of the chunk in one vectorised pass over its contiguous block
+        w, h = x1 - x0, y1 - y0
+        idx = np.where(d.seen[x0:x1, y0:y1], d.chunk_atlas[cx, cy, :w, :h], d.chunk_atlas_unseen[cx, cy, :w, :h])
+        atlas = self._tile_atlas
+        offsets = [i * TILE for i in range(TILE_CHUNK)]
+        positions = [(px, py) for px in offsets[:w] for py in offsets[:h]]
+        surf.blits([(atlas[i], pos) for i, pos in zip(idx.ravel().tolist(), positions)], doreturn=False)
+        water = np.argwhere(idx // TILE_VARIANTS == TILE_CLASS_WATER).astype(np.int32) + (x0, y0)
+        return surf, water
+
+    def _scroll_layer(self, layer, origin, vx, vy, paint):
+        """Move a cached screen-space layer from world pixel origin to (vx, vy).
+
+        The layer is scrolled by the delta and paint(layer, rect, vx, vy) fills the exposed strips;
+        with no usable origin (None, or a jump of a screen or more) the whole layer is repainted.
+        """
+        sw, sh = layer.get_size()
+        if origin is None:
+            paint(layer, (0, 0, sw, sh), vx, vy)
+            return
+        dx = origin[0] - vx
+        dy = origin[1] - vy
+        if abs(dx) >= sw or abs(dy) >= sh:
+            paint(layer, (0, 0, sw, sh), vx, vy)
+        elif dx or dy:
+            layer.scroll(dx, dy)
+            if dx > 0:
+                paint(layer, (0, 0, dx, sh), vx, vy)
+            elif dx < 0:
+                paint(layer, (sw + dx, 0, -dx, sh), vx, vy)
+            if dy > 0:
+                paint(layer, (0, 0, sw, dy), vx, vy)
+            elif dy < 0:
+                paint(layer, (0, sh + dy, sw, -dy), vx, vy)
+
+    def _tile_chunk(self, cx, cy):
+        """Cached (surface, water tiles) for a chunk, rendering it on a miss and keeping LRU order."""
+        chunks = self._tile_chunks
+        key = (cx, cy)
+        entry = chunks.get(key)
+        if entry is None:
+            entry = chunks[key] = self._render_tile_chunk(cx, cy)
+            if len(chunks) > TILE_CHUNK_CACHE:
+                chunks.popitem(last=False)
+        else:
+            chunks.move_to_end(key)
+        return entry
+
+    def _paint_tile_region(self, bb, rect, vx, vy):
+        """Redraw the tile chunks under one rect of the backbuffer, with world pixel (vx, vy) at its origin."""
+        chunk_px = TILE_CHUNK * TILE
+        x, y, w, h = rect
+        bb.set_clip(rect)
+        bb.fill(C_GOTHIC_BG, rect)
+        cx0 = max(0, (vx + x) // chunk_px)
+        cx1 = min((MAP_W - 1) // TILE_CHUNK, (vx + x + w - 1) // chunk_px)
+        cy0 = max(0, (vy + y) // chunk_px)
+        cy1 = min((MAP_H - 1) // TILE_CHUNK, (vy + y + h - 1) // chunk_px)
+        batch = [(self._tile_chunk(cx, cy)[0], (cx * chunk_px - vx, cy * chunk_px - vy))
+                 for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+        bb.blits(batch, doreturn=False)
+        bb.set_clip(None)
 
     def _draw_tiles(self, s, ox, oy):
-        start_tx = max(0, self.cam_x // TILE)
-        end_tx = min(MAP_W - 1, (self.cam_x + WIDTH) // TILE + 1)
-        start_ty = max(0, self.cam_y // TILE)
-        end_ty = min(MAP_H - 1, (self.cam_y + HEIGHT) // TILE + 1)
-        for tx in range(start_tx, end_tx + 1):
-            for ty in range(start_ty, end_ty + 1):
-                px = tx * TILE - self.cam_x + ox
-                py = ty * TILE - self.cam_y + oy
-                seen = self.dungeon.seen[tx][ty]
-                variant = self.dungeon.tile_variants[tx][ty]
-                if self.dungeon.tiles[tx][ty] == WALL:
-                    if seen:
-                        wtype = self.dungeon.wall_type[tx][ty]
-                        if wtype == WALL_TREE and hasattr(self, 'tree_tiles'):
-                            s.blit(self.tree_tiles[variant], (px, py))
-                        elif wtype == WALL_ROCK and hasattr(self, 'rock_tiles'):
-                            s.blit(self.rock_tiles[variant], (px, py))
-                        elif wtype == WALL_WATER and hasattr(self, 'water_tiles'):
-                            s.blit(self.water_tiles[variant], (px, py))
-                            phase = self.game_time * 0.8 + (tx * 0.4 + ty * 0.6)
-                            shimmer_y = int((math.sin(phase) * 0.5 + 0.5) * (TILE - 4)) + 2
-                            shimmer_alpha = int(20 + 15 * math.sin(phase * 0.9))
-                            shimmer_col = (140, 165, 185) if self.current_biome == "icecavern" else (120, 140, 165)
-                            if self.current_biome == "firepit":
-                                shimmer_col = (190, 130, 70)
-                            elif self.current_biome == "swamp":
-                                shimmer_col = (85, 110, 78)
-                            shimmer_surf = pygame.Surface((TILE, 1), pygame.SRCALPHA)
-                            shimmer_surf.fill((*shimmer_col, max(10, min(50, shimmer_alpha))))
-                            s.blit(shimmer_surf, (px, py + shimmer_y))
-                        else:
-                            s.blit(self.wall_tiles[variant], (px, py))
-                    else:
-                        s.blit(self.unseen_wall, (px, py))
-                else:
-                    if seen:
-                        terrain = self.dungeon.terrain[tx][ty]
-                        ttiles = self._terrain_tiles.get(terrain, self.floor_tiles)
-                        s.blit(ttiles[variant], (px, py))
-                    else:
-                        s.blit(self.unseen_floor, (px, py))
+        d = self.dungeon
+        chunks = self._tile_chunks
+        dirty = False
+        if self._tile_chunk_owner is not d:
+            chunks.clear()
+            self._tile_chunk_owner = d
+            dirty = True
+        if d.seen_chunks:
+            for key in d.seen_chunks:
+                chunks.pop(key, None)
+            d.seen_chunks.clear()
+            dirty = True
+        # The map never changes once generated, so last frame's tile layer is scrolled by the camera
+        # delta and only the newly exposed edge strips are painted from the pre-rendered chunks
+        sw, sh = s.get_size()
+        bb = self._tile_backbuffer
+        if bb is None or bb.get_size() != (sw, sh):
+            bb = self._tile_backbuffer = pygame.Surface((sw, sh), 0, s)
+            dirty = True
+        vx = self.cam_x - ox
+        vy = self.cam_y - oy
+        self._scroll_layer(bb, None if dirty else self._tile_backbuffer_origin, vx, vy, self._paint_tile_region)
+        self._tile_backbuffer_origin = (vx, vy)
+        s.blit(bb, (0, 0))
+
+        chunk_px = TILE_CHUNK * TILE
+        cx0 = max(0, self.cam_x // chunk_px)
+        cx1 = min((MAP_W - 1) // TILE_CHUNK, (self.cam_x + WIDTH) // chunk_px)
+        cy0 = max(0, self.cam_y // chunk_px)
+        cy1 = min((MAP_H - 1) // TILE_CHUNK, (self.cam_y + HEIGHT) // chunk_px)
+        water = [entry[1] for entry in (self._tile_chunk(cx, cy) for cx in range(cx0, cx1 + 1)
+                                        for cy in range(cy0, cy1 + 1)) if len(entry[1])]
+        if not water:
+            return
+        # Animated water shimmer is drawn live on top of the cached chunks;
+        # positions, phases and alphas for all visible water tiles are computed in one NumPy pass
+        water = np.concatenate(water)
+        wtx, wty = water[:, 0], water[:, 1]
+        in_view = ((wtx >= self.cam_x // TILE) & (wtx <= (self.cam_x + WIDTH) // TILE + 1)
+                   & (wty >= self.cam_y // TILE) & (wty <= (self.cam_y + HEIGHT) // TILE + 1))
+        wtx, wty = wtx[in_view], wty[in_view]
+        if not len(wtx):
+            return
+        phase = self.game_time * 0.8 + (wtx * 0.4 + wty * 0.6)
+        xs = (wtx * TILE - self.cam_x + ox).tolist()
+        ys = (wty * TILE - self.cam_y + oy + ((np.sin(phase) * 0.5 + 0.5) * (TILE - 4)).astype(np.int32) + 2).tolist()
+        alphas = np.clip((20 + 15 * np.sin(phase * 0.9)).astype(np.int32), 10, 50).tolist()
+        shimmer_col = (140, 165, 185) if self.current_biome == "icecavern" else (120, 140, 165)
+        if self.current_biome == "firepit":
+            shimmer_col = (190, 130, 70)
+        elif self.current_biome == "swamp":
+            shimmer_col = (85, 110, 78)
+        shimmer_surfs = self._shimmer_surfs
+        overlays = []
+        for px, py, alpha in zip(xs, ys, alphas):
+            shimmer_surf = shimmer_surfs.get((shimmer_col, alpha))
+            if shimmer_surf is None:
+                shimmer_surf = shimmer_surfs[(shimmer_col, alpha)] = pygame.Surface((TILE, 1), pygame.SRCALPHA)
+                shimmer_surf.fill((*shimmer_col, alpha))
+            overlays.append((shimmer_surf, (px, py)))
+        s.blits(overlays, doreturn=False)
 
     def _draw_blood_stains(self, s, ox, oy):
         for bx, by, life in self.dungeon.blood_stains:
@@ -4352,32 +5223,109 @@ class Game:
                 pygame.draw.circle(s, (r, 5, 5), (sx, sy), int(6 + (1 - alpha) * 4))
 
     def _draw_scenery(self, s, ox, oy):
-        for (tx, ty, t) in self.dungeon.scenery:
-            if not self._tile_in_view(tx, ty):
+        vx0, vx1, vy0, vy1 = self._view_bounds
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        seen = self.dungeon.seen
+        blit = s.blit
+        # Scenery crates are handled by _draw_crates, so they have no sprite here
+        sprites = {'pillar': self.pillar_surf, 'stalagmite': self.stalagmite_surf, 'rock': self.rock_surf,
+                   'ice_crystal': self.ice_crystal_surf, 'mushroom': self.mushroom_surf}
+        for (tx, ty, t) in self._decor_in_view(self.dungeon.scenery_grid):
+            if not (vx0 <= tx <= vx1 and vy0 <= ty <= vy1):
                 continue
-            if not self.dungeon.seen[tx][ty]:
+            if not seen[tx, ty]:
                 continue
-            px = tx * TILE - self.cam_x + ox
-            py = ty * TILE - self.cam_y + oy
+            px = tx * TILE - cam_x
+            py = ty * TILE - cam_y
             # shadow
             pygame.draw.ellipse(s, (10, 8, 12), (px + 4, py + TILE - 8, TILE - 8, 6))
-            if t == 'pillar':
-                s.blit(self.pillar_surf, (px, py))
-            elif t == 'stalagmite':
-                s.blit(self.stalagmite_surf, (px, py))
-            elif t == 'rock':
-                s.blit(self.rock_surf, (px, py))
-            elif t == 'ice_crystal':
-                s.blit(self.ice_crystal_surf, (px, py))
-            elif t == 'mushroom':
-                s.blit(self.mushroom_surf, (px, py))
-            elif t == 'crate':
-                # Scenery crates handled by _draw_crates; skip here
-                pass
+            sprite = sprites.get(t)
+            if sprite is not None:
+                blit(sprite, (px, py))
+
+    def _scratch_surface(self, name, size):
+        """Reusable transparent SRCALPHA surface for an overlay that is redrawn every frame."""
+        key = (name, size)
+        surf = self._scratch_surfs.get(key)
+        if surf is None:
+            surf = self._scratch_surfs[key] = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
+
+    def _fill_overlay(self, color, size=(WIDTH, HEIGHT)):
+        """Translucent flat-colour panel, built once and reused by every menu frame that dims the screen."""
+        key = (size, color)
+        surf = self._fill_overlays.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(color)
+            surf = self._fill_overlays[key] = surf.convert_alpha()
+        return surf
+
+    def _world_label(self, text, color):
+        """Rendered name tag for loot or NPCs; font.render only runs the first time a name is seen."""
+        key = (text, color)
+        surf = self._world_labels.get(key)
+        if surf is None:
+            if len(self._world_labels) >= WORLD_LABEL_CACHE_MAX:
+                self._world_labels.clear()
+            surf = self._world_labels[key] = self.font.render(text, True, color).convert_alpha()
+        return surf
+
+    def _ui_label(self, text, color, big=False):
+        """Rendered HUD or menu string; labels that rarely change (keys, stats, hints) skip font.render."""
+        key = (text, color, big)
+        surf = self._ui_labels.get(key)
+        if surf is None:
+            if len(self._ui_labels) >= UI_LABEL_CACHE_MAX:
+                self._ui_labels.clear()
+            font = self.bigfont if big else self.font
+            surf = self._ui_labels[key] = font.render(text, True, color).convert_alpha()
+        return surf
+
+    def _floating_text_surf(self, text, color, big):
+        """Rendered damage number or callout; repeats like "12" or "CRIT!" skip font.render."""
+        key = (text, color, big)
+        surf = self._floating_text_surfs.get(key)
+        if surf is None:
+            if len(self._floating_text_surfs) >= FLOATING_TEXT_CACHE_MAX:
+                self._floating_text_surfs.clear()
+            font = self.bigfont if big else self.dmgfont
+            surf = self._floating_text_surfs[key] = font.render(text, True, color).convert_alpha()
+        return surf
+
+    def _anim_waves(self):
+        """Sin/cos tables driven only by game_time, computed once per frame and shared by every entity."""
+        gt = self.game_time
+        if self._waves_time == gt:
+            return self._waves
+        sin, cos = math.sin, math.cos
+        wisps = []
+        for i in range(4):
+            ang = gt * 2.5 + i * math.tau / 4
+            wisp_pulse = 0.6 + 0.4 * sin(gt * 2.5 + i * 2)
+            wisps.append((cos(ang), sin(ang), sin(gt * 3 + i) * 3,
+                          (int(120 * wisp_pulse), int(180 * wisp_pulse), int(255 * wisp_pulse))))
+        self._waves = {
+            "s1.5": sin(gt * 1.5), "s2": sin(gt * 2), "s2.5": sin(gt * 2.5),
+            "s3": sin(gt * 3), "s4": sin(gt * 4), "s5": sin(gt * 5), "s6": sin(gt * 6),
+            "portal": [0.7 + 0.3 * sin(gt * 2 + i * 0.8) for i in range(6)],
+            "rags": [8 + int(sin(gt * 2 + i) * 3) for i in range(6)],
+            "wisps": wisps,
+        }
+        self._waves_time = gt
+        return self._waves
 
     def _draw_portals(self, s, ox, oy):
         self.portal_angle += 0.05
-        for ptx, pty, dest_biome in self.dungeon.portal_positions:
+        rng = self._rng
+        waves = self._anim_waves()
+        ring = [(int(math.cos(ang) * 15), int(math.sin(ang) * 15), pulse)
+                for ang, pulse in zip((self.portal_angle + i * (math.tau / 6) for i in range(6)), waves["portal"])]
+        glow = 0.75 + 0.25 * waves["s1.5"]
+        for ptx, pty, dest_biome in self._decor_in_view(self.dungeon.portal_grid):
             if not self._tile_in_view(ptx, pty):
                 continue
             px = ptx * TILE - self.cam_x + ox + TILE // 2
@@ -4389,23 +5337,17 @@ class Game:
             else:
                 next_biome = self.current_biome
             pcol = BIOME_PORTAL_COLORS.get(next_biome, (200, 200, 100))
-            for i in range(6):
-                ang = self.portal_angle + i * (math.tau / 6)
-                r = 15
-                x = px + int(math.cos(ang) * r)
-                y = py + int(math.sin(ang) * r)
-                pulse = 0.7 + 0.3 * math.sin(self.game_time * 2 + i * 0.8)
+            for dx, dy, pulse in ring:
                 col = (int(pcol[0] * pulse * 0.7), int(pcol[1] * pulse * 0.7), int(pcol[2] * pulse * 0.7))
-                pygame.draw.circle(s, col, (x, y), 3)
-            glow = 0.75 + 0.25 * math.sin(self.game_time * 1.5)
+                pygame.draw.circle(s, col, (px + dx, py + dy), 3)
             center_col = (int(pcol[0] * 0.5 * glow), int(pcol[1] * 0.5 * glow), int(pcol[2] * 0.35 * glow))
             pygame.draw.circle(s, center_col, (px, py), 10)
             bright = (min(220, int(pcol[0] * 0.8 * glow)), min(220, int(pcol[1] * 0.8 * glow)),
                       min(220, int(pcol[2] * 0.5 * glow)))
             pygame.draw.circle(s, bright, (px, py), 5)
-            if random.random() < 0.06:
-                angp = random.uniform(0, math.tau)
-                rp = random.uniform(3, 10)
+            if rng.random() < 0.06:
+                angp = rng.uniform(0, math.tau)
+                rp = rng.uniform(3, 10)
                 sparkx = px + self.cam_x - ox + math.cos(angp) * rp
                 sparky = py + self.cam_y - oy + math.sin(angp) * rp
                 self.emit_particles(sparkx, sparky, 1, pcol, speed=12, life=0.5, size=1.2, gravity=-40)
@@ -4420,78 +5362,142 @@ class Game:
                 next_areas = ACT_AREAS.get(self.current_act, ACT_AREAS[1])
                 next_idx = min(self.current_act_level, len(next_areas) - 1)
                 label_text = next_areas[next_idx]
-            label = self.font.render(label_text, True, pcol)
+            if self._portal_label[:2] != (label_text, pcol):
+                self._portal_label = (label_text, pcol, self.font.render(label_text, True, pcol))
+            label = self._portal_label[2]
             s.blit(label, (px - label.get_width() // 2, py - 30))
 
     def _draw_torches(self, s, ox, oy):
-        for tx, ty in self.dungeon.torches:
-            if not self._tile_in_view(tx, ty):
+        vx0, vx1, vy0, vy1 = self._view_bounds
+        rng = self._rng
+        seen = self.dungeon.seen
+        sin = math.sin
+        rect = pygame.draw.rect
+        circle = pygame.draw.circle
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        # Per-frame phase terms of the flame flicker and sway; only the per-torch offsets vary below
+        flicker_t = self.game_time * 2.5
+        sway_t = self.game_time * 3.5
+        for tx, ty in self._decor_in_view(self.dungeon.torch_grid):
+            if not (vx0 <= tx <= vx1 and vy0 <= ty <= vy1):
                 continue
-            if not self.dungeon.seen[tx][ty]:
+            if not seen[tx, ty]:
                 continue
-            px = tx * TILE - self.cam_x + ox + TILE // 2
-            py = ty * TILE - self.cam_y + oy + TILE // 2
-            pygame.draw.rect(s, (60, 42, 22), (px - 3, py, 6, 11))
-            pygame.draw.rect(s, (90, 70, 40), (px - 3, py + 3, 6, 2))
-            flicker = 0.7 + 0.3 * math.sin(self.game_time * 2.5 + tx * 1.7 + ty * 0.9)
-            sway = math.sin(self.game_time * 3.5 + tx * 1.3 + ty * 0.7) * 0.8
-            cx = px + int(sway)
+            px = tx * TILE - cam_x + TILE // 2
+            py = ty * TILE - cam_y + TILE // 2
+            rect(s, (60, 42, 22), (px - 3, py, 6, 11))
+            rect(s, (90, 70, 40), (px - 3, py + 3, 6, 2))
+            flicker = 0.7 + 0.3 * sin(flicker_t + tx * 1.7 + ty * 0.9)
+            cx = px + int(sin(sway_t + tx * 1.3 + ty * 0.7) * 0.8)
             fr = int(210 * flicker)
             fg = int(130 * flicker)
             fb = int(30 * flicker)
-            pygame.draw.circle(s, (fr, fg, fb), (cx, py - 3), 5)
-            pygame.draw.circle(s, (min(255, fr + 30), min(255, fg + 40), fb + 15), (cx, py - 5), 3)
-            pygame.draw.circle(s, (240, 220, 160), (cx, py - 5), 1)
-            if random.random() < 0.06:
-                self.emit_fire(px + self.cam_x - ox, py - 4 + self.cam_y - oy, 1)
+            circle(s, (fr, fg, fb), (cx, py - 3), 5)
+            circle(s, (min(255, fr + 30), min(255, fg + 40), fb + 15), (cx, py - 5), 3)
+            circle(s, (240, 220, 160), (cx, py - 5), 1)
+            if rng.random() < 0.06:
+                self.emit_fire(px + cam_x, py - 4 + cam_y, 1)
+
+    def _corpses_in_view(self):
+        """Corpses in grid cells overlapping the screen, in death order; the grid is rebuilt when the version moves."""
+        if self._corpse_version != self._corpse_grid_key:
+            grid = {}
+            for i, c in enumerate(self.corpses):
+                grid.setdefault((int(c.x) >> ENEMY_GRID_SHIFT, int(c.y) >> ENEMY_GRID_SHIFT), []).append((i, c))
+            self._corpse_grid = grid
+            self._corpse_grid_key = self._corpse_version
+        half = max(WIDTH, HEIGHT) // 2 + 40
+        visible = sorted(_grid_query(self._corpse_grid, self.cam_x + WIDTH // 2, self.cam_y + HEIGHT // 2, half))
+        return [c for _, c in visible]
+
+    def _blob(self, color, radius):
+        """Filled circle sprite, blitted at (x - radius, y - radius) to match draw.circle at (x, y)."""
+        key = (color, radius)
+        surf = self._blobs.get(key)
+        if surf is None:
+            if len(self._blobs) >= BLOB_CACHE_MAX:
+                self._blobs.clear()
+            surf = pygame.Surface((radius * 2, radius * 2))
+            key_col = (255, 0, 255) if color != (255, 0, 255) else (0, 255, 0)
+            surf.fill(key_col)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            surf.set_colorkey(key_col)
+            surf = self._blobs[key] = surf.convert()
+        return surf
 
     def _draw_corpses(self, s, ox, oy):
-        for c in self.corpses:
+        batch = []
+        for c in self._corpses_in_view():
             sx = int(c.x - self.cam_x + ox)
             sy = int(c.y - self.cam_y + oy)
             if -40 < sx < WIDTH + 40 and -40 < sy < HEIGHT + 40:
-                alpha = min(1.0, c.life / 2.0)
+                # Fade in CORPSE_FADE_STEPS levels so the faded blobs can be cached
+                alpha = math.ceil(min(1.0, c.life / 2.0) * CORPSE_FADE_STEPS) / CORPSE_FADE_STEPS
                 r = max(0, int(c.color[0] * alpha * 0.4))
                 g = max(0, int(c.color[1] * alpha * 0.4))
                 b = max(0, int(c.color[2] * alpha * 0.4))
                 rad = int(c.radius * (0.8 + 0.2 * alpha))
-                pygame.draw.circle(s, (r, g, b), (sx, sy), rad)
-
-    def _draw_hazard_pools(self, s, ox, oy):
-        hazard = BIOME_HAZARD.get(self.current_biome, "poison")
-        for ppx, ppy in self.dungeon.hazard_pools:
-            if not self._tile_in_view(ppx, ppy):
-                continue
-            if not self.dungeon.seen[ppx][ppy]:
-                continue
-            px = ppx * TILE - self.cam_x + ox + TILE // 2
-            py = ppy * TILE - self.cam_y + oy + TILE // 2
-            pulse = 0.6 + 0.4 * math.sin(self.game_time * 2 + ppx * 0.7)
-            r = int(TILE * 0.8)
+                if rad > 0:
+                    batch.append((self._blob((r, g, b), rad), (sx - rad, sy - rad)))
+        s.blits(batch, doreturn=False)
+
+    def _hazard_pool_frames(self, hazard):
+        """Pre-render the pulsing pool surface for each phase of a hazard kind."""
+        frames = self._hazard_frames.get(hazard)
+        if frames is not None:
+            return frames
+        r = int(TILE * 0.8)
+        frames = []
+        for i in range(HAZARD_FRAMES):
+            pulse = 0.6 + 0.4 * math.sin(math.tau * i / HAZARD_FRAMES)
             pool_surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
             if hazard == "lava":
                 pygame.draw.ellipse(pool_surf, (80, int(30 * pulse), 5, 140), (0, 4, r * 2, r * 2 - 8))
                 pygame.draw.ellipse(pool_surf, (120, int(50 * pulse), 10, 100), (4, 8, r * 2 - 8, r * 2 - 16))
-                bubble_col = (255, 120, 20)
             elif hazard == "ice":
                 pygame.draw.ellipse(pool_surf, (20, int(60 * pulse), int(100 * pulse), 120), (0, 4, r * 2, r * 2 - 8))
                 pygame.draw.ellipse(pool_surf, (40, int(80 * pulse), int(140 * pulse), 80), (4, 8, r * 2 - 8, r * 2 - 16))
-                bubble_col = (140, 200, 255)
             else:  # poison
                 pygame.draw.ellipse(pool_surf, (30, int(80 * pulse), 20, 120), (0, 4, r * 2, r * 2 - 8))
                 pygame.draw.ellipse(pool_surf, (40, int(120 * pulse), 30, 80), (4, 8, r * 2 - 8, r * 2 - 16))
-                bubble_col = (60, 180, 40)
-            s.blit(pool_surf, (px - r, py - r))
-            if random.random() < 0.04:
-                bx = px + random.randint(-10, 10)
-                by = py + random.randint(-6, 6)
-                pygame.draw.circle(s, bubble_col, (bx, by), random.randint(1, 3))
-            if hazard == "lava" and random.random() < 0.03:
-                self.emit_fire(px + self.cam_x - ox + random.randint(-10, 10),
-                               py + self.cam_y - oy + random.randint(-10, 10), 1)
+            frames.append(pool_surf.convert_alpha())
+        self._hazard_frames[hazard] = frames
+        return frames
+
+    def _draw_hazard_pools(self, s, ox, oy):
+        hazard = BIOME_HAZARD.get(self.current_biome, "poison")
+        frames = self._hazard_pool_frames(hazard)
+        bubble_col = HAZARD_BUBBLE_COLORS.get(hazard, HAZARD_BUBBLE_COLORS["poison"])
+        phase_scale = HAZARD_FRAMES / math.tau
+        rng = self._rng
+        r = int(TILE * 0.8)
+        vx0, vx1, vy0, vy1 = self._view_bounds
+        batch = []
+        for ppx, ppy in self._decor_in_view(self.dungeon.hazard_grid):
+            if not (vx0 <= ppx <= vx1 and vy0 <= ppy <= vy1):
+                continue
+            if not self.dungeon.seen[ppx, ppy]:
+                continue
+            px = ppx * TILE - self.cam_x + ox + TILE // 2
+            py = ppy * TILE - self.cam_y + oy + TILE // 2
+            phase = int((self.game_time * 2 + ppx * 0.7) * phase_scale) % HAZARD_FRAMES
+            batch.append((frames[phase], (px - r, py - r)))
+            if rng.random() < 0.04:
+                bx = px + rng.randint(-10, 10)
+                by = py + rng.randint(-6, 6)
+                br = rng.randint(1, 3)
+                batch.append((self._blob(bubble_col, br), (bx - br, by - br)))
+            if hazard == "lava" and rng.random() < 0.03:
+                self.emit_fire(px + self.cam_x - ox + rng.randint(-10, 10),
+                               py + self.cam_y - oy + rng.randint(-10, 10), 1)
+        s.blits(batch, doreturn=False)
 
     def _draw_chests(self, s, ox, oy):
-        for chest in self.chests:
+        flash = self._chest_hit_flash
+        chests = self.chests
+        for ci in self._breakables_in_view(self.cam_x - ox, self.cam_y - oy, TILE)[0]:
+            chest = chests[ci]
             if not chest.alive:
                 continue
             cx = int(chest.pos.x - self.cam_x + ox)
@@ -4501,11 +5507,9 @@ class Game:
             # Shadow
             pygame.draw.ellipse(s, (8, 6, 10), (cx - 17, cy + 14, 34, 11))
             # Chest sprite
-            if chest.hit_flash > 0:
+            if flash[ci] > 0:
                 # Flash white on hit
-                flash_surf = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
-                flash_surf.fill((255, 255, 255, 110))
-                s.blit(flash_surf, (cx - TILE // 2, cy - TILE // 2))
+                s.blit(self.hit_flash_surf, (cx - TILE // 2, cy - TILE // 2))
             else:
                 surf = self.gold_chest_surf if chest.kind == "gold" else self.chest_surf
                 s.blit(surf, (cx - TILE // 2, cy - TILE // 2))
@@ -4515,7 +5519,10 @@ class Game:
                 pygame.draw.rect(s, (200, 180, 80), (pip_x, cy - TILE // 2 - 8, 8, 5))
 
     def _draw_crates(self, s, ox, oy):
-        for crate in self.crates:
+        flash = self._crate_hit_flash
+        crates = self.crates
+        for ci in self._breakables_in_view(self.cam_x - ox, self.cam_y - oy, TILE)[1]:
+            crate = crates[ci]
             if not crate.alive:
                 continue
             cx = int(crate.pos.x - self.cam_x + ox)
@@ -4525,10 +5532,8 @@ class Game:
             # Shadow
             pygame.draw.ellipse(s, (10, 8, 12), (cx - 14, cy + 12, 28, 8))
             # Crate sprite (or flash)
-            if crate.hit_flash > 0:
-                flash_surf = pygame.Surface((TILE, TILE), pygame.SRCALPHA)
-                flash_surf.fill((255, 255, 255, 110))
-                s.blit(flash_surf, (cx - TILE // 2, cy - TILE // 2))
+            if flash[ci] > 0:
+                s.blit(self.hit_flash_surf, (cx - TILE // 2, cy - TILE // 2))
             else:
                 s.blit(self.crate_surf, (cx - TILE // 2, cy - TILE // 2))
 
@@ -4566,7 +5571,7 @@ class Game:
         pygame.draw.circle(s, (160, 130, 30), (vx + 8, vy - 1), 4, 1)
 
         # Floating name
-        name_txt = self.font.render(v.name, True, C_GOLD)
+        name_txt = self._world_label(v.name, C_GOLD)
         s.blit(name_txt, (vx - name_txt.get_width() // 2, vy - 34))
 
         # Interaction prompt when near
@@ -4579,173 +5584,412 @@ class Game:
             pygame.draw.circle(s, (80, 70, 40), (vx, vy), ring_r, 2)
 
     def _draw_loot(self, s, ox, oy):
-        for l in self.loots:
-            vx = int(l.pos.x - self.cam_x + ox)
-            vy = int(l.pos.y - self.cam_y + oy + math.sin(l.bob_phase) * 4)
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        sin = math.sin
+        draw = pygame.draw
+        circle, rect, line, polygon, arc = draw.circle, draw.rect, draw.line, draw.polygon, draw.arc
+        waves = self._anim_waves()
+        loots = self.loots
+        # 4px of slack for the bob offset; the exact test below still applies
+        for i in _on_screen(loots, cam_x, cam_y, 24):
+            l = loots[i]
+            vx = int(l.pos.x - cam_x)
+            vy = int(l.pos.y - cam_y + sin(l.bob_phase) * 4)
             if not (-20 < vx < WIDTH + 20 and -20 < vy < HEIGHT + 20):
                 continue
             # glow under loot
-            glow_alpha = int(30 + 15 * math.sin(l.bob_phase * 1.5))
+            glow_alpha = int(30 + 15 * sin(l.bob_phase * 1.5))
             if l.weapon:
                 wc = l.weapon.get_color()
                 is_unique = l.weapon.rarity == RARITY_UNIQUE
                 is_set = l.weapon.rarity == RARITY_SET
                 if is_unique or is_set:
-                    aura_pulse = 0.75 + 0.25 * math.sin(self.game_time * 2.5)
-                    aura_r = 20 + int(2 * math.sin(self.game_time * 2))
+                    aura_pulse = 0.75 + 0.25 * waves["s2.5"]
+                    aura_r = 20 + int(2 * waves["s2"])
                     ac = wc if is_unique else (0, 180, 0)
-                    pygame.draw.circle(s, (int(ac[0] * 0.2 * aura_pulse),
+                    circle(s, (int(ac[0] * 0.2 * aura_pulse),
                                            int(ac[1] * 0.2 * aura_pulse),
                                            int(ac[2] * 0.1 * aura_pulse)), (vx, vy), aura_r)
                 glow_c = (min(200, wc[0]//3 + glow_alpha), min(200, wc[1]//3 + glow_alpha), min(200, wc[2]//3))
-                pygame.draw.circle(s, glow_c, (vx, vy), 14)
-                pygame.draw.rect(s, wc, (vx - 8, vy - 8, 16, 16), border_radius=3)
-                pygame.draw.rect(s, (min(255, wc[0]+30), min(255, wc[1]+30), min(255, wc[2]+30)),
+                circle(s, glow_c, (vx, vy), 14)
+                rect(s, wc, (vx - 8, vy - 8, 16, 16), border_radius=3)
+                rect(s, (min(255, wc[0]+30), min(255, wc[1]+30), min(255, wc[2]+30)),
                                  (vx - 8, vy - 8, 16, 16), 1, border_radius=3)
-                wlabel = self.font.render(l.weapon.name, True, wc)
+                wlabel = self._world_label(l.weapon.name, wc)
                 s.blit(wlabel, (vx - wlabel.get_width() // 2, vy - 22))
             elif l.potion_hp:
-                pygame.draw.circle(s, (glow_alpha // 2, 0, 0), (vx, vy), 12)
-                pygame.draw.rect(s, (180, 35, 35), (vx - 6, vy - 6, 12, 12), border_radius=3)
-                pygame.draw.rect(s, (220, 70, 70), (vx - 2, vy - 5, 4, 3))
+                circle(s, (glow_alpha // 2, 0, 0), (vx, vy), 12)
+                rect(s, (180, 35, 35), (vx - 6, vy - 6, 12, 12), border_radius=3)
+                rect(s, (220, 70, 70), (vx - 2, vy - 5, 4, 3))
             elif l.potion_mana:
-                pygame.draw.circle(s, (0, 0, glow_alpha // 2), (vx, vy), 12)
-                pygame.draw.rect(s, (35, 65, 180), (vx - 6, vy - 6, 12, 12), border_radius=3)
-                pygame.draw.rect(s, (70, 100, 220), (vx - 2, vy - 5, 4, 3))
+                circle(s, (0, 0, glow_alpha // 2), (vx, vy), 12)
+                rect(s, (35, 65, 180), (vx - 6, vy - 6, 12, 12), border_radius=3)
+                rect(s, (70, 100, 220), (vx - 2, vy - 5, 4, 3))
             elif l.dmg_boost:
-                pygame.draw.circle(s, (glow_alpha // 2 + 8, glow_alpha // 2, 0), (vx, vy), 12)
-                pygame.draw.circle(s, (210, 140, 35), (vx, vy), 8)
-                pygame.draw.circle(s, (240, 195, 100), (vx, vy), 4)
+                circle(s, (glow_alpha // 2 + 8, glow_alpha // 2, 0), (vx, vy), 12)
+                circle(s, (210, 140, 35), (vx, vy), 8)
+                circle(s, (240, 195, 100), (vx, vy), 4)
             elif l.shield_boost:
-                pygame.draw.circle(s, (0, 0, glow_alpha // 2 + 5), (vx, vy), 12)
-                pygame.draw.circle(s, (65, 170, 215), (vx, vy), 8)
-                pygame.draw.circle(s, (150, 210, 235), (vx, vy), 4)
+                circle(s, (0, 0, glow_alpha // 2 + 5), (vx, vy), 12)
+                circle(s, (65, 170, 215), (vx, vy), 8)
+                circle(s, (150, 210, 235), (vx, vy), 4)
             elif l.infusion:
                 icol = INFUSION_COLORS[l.infusion]
-                pygame.draw.circle(s, (icol[0] // 3, icol[1] // 3, icol[2] // 3), (vx, vy), 16)
-                pygame.draw.circle(s, icol, (vx, vy), 11)
+                circle(s, (icol[0] // 3, icol[1] // 3, icol[2] // 3), (vx, vy), 16)
+                circle(s, icol, (vx, vy), 11)
                 # Arrow symbol inside
-                pygame.draw.line(s, (255, 255, 255), (vx - 5, vy), (vx + 5, vy), 2)
-                pygame.draw.polygon(s, (255, 255, 255), [(vx + 5, vy), (vx + 2, vy - 3), (vx + 2, vy + 3)])
-                ring_pulse = int(2 + 1 * math.sin(self.game_time * 2.5))
-                pygame.draw.circle(s, icol, (vx, vy), 11 + ring_pulse, 1)
+                line(s, (255, 255, 255), (vx - 5, vy), (vx + 5, vy), 2)
+                polygon(s, (255, 255, 255), [(vx + 5, vy), (vx + 2, vy - 3), (vx + 2, vy + 3)])
+                ring_pulse = int(2 + 1 * waves["s2.5"])
+                circle(s, icol, (vx, vy), 11 + ring_pulse, 1)
             elif l.armor or l.helm or l.gloves or l.boots:
                 eq_item = l.armor or l.helm or l.gloves or l.boots
                 ac = eq_item.get_color()
-                pygame.draw.circle(s, (ac[0]//3, ac[1]//3, ac[2]//3), (vx, vy), 16)
-                pygame.draw.rect(s, ac, (vx - 9, vy - 10, 18, 20), border_radius=4)
-                pygame.draw.rect(s, (min(255, ac[0]+40), min(255, ac[1]+40), min(255, ac[2]+40)),
+                circle(s, (ac[0]//3, ac[1]//3, ac[2]//3), (vx, vy), 16)
+                rect(s, ac, (vx - 9, vy - 10, 18, 20), border_radius=4)
+                rect(s, (min(255, ac[0]+40), min(255, ac[1]+40), min(255, ac[2]+40)),
                                  (vx - 9, vy - 10, 18, 20), 1, border_radius=4)
                 # Slot-specific icon hint
                 hi = (min(255, ac[0]+60), min(255, ac[1]+60), min(255, ac[2]+60))
                 if eq_item.slot == "helm":
-                    pygame.draw.arc(s, hi, (vx - 6, vy - 8, 12, 10), 0, math.pi, 2)
+                    arc(s, hi, (vx - 6, vy - 8, 12, 10), 0, math.pi, 2)
                 elif eq_item.slot == "gloves":
-                    pygame.draw.line(s, hi, (vx - 4, vy - 2), (vx + 4, vy - 2), 2)
-                    pygame.draw.line(s, hi, (vx - 4, vy + 2), (vx + 4, vy + 2), 2)
+                    line(s, hi, (vx - 4, vy - 2), (vx + 4, vy - 2), 2)
+                    line(s, hi, (vx - 4, vy + 2), (vx + 4, vy + 2), 2)
                 elif eq_item.slot == "boots":
-                    pygame.draw.line(s, hi, (vx - 5, vy + 3), (vx + 5, vy + 3), 2)
-                    pygame.draw.line(s, hi, (vx + 5, vy + 3), (vx + 5, vy - 3), 2)
+                    line(s, hi, (vx - 5, vy + 3), (vx + 5, vy + 3), 2)
+                    line(s, hi, (vx + 5, vy + 3), (vx + 5, vy - 3), 2)
                 else:
-                    pygame.draw.line(s, hi, (vx - 4, vy - 5), (vx + 4, vy - 5), 2)
-                alabel = self.font.render(eq_item.name, True, ac)
+                    line(s, hi, (vx - 4, vy - 5), (vx + 4, vy - 5), 2)
+                alabel = self._world_label(eq_item.name, ac)
                 s.blit(alabel, (vx - alabel.get_width() // 2, vy - 24))
             elif l.ring or l.amulet:
                 jewel_item = l.ring or l.amulet
                 rc = jewel_item.get_color()
-                pygame.draw.circle(s, (rc[0]//3, rc[1]//3, rc[2]//3), (vx, vy), 13)
-                pygame.draw.circle(s, rc, (vx, vy), 8, 2)
-                pygame.draw.circle(s, (min(255, rc[0]+60), min(255, rc[1]+60), min(255, rc[2]+60)),
+                circle(s, (rc[0]//3, rc[1]//3, rc[2]//3), (vx, vy), 13)
+                circle(s, rc, (vx, vy), 8, 2)
+                circle(s, (min(255, rc[0]+60), min(255, rc[1]+60), min(255, rc[2]+60)),
                                    (vx, vy - 3), 3)
-                rlabel = self.font.render(jewel_item.name, True, rc)
+                rlabel = self._world_label(jewel_item.name, rc)
                 s.blit(rlabel, (vx - rlabel.get_width() // 2, vy - 22))
             elif l.jewel:
                 jc = l.jewel.get_color()
-                pygame.draw.circle(s, (jc[0]//3, jc[1]//3, jc[2]//3), (vx, vy), 13)
+                circle(s, (jc[0]//3, jc[1]//3, jc[2]//3), (vx, vy), 13)
                 # Diamond shape
                 pts = [(vx, vy - 8), (vx + 6, vy), (vx, vy + 8), (vx - 6, vy)]
-                pygame.draw.polygon(s, jc, pts)
-                pygame.draw.polygon(s, (min(255, jc[0]+50), min(255, jc[1]+50), min(255, jc[2]+50)), pts, 1)
-                jlabel = self.font.render(l.jewel.name, True, jc)
+                polygon(s, jc, pts)
+                polygon(s, (min(255, jc[0]+50), min(255, jc[1]+50), min(255, jc[2]+50)), pts, 1)
+                jlabel = self._world_label(l.jewel.name, jc)
                 s.blit(jlabel, (vx - jlabel.get_width() // 2, vy - 22))
             elif l.gold:
-                pygame.draw.circle(s, (glow_alpha // 2 + 5, glow_alpha // 2 + 2, 0), (vx, vy), 9)
-                pygame.draw.circle(s, (220, 190, 0), (vx, vy), 6)
-                pygame.draw.circle(s, (180, 150, 0), (vx, vy), 6, 1)
+                circle(s, (glow_alpha // 2 + 5, glow_alpha // 2 + 2, 0), (vx, vy), 9)
+                circle(s, (220, 190, 0), (vx, vy), 6)
+                circle(s, (180, 150, 0), (vx, vy), 6, 1)
 
     def _draw_projectiles(self, s, ox, oy):
-        for pr in self.projectiles:
-            px = int(pr.pos.x - self.cam_x + ox)
-            py = int(pr.pos.y - self.cam_y + oy)
-            if not (-20 < px < WIDTH + 20 and -20 < py < HEIGHT + 20):
-                continue
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        sin, cos = math.sin, math.cos
+        circle, line, polygon = pygame.draw.circle, pygame.draw.line, pygame.draw.polygon
+        projectiles = self.projectiles
+        for i in _on_screen(projectiles, cam_x, cam_y, 20):
+            pr = projectiles[i]
+            px = int(pr.pos.x - cam_x)
+            py = int(pr.pos.y - cam_y)
             if pr.hostile:
-                pygame.draw.circle(s, (120, 30, 30), (px, py), pr.radius + 3)
-                pygame.draw.circle(s, (255, 100, 110), (px, py), pr.radius)
-                pygame.draw.circle(s, (255, 180, 180), (px, py), max(1, pr.radius - 2))
+                circle(s, (120, 30, 30), (px, py), pr.radius + 3)
+                circle(s, (255, 100, 110), (px, py), pr.radius)
+                circle(s, (255, 180, 180), (px, py), max(1, pr.radius - 2))
             elif pr.is_arrow:
                 # Arrow shaft
                 arrow_len = 14
-                tail_x = px - int(math.cos(pr.angle) * arrow_len)
-                tail_y = py - int(math.sin(pr.angle) * arrow_len)
+                tail_x = px - int(cos(pr.angle) * arrow_len)
+                tail_y = py - int(sin(pr.angle) * arrow_len)
                 # Infusion color or default
                 if pr.infusion:
                     icol = INFUSION_COLORS[pr.infusion]
                     shaft_col = (min(255, icol[0] // 2 + 70), min(255, icol[1] // 2 + 50), min(255, icol[2] // 2 + 40))
                 else:
                     shaft_col = (160, 140, 110)
-                pygame.draw.line(s, shaft_col, (tail_x, tail_y), (px, py), 2)
+                line(s, shaft_col, (tail_x, tail_y), (px, py), 2)
                 # Arrowhead
                 head_len = 7
-                hx = px + int(math.cos(pr.angle) * head_len)
-                hy = py + int(math.sin(pr.angle) * head_len)
+                hx = px + int(cos(pr.angle) * head_len)
+                hy = py + int(sin(pr.angle) * head_len)
                 left_a = pr.angle + 2.6
                 right_a = pr.angle - 2.6
-                lx = px + int(math.cos(left_a) * 5)
-                ly = py + int(math.sin(left_a) * 5)
-                rx = px + int(math.cos(right_a) * 5)
-                ry = py + int(math.sin(right_a) * 5)
+                lx = px + int(cos(left_a) * 5)
+                ly = py + int(sin(left_a) * 5)
+                rx = px + int(cos(right_a) * 5)
+                ry = py + int(sin(right_a) * 5)
                 head_col = (200, 190, 170) if not pr.infusion else icol
-                pygame.draw.polygon(s, head_col, [(hx, hy), (lx, ly), (rx, ry)])
+                polygon(s, head_col, [(hx, hy), (lx, ly), (rx, ry)])
                 # Fletching
                 fl = pr.angle + math.pi
                 for fa in (fl + 0.4, fl - 0.4):
-                    fx = tail_x + int(math.cos(fa) * 5)
-                    fy = tail_y + int(math.sin(fa) * 5)
-                    pygame.draw.line(s, (120, 100, 80), (tail_x, tail_y), (fx, fy), 1)
+                    fx = tail_x + int(cos(fa) * 5)
+                    fy = tail_y + int(sin(fa) * 5)
+                    line(s, (120, 100, 80), (tail_x, tail_y), (fx, fy), 1)
                 # Infusion glow
                 if pr.infusion:
-                    pygame.draw.circle(s, (*icol, ), (px, py), pr.radius + 3, 2)
+                    circle(s, (*icol, ), (px, py), pr.radius + 3, 2)
             else:
-                pygame.draw.circle(s, (40, 60, 100), (px, py), pr.radius + 2)
-                pygame.draw.circle(s, (140, 200, 255), (px, py), pr.radius)
-                pygame.draw.circle(s, (220, 240, 255), (px, py), max(1, pr.radius - 1))
+                circle(s, (40, 60, 100), (px, py), pr.radius + 2)
+                circle(s, (140, 200, 255), (px, py), pr.radius)
+                circle(s, (220, 240, 255), (px, py), max(1, pr.radius - 1))
         # Draw lightning chains
         for start, end, life in self.lightning_chains:
             if life > 0:
-                sx = int(start.x - self.cam_x + ox)
-                sy = int(start.y - self.cam_y + oy)
-                ex = int(end.x - self.cam_x + ox)
-                ey = int(end.y - self.cam_y + oy)
+                sx = int(start.x - cam_x)
+                sy = int(start.y - cam_y)
+                ex = int(end.x - cam_x)
+                ey = int(end.y - cam_y)
                 alpha = min(1.0, life / 0.15)
                 col = (int(255 * alpha), int(255 * alpha), int(100 * alpha))
-                # Jagged lightning line
-                points = [(sx, sy)]
+                # Jagged lightning line: all midpoints and their +/-8px jitter in one NumPy pass
                 dx, dy = ex - sx, ey - sy
                 steps = max(3, int(math.sqrt(dx * dx + dy * dy) / 20))
-                for i in range(1, steps):
-                    t = i / steps
-                    mx = int(sx + dx * t + random.randint(-8, 8))
-                    my = int(sy + dy * t + random.randint(-8, 8))
-                    points.append((mx, my))
-                points.append((ex, ey))
-                if len(points) >= 2:
-                    pygame.draw.lines(s, col, False, points, 2)
+                t = np.arange(1, steps) / steps
+                jitter = np.floor(self._rng.take(2 * (steps - 1)) * 17) - 8
+                mx = (sx + dx * t + jitter[:steps - 1]).astype(np.int32)
+                my = (sy + dy * t + jitter[steps - 1:]).astype(np.int32)
+                points = [(sx, sy)] + list(zip(mx.tolist(), my.tolist())) + [(ex, ey)]
+                pygame.draw.lines(s, col, False, points, 2)
+
+    def _enemy_body_sprite(self, kind, radius, flash):
+        """Shadow and static body of a skeleton, fallen or spider (kinds 0-2), cached per size and flash."""
+        key = (kind, radius, flash)
+        surf = self._enemy_sprites.get(key)
+        if surf is not None:
+            return surf
+        half = max(radius + 16, 32)
+        s = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        ex = ey = half
+        pygame.draw.ellipse(s, (8, 6, 10), (ex - radius, ey + radius - 6, radius * 2, 11))
+        if kind == 0:
+            bone = (220, 210, 180) if not flash else (255, 255, 255)
+            bone_dk = (170, 155, 120) if not flash else (240, 240, 240)
+            # Ribcage body
+            pygame.draw.ellipse(s, bone_dk, (ex - radius + 1, ey - 2,
+                                radius * 2 - 2, radius + 8))
+            for ry in range(0, radius + 4, 3):
+                rw = max(2, radius - abs(ry - radius // 2))
+                pygame.draw.line(s, bone, (ex - rw, ey + ry), (ex + rw, ey + ry), 1)
+            # Skull (on top)
+            pygame.draw.circle(s, bone, (ex, ey - 6), radius - 3)
+            pygame.draw.circle(s, bone_dk, (ex, ey - 6), radius - 5)
+            pygame.draw.circle(s, bone, (ex, ey - 6), radius - 6)
+            # Eye sockets (dark pits)
+            pygame.draw.circle(s, (10, 5, 5), (ex - 5, ey - 7), 4)
+            pygame.draw.circle(s, (10, 5, 5), (ex + 5, ey - 7), 4)
+            # Nose cavity
+            pygame.draw.polygon(s, (10, 5, 5), [(ex, ey - 2), (ex - 2, ey + 1), (ex + 2, ey + 1)])
+            # Teeth
+            for tx in range(-6, 7, 2):
+                pygame.draw.rect(s, bone, (ex + tx, ey + 2, 2, 3))
+            # Arm bones holding sword
+            pygame.draw.line(s, bone_dk, (ex + radius - 2, ey), (ex + radius + 8, ey + 12), 2)
+            pygame.draw.line(s, (140, 140, 160), (ex + radius + 6, ey + 4), (ex + radius + 6, ey + 18), 2)
+            # Shield on other arm
+            pygame.draw.rect(s, (80, 70, 50), (ex - radius - 6, ey - 4, 8, 12), border_radius=2)
+            pygame.draw.rect(s, (120, 100, 60), (ex - radius - 6, ey - 4, 8, 12), 1, border_radius=2)
+        elif kind == 2:
+            sp = (50, 40, 60) if not flash else (255, 255, 255)
+            sp_lt = (70, 55, 80) if not flash else (240, 240, 240)
+            # Segmented body (abdomen + cephalothorax)
+            pygame.draw.ellipse(s, sp, (ex - radius + 2, ey - 2, radius * 2 - 4, radius + 8))
+            pygame.draw.circle(s, sp_lt, (ex, ey - 5), radius - 5)
+            # Hourglass marking
+            pygame.draw.polygon(s, (200, 30, 30), [
+                (ex, ey + 1), (ex - 3, ey + 5), (ex, ey + 9), (ex + 3, ey + 5)])
+            # Pattern on abdomen
+            pygame.draw.line(s, (80, 65, 100), (ex - 4, ey + 4), (ex + 4, ey + 4), 1)
+            pygame.draw.line(s, (80, 65, 100), (ex - 3, ey + 7), (ex + 3, ey + 7), 1)
+            # Cluster of red eyes (the legs are drawn live and never reach the face)
+            for dx, dy in [(-5, -8), (-2, -10), (2, -10), (5, -8), (-3, -6), (3, -6)]:
+                pygame.draw.circle(s, (180, 0, 0), (ex + dx, ey + dy), 2)
+                pygame.draw.circle(s, (255, 100, 100), (ex + dx, ey + dy), 1)
+            # Venomous chelicerae
+            pygame.draw.line(s, (140, 200, 80), (ex - 4, ey - 2), (ex - 7, ey + 7), 2)
+            pygame.draw.line(s, (140, 200, 80), (ex + 4, ey - 2), (ex + 7, ey + 7), 2)
+        else:
+            dc = (180, 40, 30) if not flash else (255, 255, 255)
+            dd = (120, 20, 15) if not flash else (240, 240, 240)
+            # Bulky muscular body
+            pygame.draw.circle(s, dd, (ex, ey + 2), radius + 2)
+            pygame.draw.circle(s, dc, (ex, ey + 2), radius)
+            # Lighter belly
+            pygame.draw.ellipse(s, (min(255, dc[0] + 40), min(255, dc[1] + 15), dc[2]),
+                               (ex - radius + 5, ey, radius * 2 - 10, radius))
+            # Curved horns
+            horn = (90, 75, 45)
+            pygame.draw.polygon(s, horn, [
+                (ex - 9, ey - 10), (ex - 20, ey - 28), (ex - 15, ey - 25), (ex - 5, ey - 8)])
+            pygame.draw.polygon(s, horn, [
+                (ex + 9, ey - 10), (ex + 20, ey - 28), (ex + 15, ey - 25), (ex + 5, ey - 8)])
+            # Slanted angry eyes
+            pygame.draw.line(s, (200, 160, 30), (ex - 9, ey - 6), (ex - 3, ey - 3), 3)
+            pygame.draw.line(s, (200, 160, 30), (ex + 3, ey - 3), (ex + 9, ey - 6), 3)
+            pygame.draw.circle(s, (220, 200, 60), (ex - 6, ey - 4), 2)
+            pygame.draw.circle(s, (220, 200, 60), (ex + 6, ey - 4), 2)
+            # Fanged snarling mouth
+            pygame.draw.arc(s, (50, 10, 10), (ex - 7, ey + 2, 14, 10), 3.14, 6.28, 2)
+            pygame.draw.polygon(s, (255, 240, 200), [(ex - 5, ey + 5), (ex - 4, ey + 10), (ex - 3, ey + 5)])
+            pygame.draw.polygon(s, (255, 240, 200), [(ex + 3, ey + 5), (ex + 4, ey + 10), (ex + 5, ey + 5)])
+            # Spiky tail
+            pygame.draw.line(s, dd, (ex, ey + radius), (ex - 12, ey + radius + 8), 2)
+            pygame.draw.circle(s, dc, (ex - 14, ey + radius + 8), 3)
+        s = self._enemy_sprites[key] = s.convert_alpha()
+        return s
+
+    def _draw_skeleton_eyes(self, s, e, ex, ey):
+        """Animated red pupils drawn over a cached skeleton body."""
+        glow = 0.75 + 0.25 * math.sin(self.game_time * 2 + e.pos.x * 0.1)
+        eye_r = int(200 * glow)
+        pygame.draw.circle(s, (eye_r, 20, 10), (ex - 5, ey - 7), 2)
+        pygame.draw.circle(s, (eye_r, 20, 10), (ex + 5, ey - 7), 2)
+
+    def _wraith_sprite(self, radius, flash):
+        """Shadow and animated body of a wraith; every wraith follows game_time, so one render per frame is shared."""
+        entry = self._wraith_frames.get((radius, flash))
+        if entry is None:
+            half = max(radius + 16, 40)
+            surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA).convert_alpha()
+            entry = self._wraith_frames[(radius, flash)] = [None, surf]
+        if entry[0] == self.game_time:
+            return entry[1]
+        s = entry[1]
+        s.fill((0, 0, 0, 0))
+        waves = self._anim_waves()
+        ex = ey = s.get_width() // 2
+        pygame.draw.ellipse(s, (8, 6, 10), (ex - radius, ey + radius - 6, radius * 2, 11))
+        float_ofs = waves["s3"] * 4
+        wy = ey + int(float_ofs)
+        # Tattered robe bottom (ragged edges)
+        pulse = 0.6 + 0.4 * waves["s4"]
+        robe_col = (int(60 * pulse), int(30 * pulse), int(120 * pulse))
+        if flash:
+            robe_col = (255, 255, 255)
+        for i, rag_len in enumerate(waves["rags"]):
+            rag_x = ex - 10 + i * 4
+            pygame.draw.line(s, robe_col, (rag_x, wy + 6), (rag_x, wy + 6 + rag_len), 2)
+        # Spectral body - layered translucent robes
+        body_col_w = (int(70 * pulse), int(35 * pulse), int(130 * pulse))
+        if flash:
+            body_col_w = (255, 255, 255)
+        pygame.draw.ellipse(s, body_col_w, (ex - radius, wy - 4, radius * 2, radius + 10))
+        inner_col = (int(90 * pulse), int(50 * pulse), int(160 * pulse))
+        if flash:
+            inner_col = (255, 255, 255)
+        pygame.draw.ellipse(s, inner_col, (ex - radius + 3, wy - 2, radius * 2 - 6, radius + 4))
+        # Hooded cowl
+        hood_col = (int(50 * pulse), int(25 * pulse), int(100 * pulse))
+        if flash:
+            hood_col = (255, 255, 255)
+        pygame.draw.arc(s, hood_col, (ex - 10, wy - 16, 20, 18), 0, math.pi, 4)
+        pygame.draw.ellipse(s, hood_col, (ex - 10, wy - 18, 20, 14))
+        # Glowing eyes deep in hood
+        pygame.draw.circle(s, (180, 160, 255), (ex - 5, wy - 10), 3)
+        pygame.draw.circle(s, (180, 160, 255), (ex + 5, wy - 10), 3)
+        pygame.draw.circle(s, (255, 240, 255), (ex - 5, wy - 10), 1)
+        pygame.draw.circle(s, (255, 240, 255), (ex + 5, wy - 10), 1)
+        # Orbiting soul wisps
+        for wcos, wsin, wobble, wisp_col in waves["wisps"]:
+            dist = radius + 8 + wobble
+            sx = ex + int(wcos * dist)
+            sy = wy + int(wsin * (dist * 0.6))
+            pygame.draw.circle(s, wisp_col, (sx, sy), 3)
+            pygame.draw.circle(s, (200, 220, 255), (sx, sy), 1)
+        # Spectral trail behind
+        for i in range(4):
+            t_alpha = 0.25 - i * 0.05
+            t_col = (int(80 * t_alpha), int(40 * t_alpha), int(140 * t_alpha))
+            trail_y = wy + 10 + i * 5
+            trail_w = radius - i * 2
+            if trail_w > 0:
+                pygame.draw.ellipse(s, t_col, (ex - trail_w, trail_y, trail_w * 2, 4))
+        entry[0] = self.game_time
+        return s
+
+    def _enemy_sprite(self, kind, radius, flash):
+        """Cached shadow + body Surface for any kind in ENEMY_SPRITE_KINDS, centred on the enemy."""
+        if kind == 3:
+            return self._wraith_sprite(radius, flash)
+        return self._enemy_body_sprite(kind, radius, flash)
+
+    def _draw_spider_legs(self, s, e, ex, ey):
+        """Animated legs and venom drip drawn over a cached spider body."""
+        sp = (50, 40, 60) if e.hit_flash <= 0 else (255, 255, 255)
+        walk = math.sin(self.game_time * 8 + e.pos.x * 0.05) * 3
+        line = pygame.draw.line
+        for i, ang in enumerate([-0.8, -0.4, 0.1, 0.5]):
+            ofs = walk if i % 2 == 0 else -walk
+            lx1 = ex - e.radius + 2
+            ly1 = ey + int(ang * 12) + int(ofs)
+            lx2 = lx1 - 14
+            ly2 = ly1 + 7
+            line(s, sp, (lx1, ly1), (lx2, ly2), 2)
+            line(s, sp, (lx2, ly2), (lx2 - 5, ly2 + 6), 2)
+            rx1 = ex + e.radius - 2
+            rx2 = rx1 + 14
+            line(s, sp, (rx1, ly1), (rx2, ly2), 2)
+            line(s, sp, (rx2, ly2), (rx2 + 5, ly2 + 6), 2)
+        rng = self._rng
+        if rng.random() < 0.08:
+            pygame.draw.circle(s, (80, 160, 50), (ex + (7 if rng.random() < 0.5 else -7), ey + 9), 1)
+
+    def _draw_enemy_hp_bar(self, s, e, ex, ey, ratio):
+        """HP bar above a damaged enemy."""
+        bar_w = e.radius * 2 + 8
+        bar_h = 5
+        bar_x = ex - bar_w // 2
+        bar_y = ey - e.radius - 14
+        pygame.draw.rect(s, (20, 15, 15), (bar_x - 1, bar_y - 1, bar_w + 2, bar_h + 2))
+        pygame.draw.rect(s, (60, 20, 20), (bar_x, bar_y, bar_w, bar_h))
+        fill_w = int(bar_w * ratio)
+        if ratio > 0.5:
+            bar_col = (60, 180, 60)
+        elif ratio > 0.25:
+            bar_col = (200, 160, 40)
+        else:
+            bar_col = (200, 40, 40)
+        pygame.draw.rect(s, bar_col, (bar_x, bar_y, fill_w, bar_h))
 
     def _draw_enemies(self, s, ox, oy):
-        for e in self.enemies:
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        sprite_for = self._enemy_sprite
+        batch = []
+        plain = []
+        others = []
+        enemies = self.enemies
+        for i in _on_screen(enemies, cam_x, cam_y, 40):
+            e = enemies[i]
             if not e.alive:
                 continue
+            # Plain minions have no aura or crown under the body, so one batched blit covers them
+            if (e.kind in ENEMY_SPRITE_KINDS and e.kind_flags == KIND_NORMAL and e.mult_speed <= 1.0
+                    and e.mult_damage <= 1.0 and e.mult_taken >= 1.0):
+                ex = int(e.pos.x - cam_x)
+                ey = int(e.pos.y - cam_y)
+                sprite = sprite_for(e.kind, e.radius, e.hit_flash > 0)
+                half = sprite.get_width() // 2
+                batch.append((sprite, (ex - half, ey - half)))
+                plain.append((e, ex, ey))
+            else:
+                others.append(e)
+        if batch:
+            s.blits(batch, False)
+        for e, ex, ey in plain:
+            if e.kind == 0:
+                self._draw_skeleton_eyes(s, e, ex, ey)
+            elif e.kind == 2:
+                self._draw_spider_legs(s, e, ex, ey)
+            ratio = max(0.0, min(1.0, e.hp / max(1, e.max_hp)))
+            if ratio < 1.0:
+                self._draw_enemy_hp_bar(s, e, ex, ey, ratio)
+        for e in others:
             self._draw_single_enemy(s, e, ox, oy)
 
     def _draw_single_enemy(self, s, e, ox, oy):
@@ -4753,21 +5997,24 @@ class Game:
         ey = int(e.pos.y - self.cam_y + oy)
         if not (-40 < ex < WIDTH + 40 and -40 < ey < HEIGHT + 40):
             return
+        sin = math.sin
+        waves = self._anim_waves()
         ratio = max(0.0, min(1.0, e.hp / max(1, e.max_hp)))
 
-        # Shadow
-        pygame.draw.ellipse(s, (8, 6, 10), (ex - e.radius, ey + e.radius - 6, e.radius * 2, 11))
+        # Shadow (baked into the cached body sprite for the sprite kinds)
+        if e.kind not in ENEMY_SPRITE_KINDS or e.kind_flags & KIND_BOSS:
+            pygame.draw.ellipse(s, (8, 6, 10), (ex - e.radius, ey + e.radius - 6, e.radius * 2, 11))
 
         # Aura ring for buffed minions
         if e.mult_speed > 1.0 or e.mult_damage > 1.0 or e.mult_taken < 1.0:
-            pulse = 0.6 + 0.4 * math.sin(self.game_time * 4)
+            pulse = 0.6 + 0.4 * waves["s4"]
             ac = (int(180 * pulse), int(160 * pulse), int(220 * pulse))
             pygame.draw.circle(s, ac, (ex, ey), e.radius + 7, 3)
 
         # Elite aura effect
-        if isinstance(e, Elite):
+        if e.kind_flags & KIND_ELITE:
             aura_col = AURAS[e.aura]["color"]
-            pulse = 0.5 + 0.5 * math.sin(e.aura_pulse)
+            pulse = 0.5 + 0.5 * sin(e.aura_pulse)
             r = int(aura_col[0] * pulse * 0.5)
             g = int(aura_col[1] * pulse * 0.5)
             b = int(aura_col[2] * pulse * 0.5)
@@ -4779,8 +6026,8 @@ class Game:
             pygame.draw.polygon(s, crown_col, pts)
             pygame.draw.polygon(s, (200, 160, 60), pts, 1)
 
-        if isinstance(e, Boss) and getattr(e, 'is_uber', False):
-            uber_pulse = 0.7 + 0.3 * math.sin(self.game_time * 3)
+        if e.kind_flags & KIND_BOSS and e.is_uber:
+            uber_pulse = 0.7 + 0.3 * waves["s3"]
             pygame.draw.circle(s, (int(80 * uber_pulse), 12, int(80 * uber_pulse)),
                                (ex, ey), e.radius + 16, 3)
             horn_col = (int(100 * uber_pulse), int(30 * uber_pulse), int(100 * uber_pulse))
@@ -4792,7 +6039,7 @@ class Game:
         # Body - D2R creature sprites (natural colors, HP bar shows health)
         flash = e.hit_flash > 0
 
-        if isinstance(e, Boss):
+        if e.kind_flags & KIND_BOSS:
             # Boss: massive armored demon lord
             bc = (135, 25, 20) if not flash else (240, 240, 240)
             bd = (85, 12, 8) if not flash else (220, 220, 220)
@@ -4819,7 +6066,7 @@ class Game:
             for tx in [-8, -4, 0, 4, 8]:
                 pygame.draw.line(s, (255, 240, 200), (ex + tx, ey + 6), (ex + tx, ey + 11), 1)
         elif e.kind == 4:  # Treasure Goblin
-            shimmer = 0.8 + 0.2 * math.sin(self.game_time * 3)
+            shimmer = 0.8 + 0.2 * waves["s3"]
             gcol = (int(255 * shimmer), int(215 * shimmer), int(40 * shimmer))
             # Hunched body
             pygame.draw.ellipse(s, (120, 100, 40), (ex - e.radius, ey - 2, e.radius * 2, e.radius + 4))
@@ -4842,168 +6089,22 @@ class Game:
             # Grinning mouth
             pygame.draw.arc(s, (80, 40, 20), (ex - 5, ey - 1, 10, 6), 3.14, 6.28, 1)
             # Timer arc
-            if isinstance(e, TreasureGoblin):
+            if e.kind_flags & KIND_GOBLIN:
                 timer_frac = max(0, e.portal_timer / GOBLIN_DESPAWN_TIME)
                 if timer_frac < 1.0:
                     pygame.draw.arc(s, C_GOLD, (ex - e.radius - 4, ey - e.radius - 4,
                                     (e.radius + 4) * 2, (e.radius + 4) * 2),
                                     0, math.tau * timer_frac, 2)
         else:
-            # --- Kind 0: SKELETON WARRIOR - D2R bony undead with weapon ---
-            if e.kind == 0:
-                bone = (220, 210, 180) if not flash else (255, 255, 255)
-                bone_dk = (170, 155, 120) if not flash else (240, 240, 240)
-                # Ribcage body
-                pygame.draw.ellipse(s, bone_dk, (ex - e.radius + 1, ey - 2,
-                                    e.radius * 2 - 2, e.radius + 8))
-                for ry in range(0, e.radius + 4, 3):
-                    rw = max(2, e.radius - abs(ry - e.radius // 2))
-                    pygame.draw.line(s, bone, (ex - rw, ey + ry), (ex + rw, ey + ry), 1)
-                # Skull (on top)
-                pygame.draw.circle(s, bone, (ex, ey - 6), e.radius - 3)
-                pygame.draw.circle(s, bone_dk, (ex, ey - 6), e.radius - 5)
-                pygame.draw.circle(s, bone, (ex, ey - 6), e.radius - 6)
-                # Eye sockets (dark pits)
-                pygame.draw.circle(s, (10, 5, 5), (ex - 5, ey - 7), 4)
-                pygame.draw.circle(s, (10, 5, 5), (ex + 5, ey - 7), 4)
-                # Glowing red pupils
-                glow = 0.75 + 0.25 * math.sin(self.game_time * 2 + e.pos.x * 0.1)
-                eye_r = int(200 * glow)
-                pygame.draw.circle(s, (eye_r, 20, 10), (ex - 5, ey - 7), 2)
-                pygame.draw.circle(s, (eye_r, 20, 10), (ex + 5, ey - 7), 2)
-                # Nose cavity
-                pygame.draw.polygon(s, (10, 5, 5), [(ex, ey - 2), (ex - 2, ey + 1), (ex + 2, ey + 1)])
-                # Teeth
-                for tx in range(-6, 7, 2):
-                    pygame.draw.rect(s, bone, (ex + tx, ey + 2, 2, 3))
-                # Arm bones holding sword
-                pygame.draw.line(s, bone_dk, (ex + e.radius - 2, ey), (ex + e.radius + 8, ey + 12), 2)
-                pygame.draw.line(s, (140, 140, 160), (ex + e.radius + 6, ey + 4), (ex + e.radius + 6, ey + 18), 2)
-                # Shield on other arm
-                pygame.draw.rect(s, (80, 70, 50), (ex - e.radius - 6, ey - 4, 8, 12), border_radius=2)
-                pygame.draw.rect(s, (120, 100, 60), (ex - e.radius - 6, ey - 4, 8, 12), 1, border_radius=2)
-
-            # --- Kind 1: FALLEN DEMON - D2R red horned creature ---
-            elif e.kind == 1:
-                dc = (180, 40, 30) if not flash else (255, 255, 255)
-                dd = (120, 20, 15) if not flash else (240, 240, 240)
-                # Bulky muscular body
-                pygame.draw.circle(s, dd, (ex, ey + 2), e.radius + 2)
-                pygame.draw.circle(s, dc, (ex, ey + 2), e.radius)
-                # Lighter belly
-                pygame.draw.ellipse(s, (min(255, dc[0] + 40), min(255, dc[1] + 15), dc[2]),
-                                   (ex - e.radius + 5, ey, e.radius * 2 - 10, e.radius))
-                # Curved horns
-                horn = (90, 75, 45)
-                pygame.draw.polygon(s, horn, [
-                    (ex - 9, ey - 10), (ex - 20, ey - 28), (ex - 15, ey - 25), (ex - 5, ey - 8)])
-                pygame.draw.polygon(s, horn, [
-                    (ex + 9, ey - 10), (ex + 20, ey - 28), (ex + 15, ey - 25), (ex + 5, ey - 8)])
-                # Slanted angry eyes
-                pygame.draw.line(s, (200, 160, 30), (ex - 9, ey - 6), (ex - 3, ey - 3), 3)
-                pygame.draw.line(s, (200, 160, 30), (ex + 3, ey - 3), (ex + 9, ey - 6), 3)
-                pygame.draw.circle(s, (220, 200, 60), (ex - 6, ey - 4), 2)
-                pygame.draw.circle(s, (220, 200, 60), (ex + 6, ey - 4), 2)
-                # Fanged snarling mouth
-                pygame.draw.arc(s, (50, 10, 10), (ex - 7, ey + 2, 14, 10), 3.14, 6.28, 2)
-                pygame.draw.polygon(s, (255, 240, 200), [(ex - 5, ey + 5), (ex - 4, ey + 10), (ex - 3, ey + 5)])
-                pygame.draw.polygon(s, (255, 240, 200), [(ex + 3, ey + 5), (ex + 4, ey + 10), (ex + 5, ey + 5)])
-                # Spiky tail
-                pygame.draw.line(s, dd, (ex, ey + e.radius), (ex - 12, ey + e.radius + 8), 2)
-                pygame.draw.circle(s, dc, (ex - 14, ey + e.radius + 8), 3)
-
-            # --- Kind 2: SPIDER DEMON - D2R multi-legged horror ---
-            elif e.kind == 2:
-                sp = (50, 40, 60) if not flash else (255, 255, 255)
-                sp_lt = (70, 55, 80) if not flash else (240, 240, 240)
-                # Segmented body (abdomen + cephalothorax)
-                pygame.draw.ellipse(s, sp, (ex - e.radius + 2, ey - 2,
-                                    e.radius * 2 - 4, e.radius + 8))
-                pygame.draw.circle(s, sp_lt, (ex, ey - 5), e.radius - 5)
-                # Hourglass marking
-                pygame.draw.polygon(s, (200, 30, 30), [
-                    (ex, ey + 1), (ex - 3, ey + 5), (ex, ey + 9), (ex + 3, ey + 5)])
-                # Pattern on abdomen
-                pygame.draw.line(s, (80, 65, 100), (ex - 4, ey + 4), (ex + 4, ey + 4), 1)
-                pygame.draw.line(s, (80, 65, 100), (ex - 3, ey + 7), (ex + 3, ey + 7), 1)
-                # 8 legs (animated walking)
-                walk = math.sin(self.game_time * 8 + e.pos.x * 0.05) * 3
-                for i, ang in enumerate([-0.8, -0.4, 0.1, 0.5]):
-                    ofs = walk if i % 2 == 0 else -walk
-                    lx1 = ex - e.radius + 2
-                    ly1 = ey + int(ang * 12) + int(ofs)
-                    lx2 = lx1 - 14
-                    ly2 = ly1 + 7
-                    pygame.draw.line(s, sp, (lx1, ly1), (lx2, ly2), 2)
-                    pygame.draw.line(s, sp, (lx2, ly2), (lx2 - 5, ly2 + 6), 2)
-                    rx1 = ex + e.radius - 2
-                    ry1 = ey + int(ang * 12) + int(ofs)
-                    rx2 = rx1 + 14
-                    ry2 = ry1 + 7
-                    pygame.draw.line(s, sp, (rx1, ry1), (rx2, ry2), 2)
-                    pygame.draw.line(s, sp, (rx2, ry2), (rx2 + 5, ry2 + 6), 2)
-                # Cluster of red eyes
-                for dx, dy in [(-5, -8), (-2, -10), (2, -10), (5, -8), (-3, -6), (3, -6)]:
-                    pygame.draw.circle(s, (180, 0, 0), (ex + dx, ey + dy), 2)
-                    pygame.draw.circle(s, (255, 100, 100), (ex + dx, ey + dy), 1)
-                # Venomous chelicerae
-                pygame.draw.line(s, (140, 200, 80), (ex - 4, ey - 2), (ex - 7, ey + 7), 2)
-                pygame.draw.line(s, (140, 200, 80), (ex + 4, ey - 2), (ex + 7, ey + 7), 2)
-                # Venom drip
-                if random.random() < 0.08:
-                    pygame.draw.circle(s, (80, 160, 50), (ex + random.choice([-7, 7]), ey + 9), 1)
-
-            # --- Kind 3: WRAITH - hooded spectral reaper with soul wisps ---
-            elif e.kind == 3:
-                float_ofs = math.sin(self.game_time * 3) * 4
-                wy = ey + int(float_ofs)
-                # Tattered robe bottom (ragged edges)
-                pulse = 0.6 + 0.4 * math.sin(self.game_time * 4)
-                robe_col = (int(60 * pulse), int(30 * pulse), int(120 * pulse))
-                if flash:
-                    robe_col = (255, 255, 255)
-                for i in range(6):
-                    rag_x = ex - 10 + i * 4
-                    rag_len = 8 + int(math.sin(self.game_time * 2 + i) * 3)
-                    pygame.draw.line(s, robe_col, (rag_x, wy + 6), (rag_x, wy + 6 + rag_len), 2)
-                # Spectral body - layered translucent robes
-                body_col_w = (int(70 * pulse), int(35 * pulse), int(130 * pulse))
-                if flash:
-                    body_col_w = (255, 255, 255)
-                pygame.draw.ellipse(s, body_col_w, (ex - e.radius, wy - 4, e.radius * 2, e.radius + 10))
-                inner_col = (int(90 * pulse), int(50 * pulse), int(160 * pulse))
-                if flash:
-                    inner_col = (255, 255, 255)
-                pygame.draw.ellipse(s, inner_col, (ex - e.radius + 3, wy - 2, e.radius * 2 - 6, e.radius + 4))
-                # Hooded cowl
-                hood_col = (int(50 * pulse), int(25 * pulse), int(100 * pulse))
-                if flash:
-                    hood_col = (255, 255, 255)
-                pygame.draw.arc(s, hood_col, (ex - 10, wy - 16, 20, 18), 0, math.pi, 4)
-                pygame.draw.ellipse(s, hood_col, (ex - 10, wy - 18, 20, 14))
-                # Glowing eyes deep in hood
-                pygame.draw.circle(s, (180, 160, 255), (ex - 5, wy - 10), 3)
-                pygame.draw.circle(s, (180, 160, 255), (ex + 5, wy - 10), 3)
-                pygame.draw.circle(s, (255, 240, 255), (ex - 5, wy - 10), 1)
-                pygame.draw.circle(s, (255, 240, 255), (ex + 5, wy - 10), 1)
-                # Orbiting soul wisps
-                for i in range(4):
-                    ang = self.game_time * 2.5 + i * math.tau / 4
-                    dist = e.radius + 8 + math.sin(self.game_time * 3 + i) * 3
-                    sx = ex + int(math.cos(ang) * dist)
-                    sy = wy + int(math.sin(ang) * (dist * 0.6))
-                    wisp_pulse = 0.6 + 0.4 * math.sin(self.game_time * 2.5 + i * 2)
-                    wisp_col = (int(120 * wisp_pulse), int(180 * wisp_pulse), int(255 * wisp_pulse))
-                    pygame.draw.circle(s, wisp_col, (sx, sy), 3)
-                    pygame.draw.circle(s, (200, 220, 255), (sx, sy), 1)
-                # Spectral trail behind
-                for i in range(4):
-                    t_alpha = 0.25 - i * 0.05
-                    t_col = (int(80 * t_alpha), int(40 * t_alpha), int(140 * t_alpha))
-                    trail_y = wy + 10 + i * 5
-                    trail_w = e.radius - i * 2
-                    if trail_w > 0:
-                        pygame.draw.ellipse(s, t_col, (ex - trail_w, trail_y, trail_w * 2, 4))
+            # --- Skeleton, fallen, spider and wraith: body from the sprite cache, live details on top ---
+            if e.kind in ENEMY_SPRITE_KINDS:
+                sprite = self._enemy_sprite(e.kind, e.radius, flash)
+                half = sprite.get_width() // 2
+                s.blit(sprite, (ex - half, ey - half))
+                if e.kind == 0:
+                    self._draw_skeleton_eyes(s, e, ex, ey)
+                elif e.kind == 2:
+                    self._draw_spider_legs(s, e, ex, ey)
 
             else:
                 # Fallback: ZOMBIE / UNDEAD - shambling corpse
@@ -5023,29 +6124,60 @@ class Game:
                 # Gaping mouth
                 pygame.draw.ellipse(s, (50, 30, 30), (ex - 3, ey - e.radius + 6, 6, 4))
                 # Dangling arms
-                arm_sway = math.sin(self.game_time * 2) * 3
+                arm_sway = waves["s2"] * 3
                 pygame.draw.line(s, zc, (ex - e.radius + 2, ey - 2), (ex - e.radius - 3, ey + 10 + int(arm_sway)), 3)
                 pygame.draw.line(s, zc, (ex + e.radius - 2, ey - 2), (ex + e.radius + 3, ey + 10 - int(arm_sway)), 3)
 
-        # HP bar above enemy
         if ratio < 1.0:
-            bar_w = e.radius * 2 + 8
-            bar_h = 5
-            bar_x = ex - bar_w // 2
-            bar_y = ey - e.radius - 14
-            pygame.draw.rect(s, (20, 15, 15), (bar_x - 1, bar_y - 1, bar_w + 2, bar_h + 2))
-            pygame.draw.rect(s, (60, 20, 20), (bar_x, bar_y, bar_w, bar_h))
-            fill_w = int(bar_w * ratio)
-            if ratio > 0.5:
-                bar_col = (60, 180, 60)
-            elif ratio > 0.25:
-                bar_col = (200, 160, 40)
-            else:
-                bar_col = (200, 40, 40)
-            pygame.draw.rect(s, bar_col, (bar_x, bar_y, fill_w, bar_h))
+            self._draw_enemy_hp_bar(s, e, ex, ey, ratio)
+
+    def _player_body_sprite(self, walk_offset):
+        """Feet, armour and helmet of the player for one walk offset, centred at (24, 25)."""
+        surf = self._player_body_frames.get(walk_offset)
+        if surf is not None:
+            return surf
+        s = pygame.Surface((48, 50), pygame.SRCALPHA)
+        px, py = 24, 25
+        # Feet with walk animation
+        pygame.draw.rect(s, (50, 45, 35), (px - 10, py + 12 + walk_offset, 8, 7), border_radius=2)
+        pygame.draw.rect(s, (50, 45, 35), (px + 2, py + 12 - walk_offset, 8, 7), border_radius=2)
+
+        # Torso (armor)
+        pygame.draw.rect(s, (55, 65, 90), (px - 13, py - 8, 26, 24), border_radius=5)
+        # Armor detail
+        pygame.draw.rect(s, (70, 82, 110), (px - 10, py - 6, 20, 4), border_radius=1)
+        pygame.draw.rect(s, (65, 75, 100), (px - 7, py + 3, 14, 3))
+        # Shoulder pauldrons
+        pygame.draw.circle(s, (70, 80, 105), (px - 14, py - 4), 7)
+        pygame.draw.circle(s, (70, 80, 105), (px + 14, py - 4), 7)
+        pygame.draw.circle(s, (85, 95, 125), (px - 14, py - 5), 4)
+        pygame.draw.circle(s, (85, 95, 125), (px + 14, py - 5), 4)
+
+        # Head (helmet)
+        pygame.draw.circle(s, (75, 80, 95), (px, py - 13), 10)
+        # Visor slit
+        pygame.draw.rect(s, (180, 170, 140), (px - 6, py - 14, 12, 3))
+        surf = self._player_body_frames[walk_offset] = s.convert_alpha()
+        return surf
+
+    def _arm_offsets(self, dx, dy):
+        """Shoulder and hand offsets from the player, and bow tip offsets from the hand, for aim (dx, dy)."""
+        key, offsets = self._arm_cache
+        if key == (dx, dy):
+            return offsets
+        ang = math.atan2(dy, dx)
+        cos_a, sin_a = math.cos(ang), math.sin(ang)
+        bow_r = 14
+        perp = ang + math.pi / 2
+        cos_p, sin_p = math.cos(perp), math.sin(perp)
+        offsets = (int(cos_a * 8), int(sin_a * 8), int(cos_a * 18), int(sin_a * 18),
+                   int(cos_p * bow_r), int(sin_p * bow_r), int(cos_p * -bow_r), int(sin_p * -bow_r))
+        self._arm_cache = ((dx, dy), offsets)
+        return offsets
 
     def _draw_player(self, s, ox, oy):
         p = self.player
+        waves = self._anim_waves()
         px = int(p.pos.x - self.cam_x + ox)
         py = int(p.pos.y - self.cam_y + oy)
 
@@ -5070,50 +6202,29 @@ class Game:
         if p.dash_timer > 0:
             pygame.draw.circle(s, (40, 60, 100), (px, py), 22, 2)
 
-        # Body - armored warrior
-        # Feet with walk animation
-        walk_offset = int(math.sin(p.walk_anim) * 4) if p.vel.length_squared() > 100 else 0
-        pygame.draw.rect(s, (50, 45, 35), (px - 10, py + 12 + walk_offset, 8, 7), border_radius=2)
-        pygame.draw.rect(s, (50, 45, 35), (px + 2, py + 12 - walk_offset, 8, 7), border_radius=2)
-
-        # Torso (armor)
-        pygame.draw.rect(s, (55, 65, 90), (px - 13, py - 8, 26, 24), border_radius=5)
-        # Armor detail
-        pygame.draw.rect(s, (70, 82, 110), (px - 10, py - 6, 20, 4), border_radius=1)
-        pygame.draw.rect(s, (65, 75, 100), (px - 7, py + 3, 14, 3))
-        # Shoulder pauldrons
-        pygame.draw.circle(s, (70, 80, 105), (px - 14, py - 4), 7)
-        pygame.draw.circle(s, (70, 80, 105), (px + 14, py - 4), 7)
-        pygame.draw.circle(s, (85, 95, 125), (px - 14, py - 5), 4)
-        pygame.draw.circle(s, (85, 95, 125), (px + 14, py - 5), 4)
-
-        # Head (helmet)
-        pygame.draw.circle(s, (75, 80, 95), (px, py - 13), 10)
-        # Visor slit
-        pygame.draw.rect(s, (180, 170, 140), (px - 6, py - 14, 12, 3))
+        # Body - armored warrior, pre-rendered per walk frame
+        walk_offset = int(fast_sin(p.walk_anim) * 4) if p.vel.length_squared() > 100 else 0
+        s.blit(self._player_body_sprite(walk_offset), (px - 24, py - 25))
 
         # Cape hint
         if p.vel.length_squared() > 100:
-            cape_sway = int(math.sin(p.walk_anim * 0.7) * 4)
+            cape_sway = int(fast_sin(p.walk_anim * 0.7) * 4)
             pygame.draw.polygon(s, (50, 30, 30),
                                 [(px - 8, py + 3), (px + 8, py + 3),
                                  (px + 6 + cape_sway, py + 20), (px - 6 + cape_sway, py + 20)])
 
         # Arm/bow toward mouse
-        mx, my = pygame.mouse.get_pos()
-        ang = math.atan2(my - py, mx - px)
-        hand_x = px + int(math.cos(ang) * 18)
-        hand_y = py + int(math.sin(ang) * 18)
+        mx, my = self._frame_mouse
+        (sdx, sdy, hdx, hdy, tdx, tdy, bdx, bdy) = self._arm_offsets(mx - px, my - py)
+        hand_x = px + hdx
+        hand_y = py + hdy
         # Arm
-        pygame.draw.line(s, (100, 95, 85), (px + int(math.cos(ang) * 8), py + int(math.sin(ang) * 8)),
-                         (hand_x, hand_y), 3)
+        pygame.draw.line(s, (100, 95, 85), (px + sdx, py + sdy), (hand_x, hand_y), 3)
         # Bow
-        bow_r = 14
-        perp = ang + math.pi / 2
-        bow_top_x = hand_x + int(math.cos(perp) * bow_r)
-        bow_top_y = hand_y + int(math.sin(perp) * bow_r)
-        bow_bot_x = hand_x + int(math.cos(perp) * -bow_r)
-        bow_bot_y = hand_y + int(math.sin(perp) * -bow_r)
+        bow_top_x = hand_x + tdx
+        bow_top_y = hand_y + tdy
+        bow_bot_x = hand_x + bdx
+        bow_bot_y = hand_y + bdy
         # Bow limbs
         bow_col = (120, 90, 50) if p.dmg_timer <= 0 else (200, 160, 60)
         pygame.draw.line(s, bow_col, (bow_top_x, bow_top_y), (hand_x, hand_y), 3)
@@ -5127,8 +6238,8 @@ class Game:
 
         # Red hurt flash overlay
         if hurt_alpha > 0:
-            flash_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-            pulse = 0.8 + 0.2 * math.sin(self.game_time * 6)
+            flash_surf = self._scratch_surface("hurt", (50, 50))
+            pulse = 0.8 + 0.2 * waves["s6"]
             a = int(hurt_alpha * pulse)
             pygame.draw.circle(flash_surf, (255, 30, 20, a), (25, 25), 22)
             pygame.draw.circle(flash_surf, (255, 80, 60, a // 2), (25, 25), 18)
@@ -5136,33 +6247,52 @@ class Game:
 
         # Shield visual
         if p.shield > 0:
-            pulse = 0.6 + 0.4 * math.sin(self.game_time * 3)
+            pulse = 0.6 + 0.4 * waves["s3"]
             shield_col = (int(60 * pulse), int(160 * pulse), int(220 * pulse))
             pygame.draw.circle(s, shield_col, (px, py), p.radius + 8, 2)
 
         # Damage boost aura
         if p.dmg_timer > 0:
-            pulse = 0.5 + 0.5 * math.sin(self.game_time * 5)
+            pulse = 0.5 + 0.5 * waves["s5"]
             aura_col = (int(200 * pulse), int(120 * pulse), int(20 * pulse))
             pygame.draw.circle(s, aura_col, (px, py), p.radius + 4, 1)
 
     def _draw_particles(self, s, ox, oy):
-        for p in self.particles:
-            sx = int(p.x - self.cam_x + ox)
-            sy = int(p.y - self.cam_y + oy)
-            if not (-10 < sx < WIDTH + 10 and -10 < sy < HEIGHT + 10):
-                continue
-            alpha = max(0.0, p.life / p.max_life)
-            r = max(0, min(255, int(p.r * alpha)))
-            g = max(0, min(255, int(p.g * alpha)))
-            b = max(0, min(255, int(p.b * alpha)))
-            size = max(1, int(p.size * alpha))
-            pygame.draw.circle(s, (r, g, b), (sx, sy), size)
+        ps = self.particles
+        n = ps.n
+        if not n:
+            return
+        # Screen position, fade and colour for every particle in one vectorised pass
+        sx = (ps.x[:n].astype(np.float64) - self.cam_x + ox).astype(np.int64)
+        sy = (ps.y[:n].astype(np.float64) - self.cam_y + oy).astype(np.int64)
+        vis = np.flatnonzero((sx > -10) & (sx < WIDTH + 10) & (sy > -10) & (sy < HEIGHT + 10))
+        if not len(vis):
+            return
+        # Fade in PARTICLE_FADE_STEPS levels and snap colours so particles can share cached blobs
+        alpha = np.maximum(0.0, ps.life[vis].astype(np.float64) / ps.max_life[vis])
+        alpha = np.ceil(alpha * PARTICLE_FADE_STEPS) / PARTICLE_FADE_STEPS
+        rgb = np.stack([(getattr(ps, c)[vis] * alpha).astype(np.int64) for c in "rgb"], axis=1)
+        rgb = np.clip(rgb, 0, 255) & PARTICLE_COLOR_MASK
+        size = np.maximum(1, (ps.size[vis] * alpha).astype(np.int64))
+        cached = self._blobs.get
+        blob = self._blob
+        batch = [((cached((col, r)) or blob(col, r)), (x - r, y - r))
+                 for col, x, y, r in zip(map(tuple, rgb.tolist()), sx[vis].tolist(), sy[vis].tolist(), size.tolist())]
+        if HAS_FBLITS:
+            s.fblits(batch)
+        else:
+            s.blits(batch, doreturn=False)
 
     def _draw_floating_texts(self, s, ox, oy):
+        cam_x = self.cam_x - ox
+        cam_y = self.cam_y - oy
+        cached = self._floating_text_surfs.get
+        text_surf = self._floating_text_surf
+        steps = FLOATING_TEXT_FADE_STEPS
+        smoothscale = pygame.transform.smoothscale
         for ft in self.floating_texts:
-            sx = int(ft.x - self.cam_x + ox)
-            sy = int(ft.y - self.cam_y + oy)
+            sx = int(ft.x - cam_x)
+            sy = int(ft.y - cam_y)
             if not (-100 < sx < WIDTH + 100 and -50 < sy < HEIGHT + 50):
                 continue
             life_ratio = max(0.0, ft.life / ft.max_life)
@@ -5173,173 +6303,209 @@ class Game:
             else:
                 pop = 1.35 - ((progress - 0.15) / 0.85) * 0.5
             alpha = life_ratio if life_ratio > 0.4 else (life_ratio / 0.4)
-            r = max(0, min(255, int(ft.r * alpha)))
-            g = max(0, min(255, int(ft.g * alpha)))
-            b = max(0, min(255, int(ft.b * alpha)))
-            if ft.scale > 1.2:
-                rendered = self.bigfont.render(ft.text, True, (r, g, b))
-            else:
-                rendered = self.dmgfont.render(ft.text, True, (r, g, b))
+            alpha = math.ceil(alpha * steps) / steps
+            color = (max(0, min(255, int(ft.r * alpha))),
+                     max(0, min(255, int(ft.g * alpha))),
+                     max(0, min(255, int(ft.b * alpha))))
+            big = ft.scale > 1.2
+            rendered = cached((ft.text, color, big)) or text_surf(ft.text, color, big)
             scaled_w = max(1, int(rendered.get_width() * pop))
             scaled_h = max(1, int(rendered.get_height() * pop))
             if pop != 1.0:
-                rendered = pygame.transform.smoothscale(rendered, (scaled_w, scaled_h))
+                rendered = smoothscale(rendered, (scaled_w, scaled_h))
             s.blit(rendered, (sx - rendered.get_width() // 2, sy - rendered.get_height() // 2))
 
+    def _paint_static_lights(self, layer, rect, vx, vy):
+        """Ambient fill plus torch, portal and hazard pool lights for one rect of the static light layer."""
+        x, y, w, h = rect
+        layer.set_clip(rect)
+        layer.fill(BIOME_AMBIENT.get(self.current_biome, AMBIENT_LIGHT), rect)
+        bounds = ((vx + x) // TILE - STATIC_LIGHT_MARGIN, (vx + x + w) // TILE + STATIC_LIGHT_MARGIN,
+                  (vy + y) // TILE - STATIC_LIGHT_MARGIN, (vy + y + h) // TILE + STATIC_LIGHT_MARGIN)
+        add = pygame.BLEND_RGB_ADD
+        cx = TILE // 2 - vx
+        cy = TILE // 2 - vy
+        batch = []
+        tls = self.light_surfs["torch"]
+        tr = tls.get_width() // 2
+        for tx, ty in self._decor_in_view(self.dungeon.torch_grid, bounds):
+            batch.append((tls, (tx * TILE + cx - tr, ty * TILE + cy - tr), None, add))
+        pls = self.light_surfs["portal"]
+        pr = pls.get_width() // 2
+        for ptx, pty, _ in self._decor_in_view(self.dungeon.portal_grid, bounds):
+            batch.append((pls, (ptx * TILE + cx - pr, pty * TILE + cy - pr), None, add))
+        hazard = BIOME_HAZARD.get(self.current_biome, "poison")
+        hls = self.light_surfs["lava" if hazard == "lava" else "ice_pool" if hazard == "ice" else "poison"]
+        hr = hls.get_width() // 2
+        for ppx, ppy in self._decor_in_view(self.dungeon.hazard_grid, bounds):
+            batch.append((hls, (ppx * TILE + cx - hr, ppy * TILE + cy - hr), None, add))
+        layer.blits(batch, doreturn=False)
+        layer.set_clip(None)
+
     def _draw_lighting(self, s, ox, oy):
-        self.light_map.fill(BIOME_AMBIENT.get(self.current_biome, AMBIENT_LIGHT))
+        # Map-fixed lights only depend on the camera, so they live in a layer that is scrolled with it
+        light_map = self.light_map
+        layer = self._static_lights
+        if layer is None or layer.get_size() != light_map.get_size():
+            layer = self._static_lights = light_map.copy()
+            self._static_lights_origin = None
+        vx = self.cam_x - ox
+        vy = self.cam_y - oy
+        static_moved = self._static_lights_origin != (vx, vy)
+        self._scroll_layer(layer, self._static_lights_origin, vx, vy, self._paint_static_lights)
+        self._static_lights_origin = (vx, vy)
+
+        add = pygame.BLEND_RGB_ADD
+        batch = []
         # Player light
-        plx = int(self.player.pos.x - self.cam_x + ox)
-        ply = int(self.player.pos.y - self.cam_y + oy)
-        pls = self.light_surfs["player"]
+        plx = int(self.player.pos.x - vx)
+        ply = int(self.player.pos.y - vy)
         pr = PLAYER_LIGHT_RADIUS
-        # flicker
-        flicker = random.uniform(0.95, 1.0)
-        self.light_map.blit(pls, (plx - pr, ply - pr), special_flags=pygame.BLEND_RGB_ADD)
-
-        # Torch lights
-        for tx, ty in self.dungeon.torches:
-            if not self._tile_in_view(tx, ty):
-                continue
-            lx = int(tx * TILE + TILE // 2 - self.cam_x + ox)
-            ly = int(ty * TILE + TILE // 2 - self.cam_y + oy)
-            tr = TORCH_LIGHT_RADIUS
-            flick = random.uniform(0.75, 1.0)
-            tls = self.light_surfs["torch"]
-            self.light_map.blit(tls, (lx - tr, ly - tr), special_flags=pygame.BLEND_RGB_ADD)
+        surfs = self.light_surfs
+        batch.append((surfs["player"], (plx - pr, ply - pr), None, add))
 
         # Projectile lights
-        for pr_obj in self.projectiles:
-            prx = int(pr_obj.pos.x - self.cam_x + ox)
-            pry = int(pr_obj.pos.y - self.cam_y + oy)
-            if -100 < prx < WIDTH + 100 and -100 < pry < HEIGHT + 100:
-                if pr_obj.hostile:
-                    key = "proj_red"
-                elif pr_obj.infusion and f"infusion_{pr_obj.infusion}" in self.light_surfs:
-                    key = f"infusion_{pr_obj.infusion}"
-                elif pr_obj.radius > BASIC_RADIUS:
-                    key = "proj_power"
-                else:
-                    key = "proj_blue"
-                pls2 = self.light_surfs[key]
-                r2 = pls2.get_width() // 2
-                self.light_map.blit(pls2, (prx - r2, pry - r2), special_flags=pygame.BLEND_RGB_ADD)
+        projectiles = self.projectiles
+        red_ls = surfs["proj_red"]
+        power_ls = surfs["proj_power"]
+        blue_ls = surfs["proj_blue"]
+        for i in _on_screen(projectiles, vx, vy, 100):
+            pr_obj = projectiles[i]
+            pls2 = None
+            if pr_obj.hostile:
+                pls2 = red_ls
+            elif pr_obj.infusion:
+                pls2 = surfs.get("infusion_" + pr_obj.infusion)
+            if pls2 is None:
+                pls2 = power_ls if pr_obj.radius > BASIC_RADIUS else blue_ls
+            r2 = pls2.get_width() // 2
+            batch.append((pls2, (int(pr_obj.pos.x - vx) - r2, int(pr_obj.pos.y - vy) - r2), None, add))
 
         # Elite aura lights
-        for e in self.enemies:
-            if isinstance(e, Elite) and e.alive:
-                elx = int(e.pos.x - self.cam_x + ox)
-                ely = int(e.pos.y - self.cam_y + oy)
-                if -150 < elx < WIDTH + 150 and -150 < ely < HEIGHT + 150:
-                    key = f"elite_{e.aura}"
-                    if key in self.light_surfs:
-                        els = self.light_surfs[key]
-                        er = els.get_width() // 2
-                        self.light_map.blit(els, (elx - er, ely - er), special_flags=pygame.BLEND_RGB_ADD)
-
-        # Portal lights
-        for ptx, pty, _ in self.dungeon.portal_positions:
-            if self._tile_in_view(ptx, pty):
-                stx = int(ptx * TILE + TILE // 2 - self.cam_x + ox)
-                sty = int(pty * TILE + TILE // 2 - self.cam_y + oy)
-                pls3 = self.light_surfs["portal"]
-                r3 = pls3.get_width() // 2
-                self.light_map.blit(pls3, (stx - r3, sty - r3), special_flags=pygame.BLEND_RGB_ADD)
-
-        # Chest lights
-        for chest in self.chests:
+        elites = [e for e in self.enemies if e.kind_flags & KIND_ELITE and e.alive]
+        for i in _on_screen(elites, vx, vy, 150):
+            e = elites[i]
+            els = surfs.get("elite_" + e.aura)
+            if els is not None:
+                er = els.get_width() // 2
+                batch.append((els, (int(e.pos.x - vx) - er, int(e.pos.y - vy) - er), None, add))
+
+        # Chest lights (chests break, so they stay out of the static layer)
+        chests = self.chests
+        chest_ls = surfs["chest"]
+        chest_r = chest_ls.get_width() // 2
+        gold_ls = surfs["gold_chest"]
+        gold_r = gold_ls.get_width() // 2
+        for ci in self._breakables_in_view(vx, vy, 100)[0]:
+            chest = chests[ci]
             if not chest.alive:
                 continue
-            clx = int(chest.pos.x - self.cam_x + ox)
-            cly = int(chest.pos.y - self.cam_y + oy)
+            clx = int(chest.pos.x - vx)
+            cly = int(chest.pos.y - vy)
             if -100 < clx < WIDTH + 100 and -100 < cly < HEIGHT + 100:
-                key = "gold_chest" if chest.kind == "gold" else "chest"
-                cls = self.light_surfs[key]
-                cr = cls.get_width() // 2
-                self.light_map.blit(cls, (clx - cr, cly - cr), special_flags=pygame.BLEND_RGB_ADD)
-
-        # Hazard pool lights
-        hazard = BIOME_HAZARD.get(self.current_biome, "poison")
-        hazard_light_key = "lava" if hazard == "lava" else "ice_pool" if hazard == "ice" else "poison"
-        for ppx, ppy in self.dungeon.hazard_pools:
-            if not self._tile_in_view(ppx, ppy):
-                continue
-            plx = int(ppx * TILE + TILE // 2 - self.cam_x + ox)
-            ply = int(ppy * TILE + TILE // 2 - self.cam_y + oy)
-            if hazard_light_key in self.light_surfs:
-                pls4 = self.light_surfs[hazard_light_key]
-                pr4 = pls4.get_width() // 2
-                self.light_map.blit(pls4, (plx - pr4, ply - pr4), special_flags=pygame.BLEND_RGB_ADD)
+                if chest.kind == "gold":
+                    batch.append((gold_ls, (clx - gold_r, cly - gold_r), None, add))
+                else:
+                    batch.append((chest_ls, (clx - chest_r, cly - chest_r), None, add))
 
         # Vendor light
         if self.vendor:
-            vlx = int(self.vendor.pos.x - self.cam_x + ox)
-            vly = int(self.vendor.pos.y - self.cam_y + oy)
-            if -200 < vlx < WIDTH + 200 and -200 < vly < HEIGHT + 200:
-                if "torch" in self.light_surfs:
-                    vls = self.light_surfs["torch"]
-                    vr = vls.get_width() // 2
-                    self.light_map.blit(vls, (vlx - vr, vly - vr), special_flags=pygame.BLEND_RGB_ADD)
+            vlx = int(self.vendor.pos.x - vx)
+            vly = int(self.vendor.pos.y - vy)
+            vls = surfs.get("torch")
+            if vls is not None and -200 < vlx < WIDTH + 200 and -200 < vly < HEIGHT + 200:
+                vr = vls.get_width() // 2
+                batch.append((vls, (vlx - vr, vly - vr), None, add))
+        # A still camera with the same dynamic lights leaves last frame's light map valid
+        if static_moved or self._light_batch != (light_map, batch):
+            light_map.blit(layer, (0, 0))
+            light_map.blits(batch, doreturn=False)
+            self._light_batch = (light_map, batch)
 
         # Apply lighting
-        s.blit(self.light_map, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        s.blit(light_map, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
 
     def _draw_reticle(self, s):
-        mx, my = pygame.mouse.get_pos()
-        # outer ring
-        pygame.draw.circle(s, (180, 160, 120), (mx, my), 12, 2)
-        # crosshair
-        gap = 4
-        length = 12
-        pygame.draw.line(s, (200, 180, 140), (mx - length, my), (mx - gap, my), 2)
-        pygame.draw.line(s, (200, 180, 140), (mx + gap, my), (mx + length, my), 2)
-        pygame.draw.line(s, (200, 180, 140), (mx, my - length), (mx, my - gap), 2)
-        pygame.draw.line(s, (200, 180, 140), (mx, my + gap), (mx, my + length), 2)
-        # center dot
-        pygame.draw.circle(s, (220, 200, 160), (mx, my), 2)
+        mx, my = self._frame_mouse
+        if self._reticle is None:
+            r = self._reticle = pygame.Surface((32, 32), pygame.SRCALPHA)
+            c = 16
+            # outer ring
+            pygame.draw.circle(r, (180, 160, 120), (c, c), 12, 2)
+            # crosshair
+            gap = 4
+            length = 12
+            pygame.draw.line(r, (200, 180, 140), (c - length, c), (c - gap, c), 2)
+            pygame.draw.line(r, (200, 180, 140), (c + gap, c), (c + length, c), 2)
+            pygame.draw.line(r, (200, 180, 140), (c, c - length), (c, c - gap), 2)
+            pygame.draw.line(r, (200, 180, 140), (c, c + gap), (c, c + length), 2)
+            # center dot
+            pygame.draw.circle(r, (220, 200, 160), (c, c), 2)
+            self._reticle = r.convert_alpha()
+        s.blit(self._reticle, (mx - 16, my - 16))
+
+    def _minimap_tiles(self, mm_w, mm_h):
+        """Minimap background, frame and explored tiles; rebuilt only when the size, map or seen set changes."""
+        d = self.dungeon
+        key = (mm_w, mm_h, self.current_biome, d, d.seen_version)
+        if self._minimap_key == key:
+            return self._minimap_layer
+        layer = pygame.Surface((mm_w, mm_h), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 150))
+        # Gothic frame
+        pygame.draw.rect(layer, (80, 65, 45, 200), (0, 0, mm_w, mm_h), 2)
+        pygame.draw.rect(layer, (50, 40, 28, 150), (1, 1, mm_w - 2, mm_h - 2), 1)
+
+        # Colour per tile class: wall type for walls, terrain for floors
+        bc = BIOME_COLORS.get(self.current_biome, BIOME_COLORS["crypt"])
+        mm_grass = bc.get("grass", (34, 55, 28))
+        mm_dirt = bc.get("dirt", (50, 40, 28))
+        palette = np.empty((TILE_CLASS_COUNT, 4), np.int32)
+        palette[:] = (mm_grass[0] + 15, mm_grass[1] + 20, mm_grass[2] + 10, 180)
+        palette[TILE_CLASS_WALL] = (60, 55, 65, 200)
+        palette[2 + TILE_CLASS_WALLS.index(WALL_TREE)] = (mm_grass[0] - 5, mm_grass[1] + 10, mm_grass[2] - 5, 200)
+        palette[TILE_CLASS_WATER] = (30, 50, 110, 200)
+        palette[2 + TILE_CLASS_WALLS.index(WALL_ROCK)] = (55, 50, 45, 200)
+        palette[6 + TILE_CLASS_TERRAINS.index(TERRAIN_ROAD)] = (mm_dirt[0] + 10, mm_dirt[1] + 8, mm_dirt[2] + 5, 200)
+        palette[6 + TILE_CLASS_TERRAINS.index(TERRAIN_DIRT)] = (mm_dirt[0], mm_dirt[1], mm_dirt[2], 180)
+        palette = np.clip(palette, 0, 255).astype(np.uint8)
+
+        # Every other tile is one cell at (tx * sx, ty * sy) of size (2sx, 2sy), truncated like a Rect;
+        # map each minimap pixel to the last cell covering it
+        def cell_of(n_px, scale, n_tiles):
+            starts = (np.arange(0, n_tiles, 2) * scale).astype(np.int64)
+            px = np.arange(n_px)
+            cell = np.searchsorted(starts, px, "right") - 1
+            covered = (cell >= 0) & (px < starts[np.maximum(cell, 0)] + int(scale * 2))
+            return np.maximum(cell, 0), covered
+
+        cx, cov_x = cell_of(mm_w, mm_w / MAP_W, MAP_W)
+        cy, cov_y = cell_of(mm_h, mm_h / MAP_H, MAP_H)
+        grid = np.ix_(cx, cy)
+        show = d.seen[::2, ::2][grid] & cov_x[:, None] & cov_y[None, :]
+        colors = palette[d.tile_class[::2, ::2][grid][show]]
+        rgb = pygame.surfarray.pixels3d(layer)
+        rgb[show] = colors[:, :3]
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(layer)
+        alpha[show] = colors[:, 3]
+        del alpha
+        self._minimap_layer = layer
+        self._minimap_key = key
+        return layer
 
     def _draw_minimap(self, s):
         mm_mode = MINIMAP_MODES[self.minimap_mode_idx]
         if mm_mode == "hidden":
             return
+        waves = self._anim_waves()
 
         base_w, base_h = (300, 220) if mm_mode == "small" else (480, 340)
         mm_w = int(base_w * self.minimap_scale)
         mm_h = int(base_h * self.minimap_scale)
-        surf = pygame.Surface((mm_w, mm_h), pygame.SRCALPHA)
-        surf.fill((0, 0, 0, 150))
-        # Gothic frame
-        pygame.draw.rect(surf, (80, 65, 45, 200), (0, 0, mm_w, mm_h), 2)
-        pygame.draw.rect(surf, (50, 40, 28, 150), (1, 1, mm_w - 2, mm_h - 2), 1)
-
+        surf = self._minimap_tiles(mm_w, mm_h).copy()
         sx = mm_w / MAP_W
         sy = mm_h / MAP_H
-        bc = BIOME_COLORS.get(self.current_biome, BIOME_COLORS["crypt"])
-        mm_grass = bc.get("grass", (34, 55, 28))
-        mm_dirt = bc.get("dirt", (50, 40, 28))
-        for tx in range(0, MAP_W, 2):
-            for ty in range(0, MAP_H, 2):
-                if not self.dungeon.seen[tx][ty]:
-                    continue
-                if self.dungeon.tiles[tx][ty] == WALL:
-                    wt = self.dungeon.wall_type[tx][ty]
-                    if wt == WALL_TREE:
-                        col = (mm_grass[0] - 5, mm_grass[1] + 10, mm_grass[2] - 5, 200)
-                    elif wt == WALL_WATER:
-                        col = (30, 50, 110, 200)
-                    elif wt == WALL_ROCK:
-                        col = (55, 50, 45, 200)
-                    else:
-                        col = (60, 55, 65, 200)
-                else:
-                    ter = self.dungeon.terrain[tx][ty]
-                    if ter == TERRAIN_ROAD:
-                        col = (mm_dirt[0] + 10, mm_dirt[1] + 8, mm_dirt[2] + 5, 200)
-                    elif ter == TERRAIN_DIRT:
-                        col = (mm_dirt[0], mm_dirt[1], mm_dirt[2], 180)
-                    else:
-                        col = (mm_grass[0] + 15, mm_grass[1] + 20, mm_grass[2] + 10, 180)
-                pygame.draw.rect(surf, col, (tx * sx, ty * sy, sx * 2, sy * 2))
 
         # player dot
         ppx = int(self.player.pos.x / TILE * sx)
@@ -5353,10 +6519,10 @@ class Game:
                 continue
             epx = int(e.pos.x / TILE * sx)
             epy = int(e.pos.y / TILE * sy)
-            if isinstance(e, Boss):
+            if e.kind_flags & KIND_BOSS:
                 color = (255, 80, 40)
                 pygame.draw.circle(surf, color, (epx, epy), 3)
-            elif isinstance(e, Elite):
+            elif e.kind_flags & KIND_ELITE:
                 color = (255, 220, 100)
                 pygame.draw.circle(surf, color, (epx, epy), 2)
             else:
@@ -5388,11 +6554,11 @@ class Game:
         for ptx, pty, _dest in self.dungeon.portal_positions:
             ppx = int(ptx * sx)
             ppy = int(pty * sy)
-            pulse = 0.5 + 0.5 * math.sin(self.game_time * 3)
+            pulse = 0.5 + 0.5 * waves["s3"]
             pcol = BIOME_PORTAL_COLORS.get(self.current_biome, (200, 200, 100))
             col = (int(pcol[0] * pulse), int(pcol[1] * pulse), int(pcol[2] * pulse), 255)
             # Pulsing glow ring beacon
-            ring_pulse = 0.3 + 0.7 * abs(math.sin(self.game_time * 2))
+            ring_pulse = 0.3 + 0.7 * abs(waves["s2"])
             ring_r = int(6 + 3 * ring_pulse)
             glow_col = (int(pcol[0] * 0.4 * ring_pulse), int(pcol[1] * 0.4 * ring_pulse),
                         int(pcol[2] * 0.4 * ring_pulse), int(120 * ring_pulse))
@@ -5404,7 +6570,7 @@ class Game:
         if self.treasure_goblin and self.treasure_goblin.alive:
             gpx = int(self.treasure_goblin.pos.x / TILE * sx)
             gpy = int(self.treasure_goblin.pos.y / TILE * sy)
-            pulse = 0.5 + 0.5 * math.sin(self.game_time * 6)
+            pulse = 0.5 + 0.5 * waves["s6"]
             pygame.draw.circle(surf, (int(255 * pulse), int(215 * pulse), 0), (gpx, gpy), 3)
 
         # vendor
@@ -5424,7 +6590,7 @@ class Game:
     def _draw_screen_flash(self, s):
         if not self.screen_flashes:
             return
-        flash_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        flash_surf = self._scratch_surface("screen_flash", (WIDTH, HEIGHT))
         for color, life, max_life in self.screen_flashes:
             t = max(0.0, min(1.0, life / max_life))
             alpha = int(80 * (t ** 2))
@@ -5438,12 +6604,21 @@ class Game:
         max_hp = p.max_hp()
         max_mana = p.max_mana()
 
-        # Bottom panel background
+        label = self._ui_label
+        # XP bar geometry, shared by the cached panel and the per-frame fill
+        bar_x = 130
+        bar_w = WIDTH - 260
+        bar_y = HEIGHT - 18
+        bar_h = 10
+
+        # Bottom panel background with the empty XP bar trough baked in
         panel_h = 100
-        panel_surf = pygame.Surface((WIDTH, panel_h), pygame.SRCALPHA)
-        panel_surf.fill((10, 8, 14, 200))
-        pygame.draw.line(panel_surf, (80, 65, 45, 200), (0, 0), (WIDTH, 0), 3)
-        s.blit(panel_surf, (0, HEIGHT - panel_h))
+        if self._ui_panel is None:
+            self._ui_panel = pygame.Surface((WIDTH, panel_h), pygame.SRCALPHA)
+            self._ui_panel.fill((10, 8, 14, 200))
+            pygame.draw.line(self._ui_panel, (80, 65, 45, 200), (0, 0), (WIDTH, 0), 3)
+            pygame.draw.rect(self._ui_panel, (25, 20, 15), (bar_x, bar_y - (HEIGHT - panel_h), bar_w, bar_h))
+        s.blit(self._ui_panel, (0, HEIGHT - panel_h))
 
         # Health globe (left)
         globe_r = 42
@@ -5468,14 +6643,9 @@ class Game:
 
         # XP bar between globes
         xp_frac = p.xp / max(1, p.xp_to_next)
-        bar_x = 130
-        bar_w = WIDTH - 260
-        bar_y = HEIGHT - 18
-        bar_h = 10
-        pygame.draw.rect(s, (25, 20, 15), (bar_x, bar_y, bar_w, bar_h))
         pygame.draw.rect(s, (180, 160, 80), (bar_x, bar_y, int(bar_w * xp_frac), bar_h))
         pygame.draw.rect(s, C_GOTHIC_FRAME, (bar_x, bar_y, bar_w, bar_h), 1)
-        xp_label = self.font.render(f"Level {p.level}", True, (200, 190, 150))
+        xp_label = label(f"Level {p.level}", (200, 190, 150))
         s.blit(xp_label, (WIDTH // 2 - xp_label.get_width() // 2, bar_y - 22))
 
         # Skill indicators / cooldowns
@@ -5509,22 +6679,22 @@ class Game:
                 outline = (70, 58, 44)
             pygame.draw.rect(s, fill, (sx, pot_y, slot_w, 32), border_radius=5)
             pygame.draw.rect(s, outline, (sx, pot_y, slot_w, 32), 1, border_radius=5)
-            key_label = self.font.render(str(i + 1), True, (170, 155, 130))
+            key_label = label(str(i + 1), (170, 155, 130))
             s.blit(key_label, (sx + 9, pot_y + 34))
 
         # Stash counts + quick-use keys (fallback if belt empty)
-        hp_stash = self.font.render(f"HP:{p.potions_hp} [Q]", True, (220, 160, 160))
-        mana_stash = self.font.render(f"MP:{p.potions_mana} [E]", True, (160, 180, 220))
+        hp_stash = label(f"HP:{p.potions_hp} [Q]", (220, 160, 160))
+        mana_stash = label(f"MP:{p.potions_mana} [E]", (160, 180, 220))
         s.blit(hp_stash, (belt_x, pot_y - 22))
         s.blit(mana_stash, (belt_x, pot_y + 50))
 
         # Gold
-        gold_txt = self.font.render(f"Gold: {p.gold}", True, C_GOLD)
+        gold_txt = label(f"Gold: {p.gold}", C_GOLD)
         s.blit(gold_txt, (140, HEIGHT - panel_h + 12))
 
         # Weapon name with rarity color
         wc = p.weapon.get_color()
-        wname_txt = self.font.render(f"{p.weapon.name} ({p.weapon.dmg_min}-{p.weapon.dmg_max})", True, wc)
+        wname_txt = label(f"{p.weapon.name} ({p.weapon.dmg_min}-{p.weapon.dmg_max})", wc)
         s.blit(wname_txt, (WIDTH // 2 - wname_txt.get_width() // 2, HEIGHT - panel_h - 22))
 
         # Stat point / skill point indicators
@@ -5569,13 +6739,13 @@ class Game:
         tier_label = f"  [{self.difficulty_tier}]" if self.difficulty_tier != "Normal" else ""
         tier_col = (255, 100, 100) if self.difficulty_tier == "Hell" else (
                    (255, 200, 80) if self.difficulty_tier == "Nightmare" else (170, 165, 150))
-        act_line = self.font.render(f"{act_info['name']}{tier_label}", True, tier_col)
+        act_line = label(f"{act_info['name']}{tier_label}", tier_col)
         s.blit(act_line, (16, 12))
-        area_line = self.font.render(f"{area_name}  -  {self.difficulty_name}  -  Wave {self.wave}", True, (140, 135, 120))
+        area_line = label(f"{area_name}  -  {self.difficulty_name}  -  Wave {self.wave}", (140, 135, 120))
         s.blit(area_line, (16, 32))
         # Lives display
         lives_col = (100, 200, 100) if p.lives > 1 else ((220, 180, 60) if p.lives == 1 else (200, 60, 60))
-        lives_txt = self.font.render(f"Lives: {p.lives}/{p.max_lives}", True, lives_col)
+        lives_txt = label(f"Lives: {p.lives}/{p.max_lives}", lives_col)
         s.blit(lives_txt, (16, 52))
 
         # Compass arrow pointing toward portal
@@ -5591,7 +6761,7 @@ class Game:
                 comp_cx = WIDTH // 2
                 comp_cy = 50
                 comp_r = 22
-                pulse = 0.6 + 0.4 * math.sin(self.game_time * 3)
+                pulse = 0.6 + 0.4 * self._anim_waves()["s3"]
                 pcol = BIOME_PORTAL_COLORS.get(self.current_biome, (200, 200, 100))
                 arrow_col = (int(pcol[0] * pulse), int(pcol[1] * pulse), int(pcol[2] * pulse))
                 # Arrow triangle pointing direction
@@ -5606,15 +6776,21 @@ class Game:
                 tile_dist = int(dist / TILE)
                 dist_txt = self.font.render(f"Portal: {tile_dist} tiles", True, arrow_col)
                 s.blit(dist_txt, (comp_cx - dist_txt.get_width() // 2, comp_cy + comp_r + 10))
-        hint = self.font.render("C=Stats  I=Inventory  T=Skills  M=Waypoints  Esc=Menu  F1=Help", True, (90, 85, 75))
+        hint = label("C=Stats  I=Inventory  T=Skills  M=Waypoints  Esc=Menu  F1=Help", (90, 85, 75))
         s.blit(hint, (16, 72))
 
-    def _draw_globe(self, s, cx, cy, r, frac, empty_color, fill_color, highlight_color, frame_color):
+    def _globe_fill(self, r, fill_height, empty_color, fill_color, highlight_color):
+        """Empty globe plus liquid gradient, re-rendered only when the fill height changes."""
+        key = (r, empty_color, fill_color, highlight_color)
+        cached = self._globe_fills.get(key)
+        if cached is not None and cached[0] == fill_height:
+            return cached[1]
+        s = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        cx = cy = r
         # Empty globe
         pygame.draw.circle(s, empty_color, (cx, cy), r)
         # Fill level
-        if frac > 0:
-            fill_height = int(2 * r * frac)
+        if fill_height > 0:
             fill_top = cy + r - fill_height
             # draw filled portion by clipping
             for dy in range(fill_height):
@@ -5631,6 +6807,13 @@ class Game:
                 cb = int(fill_color[2] + (highlight_color[2] - fill_color[2]) * (1 - t) * 0.3)
                 pygame.draw.line(s, (min(255, cr), min(255, cg), min(255, cb)),
                                  (cx - half_w, y), (cx + half_w, y))
+        s = s.convert_alpha()
+        self._globe_fills[key] = (fill_height, s)
+        return s
+
+    def _draw_globe(self, s, cx, cy, r, frac, empty_color, fill_color, highlight_color, frame_color):
+        fill_height = int(2 * r * frac) if frac > 0 else 0
+        s.blit(self._globe_fill(r, fill_height, empty_color, fill_color, highlight_color), (cx - r, cy - r))
         # Glass highlight
         pygame.draw.circle(s, (255, 255, 255), (cx - r // 3, cy - r // 3), r // 4, 1)
         # Frame
@@ -5674,9 +6857,7 @@ class Game:
 
         while True:
             self.clock.tick(30)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 210))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 210)), (0, 0))
 
             # Title
             title = self.titlefont.render("WAYPOINTS", True, C_GOLD)
@@ -5810,6 +6991,7 @@ class Game:
         self.particles.clear()
         self.floating_texts.clear()
         self.corpses.clear()
+        self._corpse_version += 1
         self.chests.clear()
         self.crates.clear()
         self.treasure_goblin = None
@@ -5840,9 +7022,7 @@ class Game:
         ]
         while True:
             self.clock.tick(30)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 200)), (0, 0))
 
             txt = self.titlefont.render("PAUSED", True, C_GOLD)
             self.screen.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 - 120))
@@ -5902,14 +7082,12 @@ class Game:
                         self.paused = False
                         return
 
-    def _help_overlay(self):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
-
+    def _build_help_panel(self):
+        """Controls title, key list and close hint on a transparent screen-sized layer, rendered once."""
+        panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         title = self.bigfont.render("- CONTROLS -", True, C_GOLD)
-        self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 80))
-        pygame.draw.line(self.screen, C_GOTHIC_FRAME, (WIDTH // 2 - 150, 115), (WIDTH // 2 + 150, 115), 1)
+        panel.blit(title, (WIDTH // 2 - title.get_width() // 2, 80))
+        pygame.draw.line(panel, C_GOTHIC_FRAME, (WIDTH // 2 - 150, 115), (WIDTH // 2 + 150, 115), 1)
 
         lines = [
             ("WASD", "Move"),
@@ -5948,18 +7126,24 @@ class Game:
             if key:
                 kt = self.font.render(key, True, (200, 180, 140))
                 dt = self.font.render(f"  -  {desc}", True, (160, 155, 140))
-                self.screen.blit(kt, (WIDTH // 2 - 200, y))
-                self.screen.blit(dt, (WIDTH // 2 - 200 + kt.get_width(), y))
+                panel.blit(kt, (WIDTH // 2 - 200, y))
+                panel.blit(dt, (WIDTH // 2 - 200 + kt.get_width(), y))
             y += 28
 
         hint = self.font.render("Press any key to close", True, (120, 115, 100))
-        self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, y + 20))
+        panel.blit(hint, (WIDTH // 2 - hint.get_width() // 2, y + 20))
+        return panel.convert_alpha()
+
+    def _help_overlay(self):
+        self.screen.blit(self._fill_overlay((0, 0, 0, 220)), (0, 0))
+        if self._help_panel is None:
+            self._help_panel = self._build_help_panel()
+        self.screen.blit(self._help_panel, (0, 0))
         pygame.display.flip()
-        waiting = True
-        while waiting:
-            for e in pygame.event.get():
-                if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.QUIT):
-                    waiting = False
+
+        # Block in SDL until input arrives instead of spinning on event.get()
+        while pygame.event.wait().type not in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.QUIT):
+            pass
 
     # ---- CHARACTER STATS SCREEN (C key) ----
     def _character_screen(self):
@@ -5977,9 +7161,14 @@ class Game:
             "energy": "+4 max Mana, +0.3 mana regen, +1% skill dmg",
         }
         selected = 0
+        derived_blits = None  # rendered derived-stat block, rebuilt only after a point is spent
+        gate = ModalRedraw(self.clock)
         running = True
         while running:
+            # Nothing on this screen reacts to the mouse moving, so motion events are discarded unread
+            pygame.event.clear(pygame.MOUSEMOTION)
             for ev in pygame.event.get():
+                gate.invalidate()
                 if ev.type == pygame.QUIT:
                     self.running = False
                     return
@@ -5994,6 +7183,7 @@ class Game:
                         if p.stat_points > 0:
                             setattr(p, stats[selected], getattr(p, stats[selected]) + 1)
                             p.stat_points -= 1
+                            derived_blits = None
                             self.play_sound("pickup")
                 if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                     mx, my = ev.pos
@@ -6003,20 +7193,22 @@ class Game:
                         if btn_x <= mx <= btn_x + 28 and btn_y <= my <= btn_y + 28 and p.stat_points > 0:
                             setattr(p, st, getattr(p, st) + 1)
                             p.stat_points -= 1
+                            derived_blits = None
                             self.play_sound("pickup")
 
+            if not gate.should_draw():
+                continue
+
             # Draw
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 230))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 230)), (0, 0))
 
-            title = self.bigfont.render("- CHARACTER STATS -", True, C_GOLD)
+            title = self._ui_label("- CHARACTER STATS -", C_GOLD, big=True)
             self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 60))
             pygame.draw.line(self.screen, C_GOTHIC_FRAME,
                              (WIDTH // 2 - 200, 95), (WIDTH // 2 + 200, 95), 1)
 
             # Level and points
-            lvl_txt = self.font.render(f"Level {p.level}   Stat Points: {p.stat_points}", True, C_GOLD)
+            lvl_txt = self._ui_label(f"Level {p.level}   Stat Points: {p.stat_points}", C_GOLD)
             self.screen.blit(lvl_txt, (WIDTH // 2 - lvl_txt.get_width() // 2, 110))
 
             # Stats
@@ -6032,9 +7224,9 @@ class Game:
                                      (WIDTH // 2 - 250, y - 8, 500, 65), 1, border_radius=5)
 
                 val = getattr(p, st)
-                name_txt = self.bigfont.render(f"{stat_labels[st]}: {val}", True, color)
+                name_txt = self._ui_label(f"{stat_labels[st]}: {val}", color, big=True)
                 self.screen.blit(name_txt, (WIDTH // 2 - 220, y))
-                desc_txt = self.font.render(stat_desc[st], True, (140, 135, 120))
+                desc_txt = self._ui_label(stat_desc[st], (140, 135, 120))
                 self.screen.blit(desc_txt, (WIDTH // 2 - 220, y + 34))
 
                 # + button
@@ -6042,39 +7234,39 @@ class Game:
                     btn_x = WIDTH // 2 + 180
                     pygame.draw.rect(self.screen, (60, 120, 60), (btn_x, y, 28, 28), border_radius=4)
                     pygame.draw.rect(self.screen, (100, 200, 100), (btn_x, y, 28, 28), 1, border_radius=4)
-                    plus = self.font.render("+", True, (200, 255, 200))
+                    plus = self._ui_label("+", (200, 255, 200))
                     self.screen.blit(plus, (btn_x + 7, y + 2))
 
-            # Derived stats
-            y = 580
-            derived = [
-                f"Max HP: {p.max_hp()}",
-                f"Max Mana: {p.max_mana()}",
-                f"Crit Chance: {p.calc_crit_chance():.1f}%",
-                f"Attack Speed: {p.calc_attack_speed_mult():.2f}x",
-                f"Damage Mult: {p.calc_dmg_mult():.2f}x",
-                f"Life Steal: {p.calc_life_steal():.1f}%",
-                f"Dodge: {p.calc_dodge_chance():.1f}%",
-                f"Mana Regen: {p.mana_regen():.1f}/s",
-                f"Pierce: {p.calc_pierce()}",
-                f"Multishot: {p.calc_multishot_count()} arrows",
-            ]
-            dtitle = self.font.render("Derived Stats:", True, (180, 170, 140))
-            self.screen.blit(dtitle, (WIDTH // 2 - 220, y))
-            y += 28
-            for j, d in enumerate(derived):
-                col = j % 2
-                row = j // 2
-                dx = WIDTH // 2 - 220 + col * 280
-                dy = y + row * 24
-                dt = self.font.render(d, True, (160, 155, 140))
-                self.screen.blit(dt, (dx, dy))
-
-            hint = self.font.render("[W/S] Select   [Enter/D/Click +] Add Point   [C/Esc] Close", True, (100, 95, 85))
+            # Derived stats only move when a point is spent, so the block is laid out once per change
+            if derived_blits is None:
+                y = 580
+                derived = [
+                    f"Max HP: {p.max_hp()}",
+                    f"Max Mana: {p.max_mana()}",
+                    f"Crit Chance: {p.calc_crit_chance():.1f}%",
+                    f"Attack Speed: {p.calc_attack_speed_mult():.2f}x",
+                    f"Damage Mult: {p.calc_dmg_mult():.2f}x",
+                    f"Life Steal: {p.calc_life_steal():.1f}%",
+                    f"Dodge: {p.calc_dodge_chance():.1f}%",
+                    f"Mana Regen: {p.mana_regen():.1f}/s",
+                    f"Pierce: {p.calc_pierce()}",
+                    f"Multishot: {p.calc_multishot_count()} arrows",
+                ]
+                derived_blits = [(self._ui_label("Derived Stats:", (180, 170, 140)), (WIDTH // 2 - 220, y))]
+                y += 28
+                for j, d in enumerate(derived):
+                    col = j % 2
+                    row = j // 2
+                    dx = WIDTH // 2 - 220 + col * 280
+                    dy = y + row * 24
+                    derived_blits.append((self._ui_label(d, (160, 155, 140)), (dx, dy)))
+            self.screen.blits(derived_blits, doreturn=False)
+
+            hint = self._ui_label("[W/S] Select   [Enter/D/Click +] Add Point   [C/Esc] Close", (100, 95, 85))
             self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 60))
 
             pygame.display.flip()
-            self.clock.tick(30)
+            self.clock.tick(MODAL_FPS)
 
     # ---- INVENTORY / EQUIPMENT SCREEN (I key) ----
     def _inventory_screen(self):
@@ -6101,13 +7293,30 @@ class Game:
         grid_rows = 5
         grid_x = WIDTH // 2 + 100
         grid_y = 110
+        # Top-left of every grid cell
+        cell_pos = [(grid_x + idx % grid_cols * cell_w, grid_y + idx // grid_cols * cell_h)
+                    for idx in range(grid_cols * grid_rows)]
+
+        def cell_at(x, y):
+            """Grid index under (x, y), or None outside the grid; the grid is regular so no scan is needed."""
+            col = (x - grid_x) // cell_w
+            row = (y - grid_y) // cell_h
+            if 0 <= col < grid_cols and 0 <= row < grid_rows:
+                return row * grid_cols + col
+            return None
+
         # Selected item for dragging/socketing (index into inventory, or None)
         selected_idx = None
         socketing_mode = False  # True when a jewel is selected for socketing
+        gate = ModalRedraw(self.clock)
+        hover = None
         running = True
         while running:
             mx, my = pygame.mouse.get_pos()
+            # Hover is read from the mouse position, so motion events are flushed without reaching Python
+            pygame.event.clear(pygame.MOUSEMOTION)
             for ev in pygame.event.get():
+                gate.invalidate()
                 if ev.type == pygame.QUIT:
                     self.running = False
                     return
@@ -6186,129 +7395,131 @@ class Game:
                         if clicked_something:
                             continue
                         # Check if clicking an inventory slot
-                        for idx in range(grid_cols * grid_rows):
-                            row = idx // grid_cols
-                            col = idx % grid_cols
-                            cx = grid_x + col * cell_w
-                            cy = grid_y + row * cell_h
-                            if cx <= mx <= cx + cell_w and cy <= my <= cy + cell_h:
-                                clicked_something = True
-                                if idx < len(p.inventory):
-                                    if selected_idx == idx:
-                                        # Deselect
+                        idx = cell_at(mx, my)
+                        if idx is not None:
+                            clicked_something = True
+                            if idx < len(p.inventory):
+                                if selected_idx == idx:
+                                    # Deselect
+                                    selected_idx = None
+                                    socketing_mode = False
+                                else:
+                                    if socketing_mode and selected_idx is not None:
+                                        # Try to socket into an inventory item
+                                        jewel_item = p.inventory[selected_idx]
+                                        target = p.inventory[idx]
+                                        if isinstance(jewel_item, Jewel):
+                                            can_socket = False
+                                            if isinstance(target, Weapon) and target.sockets > len(target.jewels):
+                                                can_socket = True
+                                            elif isinstance(target, Armor) and target.sockets > len(target.jewels):
+                                                can_socket = True
+                                            if can_socket:
+                                                target.jewels.append(jewel_item)
+                                                for mk, mv in jewel_item.mods.items():
+                                                    target.mods[mk] = target.mods.get(mk, 0) + mv
+                                                p.inventory.pop(selected_idx)
+                                                self.play_sound("pickup")
                                         selected_idx = None
                                         socketing_mode = False
                                     else:
-                                        if socketing_mode and selected_idx is not None:
-                                            # Try to socket into an inventory item
-                                            jewel_item = p.inventory[selected_idx]
-                                            target = p.inventory[idx]
-                                            if isinstance(jewel_item, Jewel):
-                                                can_socket = False
-                                                if isinstance(target, Weapon) and target.sockets > len(target.jewels):
-                                                    can_socket = True
-                                                elif isinstance(target, Armor) and target.sockets > len(target.jewels):
-                                                    can_socket = True
-                                                if can_socket:
-                                                    target.jewels.append(jewel_item)
-                                                    for mk, mv in jewel_item.mods.items():
-                                                        target.mods[mk] = target.mods.get(mk, 0) + mv
-                                                    p.inventory.pop(selected_idx)
-                                                    self.play_sound("pickup")
+                                        selected_idx = idx
+                                        item = p.inventory[idx]
+                                        socketing_mode = isinstance(item, Jewel)
+                                        # Auto-equip on click: if it's an equippable item, try to equip it
+                                        if isinstance(item, Weapon):
+                                            old = p.weapon
+                                            p.weapon = item
+                                            p.inventory[idx] = old
+                                            self.play_sound("pickup")
                                             selected_idx = None
-                                            socketing_mode = False
-                                        else:
-                                            selected_idx = idx
-                                            item = p.inventory[idx]
-                                            socketing_mode = isinstance(item, Jewel)
-                                            # Auto-equip on click: if it's an equippable item, try to equip it
-                                            if isinstance(item, Weapon):
-                                                old = p.weapon
-                                                p.weapon = item
-                                                p.inventory[idx] = old
-                                                self.play_sound("pickup")
-                                                selected_idx = None
-                                            elif isinstance(item, Armor):
-                                                slot_map = {"body": "equipped_armor", "helm": "equipped_helm",
-                                                            "gloves": "equipped_gloves", "boots": "equipped_boots"}
-                                                attr_name = slot_map.get(item.slot)
-                                                if attr_name:
-                                                    old = getattr(p, attr_name)
-                                                    setattr(p, attr_name, item)
-                                                    if old:
-                                                        p.inventory[idx] = old
-                                                    else:
-                                                        p.inventory.pop(idx)
-                                                    self.play_sound("pickup")
-                                                    selected_idx = None
-                                            elif isinstance(item, Ring) and item.slot == "ring":
-                                                if not p.equipped_ring1:
-                                                    p.equipped_ring1 = item
-                                                    p.inventory.pop(idx)
-                                                elif not p.equipped_ring2:
-                                                    p.equipped_ring2 = item
-                                                    p.inventory.pop(idx)
-                                                else:
-                                                    old = p.equipped_ring1
-                                                    p.equipped_ring1 = item
-                                                    p.inventory[idx] = old
-                                                self.play_sound("pickup")
-                                                selected_idx = None
-                                            elif isinstance(item, Ring) and item.slot == "amulet":
-                                                old = p.equipped_amulet
-                                                p.equipped_amulet = item
+                                        elif isinstance(item, Armor):
+                                            slot_map = {"body": "equipped_armor", "helm": "equipped_helm",
+                                                        "gloves": "equipped_gloves", "boots": "equipped_boots"}
+                                            attr_name = slot_map.get(item.slot)
+                                            if attr_name:
+                                                old = getattr(p, attr_name)
+                                                setattr(p, attr_name, item)
                                                 if old:
                                                     p.inventory[idx] = old
                                                 else:
                                                     p.inventory.pop(idx)
                                                 self.play_sound("pickup")
                                                 selected_idx = None
-                                else:
-                                    selected_idx = None
-                                    socketing_mode = False
-                                break
+                                        elif isinstance(item, Ring) and item.slot == "ring":
+                                            if not p.equipped_ring1:
+                                                p.equipped_ring1 = item
+                                                p.inventory.pop(idx)
+                                            elif not p.equipped_ring2:
+                                                p.equipped_ring2 = item
+                                                p.inventory.pop(idx)
+                                            else:
+                                                old = p.equipped_ring1
+                                                p.equipped_ring1 = item
+                                                p.inventory[idx] = old
+                                            self.play_sound("pickup")
+                                            selected_idx = None
+                                        elif isinstance(item, Ring) and item.slot == "amulet":
+                                            old = p.equipped_amulet
+                                            p.equipped_amulet = item
+                                            if old:
+                                                p.inventory[idx] = old
+                                            else:
+                                                p.inventory.pop(idx)
+                                            self.play_sound("pickup")
+                                            selected_idx = None
+                            else:
+                                selected_idx = None
+                                socketing_mode = False
                         if not clicked_something:
                             selected_idx = None
                             socketing_mode = False
                     elif ev.button == 3:  # Right click - sell
-                        for idx in range(len(p.inventory)):
-                            row = idx // grid_cols
-                            col = idx % grid_cols
-                            cx = grid_x + col * cell_w
-                            cy = grid_y + row * cell_h
-                            if cx <= mx <= cx + cell_w and cy <= my <= cy + cell_h:
-                                item = p.inventory[idx]
-                                sell_price = self._calc_sell_price(item)
-                                p.gold += sell_price
-                                self.add_floating_text(p.pos.x, p.pos.y - 20,
-                                                       f"+{sell_price}g (sold)", C_GOLD, 1.0)
-                                p.inventory.pop(idx)
-                                self.play_sound("gold")
-                                if selected_idx is not None:
-                                    if selected_idx == idx:
-                                        selected_idx = None
-                                        socketing_mode = False
-                                    elif selected_idx > idx:
-                                        selected_idx -= 1
-                                break
+                        idx = cell_at(mx, my)
+                        if idx is not None and idx < len(p.inventory):
+                            item = p.inventory[idx]
+                            sell_price = self._calc_sell_price(item)
+                            p.gold += sell_price
+                            self.add_floating_text(p.pos.x, p.pos.y - 20,
+                                                   f"+{sell_price}g (sold)", C_GOLD, 1.0)
+                            p.inventory.pop(idx)
+                            self.play_sound("gold")
+                            if selected_idx is not None:
+                                if selected_idx == idx:
+                                    selected_idx = None
+                                    socketing_mode = False
+                                elif selected_idx > idx:
+                                    selected_idx -= 1
+
+            # Slot highlights and tooltips follow the mouse, so only pointing at a slot or item needs a redraw
+            idx = cell_at(mx, my)
+            if (idx is not None and idx < len(p.inventory)) or any(
+                    sx <= mx <= sx + slot_w and sy <= my <= sy + slot_h for _, _, _, sx, sy in equip_slots):
+                new_hover = (mx, my)
+            else:
+                new_hover = None
+            if new_hover != hover:
+                hover = new_hover
+                gate.invalidate(full=False)
+
+            if not gate.should_draw():
+                continue
 
             # ---- Draw ----
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 230))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 230)), (0, 0))
 
-            title = self.bigfont.render("- EQUIPMENT -", True, C_GOLD)
+            title = self._ui_label("- EQUIPMENT -", C_GOLD, big=True)
             self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
             pygame.draw.line(self.screen, C_GOTHIC_FRAME,
                              (WIDTH // 2 - 160, 55), (WIDTH // 2 + 160, 55), 1)
 
             # Gold and defense display
-            gold_txt = self.font.render(f"Gold: {p.gold}", True, C_GOLD)
+            gold_txt = self._ui_label(f"Gold: {p.gold}", C_GOLD)
             self.screen.blit(gold_txt, (eq_panel_x, 60))
             def_val = p.total_defense()
             if def_val > 0:
                 red_pct = int(p.damage_reduction() * 100)
-                def_txt = self.font.render(f"Defense: {def_val} (-{red_pct}% dmg)", True, (160, 160, 180))
+                def_txt = self._ui_label(f"Defense: {def_val} (-{red_pct}% dmg)", (160, 160, 180))
                 self.screen.blit(def_txt, (eq_panel_x + 200, 60))
 
             # --- Equipment paper doll ---
@@ -6330,6 +7541,7 @@ class Game:
 
             # Draw equipment slots
             hovered_equip = None
+            cur_rects = []
             for label, attr, stype, sx, sy in equip_slots:
                 equipped = getattr(p, attr)
                 # Slot background
@@ -6342,24 +7554,20 @@ class Game:
                 if sx <= mx <= sx + slot_w and sy <= my <= sy + slot_h:
                     bg_col = (bg_col[0] + 15, bg_col[1] + 15, bg_col[2] + 12)
                     hovered_equip = (label, attr, stype, equipped)
+                    cur_rects.append(pygame.Rect(sx, sy, slot_w, slot_h))
                 pygame.draw.rect(self.screen, bg_col, (sx, sy, slot_w, slot_h), border_radius=5)
                 pygame.draw.rect(self.screen, border_col, (sx, sy, slot_w, slot_h), 2, border_radius=5)
                 if equipped:
-                    ic = equipped.get_color()
-                    # Item colored square
-                    pygame.draw.rect(self.screen, ic, (sx + 10, sy + 8, slot_w - 20, slot_h - 24), border_radius=4)
-                    pygame.draw.rect(self.screen, (min(255, ic[0]+50), min(255, ic[1]+50), min(255, ic[2]+50)),
-                                     (sx + 10, sy + 8, slot_w - 20, slot_h - 24), 1, border_radius=4)
-                    # Icon letter
-                    icon_char = self._get_item_icon(equipped)
-                    it = self.font.render(icon_char, True, (20, 15, 10))
-                    self.screen.blit(it, (sx + slot_w // 2 - it.get_width() // 2, sy + slot_h // 2 - it.get_height() // 2 - 4))
+                    # Item colored square with its icon letter
+                    icon = self._item_icon((slot_w - 20, slot_h - 24), equipped.get_color(),
+                                           self._get_item_icon(equipped), (slot_w // 2 - 10, slot_h // 2 - 12))
+                    self.screen.blit(icon, (sx + 10, sy + 8))
                 # Slot label below
-                sl = self.font.render(label, True, (120, 110, 95))
+                sl = self._ui_label(label, (120, 110, 95))
                 self.screen.blit(sl, (sx + slot_w // 2 - sl.get_width() // 2, sy + slot_h - 16))
 
             # --- Inventory grid (right side) ---
-            inv_title = self.font.render(f"Backpack ({len(p.inventory)}/{grid_cols * grid_rows})", True, (180, 170, 140))
+            inv_title = self._ui_label(f"Backpack ({len(p.inventory)}/{grid_cols * grid_rows})", (180, 170, 140))
             self.screen.blit(inv_title, (grid_x, grid_y - 28))
             # Grid background
             gw = grid_cols * cell_w + 10
@@ -6367,37 +7575,28 @@ class Game:
             pygame.draw.rect(self.screen, (18, 15, 12), (grid_x - 5, grid_y - 5, gw, gh), border_radius=6)
             pygame.draw.rect(self.screen, C_GOTHIC_FRAME, (grid_x - 5, grid_y - 5, gw, gh), 2, border_radius=6)
 
-            hovered_inv_idx = None
-            for idx in range(grid_cols * grid_rows):
-                row = idx // grid_cols
-                col = idx % grid_cols
-                cx = grid_x + col * cell_w
-                cy = grid_y + row * cell_h
-                bg = (20, 18, 14)
-                bd = (60, 50, 40)
-                if idx == selected_idx:
-                    bg = (50, 45, 30)
-                    bd = (200, 180, 80) if socketing_mode else (180, 160, 100)
-                pygame.draw.rect(self.screen, bg, (cx, cy, cell_w - 2, cell_h - 2), border_radius=3)
-                pygame.draw.rect(self.screen, bd, (cx, cy, cell_w - 2, cell_h - 2), 1, border_radius=3)
-                if idx < len(p.inventory):
-                    item = p.inventory[idx]
-                    ic = item.get_color()
-                    pygame.draw.rect(self.screen, ic, (cx + 6, cy + 6, cell_w - 14, cell_h - 14), border_radius=4)
-                    pygame.draw.rect(self.screen, (min(255, ic[0]+50), min(255, ic[1]+50), min(255, ic[2]+50)),
-                                     (cx + 6, cy + 6, cell_w - 14, cell_h - 14), 1, border_radius=4)
-                    icon_char = self._get_item_icon(item)
-                    it = self.font.render(icon_char, True, (20, 15, 10))
-                    self.screen.blit(it, (cx + cell_w // 2 - it.get_width() // 2,
-                                          cy + cell_h // 2 - it.get_height() // 2))
-                    # Check hover
-                    if cx <= mx <= cx + cell_w and cy <= my <= cy + cell_h:
-                        hovered_inv_idx = idx
+            # Cells never overlap, so every cell goes out in one batch before the items on top
+            cell_size = (cell_w - 2, cell_h - 2)
+            empty_cell = self._inv_cell(cell_size, (20, 18, 14), (60, 50, 40))
+            selected_cell = self._inv_cell(cell_size, (50, 45, 30),
+                                           (200, 180, 80) if socketing_mode else (180, 160, 100))
+            cells = [(selected_cell if idx == selected_idx else empty_cell, pos) for idx, pos in enumerate(cell_pos)]
+            icon_size = (cell_w - 14, cell_h - 14)
+            icon_centre = (cell_w // 2 - 6, cell_h // 2 - 6)
+            for idx, item in enumerate(p.inventory[:grid_cols * grid_rows]):
+                cx, cy = cell_pos[idx]
+                icon = self._item_icon(icon_size, item.get_color(), self._get_item_icon(item), icon_centre)
+                cells.append((icon, (cx + 6, cy + 6)))
+            if HAS_FBLITS:
+                self.screen.fblits(cells)
+            else:
+                self.screen.blits(cells, doreturn=False)
+            hovered_inv_idx = cell_at(mx, my)
 
             # Socketing hint
             if socketing_mode and selected_idx is not None and selected_idx < len(p.inventory):
                 jewel_name = p.inventory[selected_idx].name
-                hint_txt = self.font.render(f"Click a socketed item to insert {jewel_name}", True, (255, 220, 100))
+                hint_txt = self._ui_label(f"Click a socketed item to insert {jewel_name}", (255, 220, 100))
                 self.screen.blit(hint_txt, (grid_x, grid_y + grid_rows * cell_h + 15))
 
             # --- Stats summary below equipment ---
@@ -6406,19 +7605,19 @@ class Game:
             # Weapon stats
             w = p.weapon
             wc = w.get_color()
-            wname = self.font.render(f"Weapon: {w.name}", True, wc)
+            wname = self._ui_label(f"Weapon: {w.name}", wc)
             self.screen.blit(wname, (stats_x, stats_y))
-            wdmg = self.font.render(f"  Dmg: {w.dmg_min}-{w.dmg_max}  Spd: {w.attack_speed:.1f}", True, (180, 170, 150))
+            wdmg = self._ui_label(f"  Dmg: {w.dmg_min}-{w.dmg_max}  Spd: {w.attack_speed:.1f}", (180, 170, 150))
             self.screen.blit(wdmg, (stats_x, stats_y + 22))
 
             # Tooltips (draw last so they're on top)
             if hovered_inv_idx is not None and hovered_inv_idx < len(p.inventory):
                 item = p.inventory[hovered_inv_idx]
-                self._draw_item_tooltip(item, mx + 15, my)
+                cur_rects.append(self._draw_item_tooltip(item, mx + 15, my))
             elif hovered_equip:
                 label, attr, stype, equipped = hovered_equip
                 if equipped:
-                    self._draw_item_tooltip(equipped, mx + 15, my)
+                    cur_rects.append(self._draw_item_tooltip(equipped, mx + 15, my))
 
             # Controls hint
             hint_lines = [
@@ -6427,11 +7626,34 @@ class Game:
             if socketing_mode:
                 hint_lines.append("SOCKETING: Click a socketed weapon/armor to insert the jewel")
             for i, hl in enumerate(hint_lines):
-                ht = self.font.render(hl, True, (100, 95, 85))
+                ht = self._ui_label(hl, (100, 95, 85))
                 self.screen.blit(ht, (WIDTH // 2 - ht.get_width() // 2, HEIGHT - 50 + i * 22))
 
-            pygame.display.flip()
-            self.clock.tick(30)
+            gate.present(cur_rects)
+
+    def _inv_cell(self, size, bg, border):
+        """Rounded inventory grid cell with its border baked in; corners stay transparent."""
+        key = (size, bg, border)
+        surf = self._inv_cells.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, bg, (0, 0) + size, border_radius=3)
+            pygame.draw.rect(surf, border, (0, 0) + size, 1, border_radius=3)
+            surf = self._inv_cells[key] = surf.convert_alpha()
+        return surf
+
+    def _item_icon(self, size, color, icon_char, centre):
+        """Rounded item square with a brighter outline and its icon letter centred on centre."""
+        key = (size, color, icon_char, centre)
+        surf = self._item_icons.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, (0, 0) + size, border_radius=4)
+            pygame.draw.rect(surf, _item_edge_color(color), (0, 0) + size, 1, border_radius=4)
+            it = self._ui_label(icon_char, (20, 15, 10))
+            surf.blit(it, (centre[0] - it.get_width() // 2, centre[1] - it.get_height() // 2))
+            surf = self._item_icons[key] = surf.convert_alpha()
+        return surf
 
     def _get_item_icon(self, item) -> str:
         """Return a single character icon for an item."""
@@ -6447,42 +7669,55 @@ class Game:
 
     def _calc_sell_price(self, item) -> int:
         """Calculate sell price for any item type."""
-        rarity_mult = {RARITY_NORMAL: 1, RARITY_MAGIC: 2, RARITY_RARE: 4,
-                       RARITY_UNIQUE: 8, RARITY_SET: 6}
         if isinstance(item, Weapon):
             base = max(1, (item.dmg_min + item.dmg_max) // 2)
-            return base * rarity_mult.get(item.rarity, 1)
+            return base * SELL_RARITY_MULT.get(item.rarity, 1)
         elif isinstance(item, Armor):
             base = max(1, item.defense // 2 + 1)
-            return base * rarity_mult.get(item.rarity, 1)
+            return base * SELL_RARITY_MULT.get(item.rarity, 1)
         elif isinstance(item, Ring):
             base = max(1, item.ilvl)
-            return base * rarity_mult.get(item.rarity, 1)
+            return base * SELL_RARITY_MULT.get(item.rarity, 1)
         elif isinstance(item, Jewel):
             return max(2, sum(item.mods.values()) if item.mods else 1)
         return 1
 
     def _draw_item_tooltip(self, item, x: int, y: int):
-        """Draw a floating tooltip for any item type."""
-        lines = item.get_tooltip_lines()
+        """Draw a floating tooltip for any item type and return the screen area it covers."""
+        item_color = item.get_color()
+        # Keyed on the text itself, so socketing a jewel (which changes the lines) builds a new panel
+        key = (tuple(item.get_tooltip_lines()), item_color)
+        panel = self._tooltips.get(key)
+        if panel is None:
+            if len(self._tooltips) >= TOOLTIP_CACHE_MAX:
+                self._tooltips.clear()
+            panel = self._tooltips[key] = self._build_tooltip(key[0], item_color)
+        max_w = panel.get_width() - 20
+        total_h = panel.get_height()
+        if x + max_w + 20 > WIDTH:
+            x = WIDTH - max_w - 25
+        if y + total_h > HEIGHT:
+            y = HEIGHT - total_h - 10
+        return self.screen.blit(panel, (x, y))
+
+    def _build_tooltip(self, lines, item_color):
+        """Tooltip background, rarity border and text lines composed onto one SRCALPHA panel."""
         max_w = 0
         rendered = []
         for i, line in enumerate(lines):
-            color = item.get_color() if i == 0 else (200, 190, 160)
+            color = item_color if i == 0 else (200, 190, 160)
             if line.startswith("  +") or line.startswith("  ["):
                 color = (100, 200, 255)
-            t = self.font.render(line, True, color)
+            t = self._ui_label(line, color)
             rendered.append(t)
             max_w = max(max_w, t.get_width())
         total_h = len(rendered) * 24 + 16
-        if x + max_w + 20 > WIDTH:
-            x = WIDTH - max_w - 25
-        if y + total_h > HEIGHT:
-            y = HEIGHT - total_h - 10
-        pygame.draw.rect(self.screen, (15, 12, 10), (x, y, max_w + 20, total_h), border_radius=5)
-        pygame.draw.rect(self.screen, item.get_color(), (x, y, max_w + 20, total_h), 1, border_radius=5)
+        panel = pygame.Surface((max_w + 20, total_h), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (15, 12, 10), (0, 0, max_w + 20, total_h), border_radius=5)
+        pygame.draw.rect(panel, item_color, (0, 0, max_w + 20, total_h), 1, border_radius=5)
         for i, t in enumerate(rendered):
-            self.screen.blit(t, (x + 10, y + 8 + i * 24))
+            panel.blit(t, (10, 8 + i * 24))
+        return panel.convert_alpha()
 
     # ---- SKILL TREE SCREEN (T key) ----
     def _skill_tree_screen(self):
@@ -6490,10 +7725,31 @@ class Game:
         p = self.player
         tabs = ["bow", "crossbow", "passive"]
         tab_idx = 0
+
+        def tree_layout(idx):
+            # Box position of every skill in a tree and the end points of its prerequisite line,
+            # rebuilt only on tab change
+            tree = SKILL_TREES[tabs[idx]]
+            pos = {s["id"]: (WIDTH // 2 - 200 + s["col"] * 200, 220 + s["row"] * 130) for s in tree["skills"]}
+            links = {}
+            for s in tree["skills"]:
+                if s.get("req") in pos:
+                    rx, ry = pos[s["req"]]
+                    sx, sy = pos[s["id"]]
+                    links[s["id"]] = ((rx + 80, ry + 100), (sx + 80, sy))
+            return tree, pos, links
+
+        tree, skill_pos, skill_links = tree_layout(tab_idx)
+        pos_tab = tab_idx
+        gate = ModalRedraw(self.clock)
+        hover = None
         running = True
         while running:
             mx, my = pygame.mouse.get_pos()
+            # Hover is read from the mouse position, so motion events are flushed without reaching Python
+            pygame.event.clear(pygame.MOUSEMOTION)
             for ev in pygame.event.get():
+                gate.invalidate()
                 if ev.type == pygame.QUIT:
                     self.running = False
                     return
@@ -6510,10 +7766,11 @@ class Game:
                         tab_idx = 2
                 if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                     # Check skill buttons
-                    tree = SKILL_TREES[tabs[tab_idx]]
+                    if pos_tab != tab_idx:
+                        tree, skill_pos, skill_links = tree_layout(tab_idx)
+                        pos_tab = tab_idx
                     for skill in tree["skills"]:
-                        sx = WIDTH // 2 - 200 + skill["col"] * 200
-                        sy = 220 + skill["row"] * 130
+                        sx, sy = skill_pos[skill["id"]]
                         if sx <= mx <= sx + 160 and sy <= my <= sy + 100:
                             cur = p.skills.get(skill["id"], 0)
                             if cur < skill["max"] and p.skill_points > 0:
@@ -6524,14 +7781,28 @@ class Game:
                                     p.skill_points -= 1
                                     self.play_sound("levelup")
 
+            if pos_tab != tab_idx:
+                tree, skill_pos, skill_links = tree_layout(tab_idx)
+                pos_tab = tab_idx
+            # Only the hover description depends on the mouse
+            new_hover = None
+            for skill_id, (sx, sy) in skill_pos.items():
+                if sx <= mx <= sx + 160 and sy <= my <= sy + 100:
+                    new_hover = skill_id
+                    break
+            if new_hover != hover:
+                hover = new_hover
+                gate.invalidate(full=False)
+
+            if not gate.should_draw():
+                continue
+
             # Draw
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 230))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 230)), (0, 0))
 
-            title = self.bigfont.render("- SKILL TREE -", True, C_GOLD)
+            title = self._ui_label("- SKILL TREE -", C_GOLD, big=True)
             self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
-            pts_txt = self.font.render(f"Skill Points: {p.skill_points}", True, C_GOLD)
+            pts_txt = self._ui_label(f"Skill Points: {p.skill_points}", C_GOLD)
             self.screen.blit(pts_txt, (WIDTH // 2 - pts_txt.get_width() // 2, 55))
 
             # Tabs
@@ -6545,14 +7816,13 @@ class Game:
                                  (tx, ty, 190, 34), border_radius=5)
                 pygame.draw.rect(self.screen, color, (tx, ty, 190, 34), 2 if is_active else 1, border_radius=5)
                 tab_name = SKILL_TREES[tab]["name"]
-                tt = self.font.render(f"{i+1}. {tab_name}", True, color)
+                tt = self._ui_label(f"{i+1}. {tab_name}", color)
                 self.screen.blit(tt, (tx + 10, ty + 6))
 
             # Draw current tree
-            tree = SKILL_TREES[tabs[tab_idx]]
+            cur_rects = []
             for skill in tree["skills"]:
-                sx = WIDTH // 2 - 200 + skill["col"] * 200
-                sy = 220 + skill["row"] * 130
+                sx, sy = skill_pos[skill["id"]]
                 cur = p.skills.get(skill["id"], 0)
                 maxl = skill["max"]
                 req = skill.get("req")
@@ -6562,57 +7832,56 @@ class Game:
                 locked = req and p.skills.get(req, 0) == 0
 
                 # Draw connection line to required skill
-                if req:
-                    for rs in tree["skills"]:
-                        if rs["id"] == req:
-                            rx = WIDTH // 2 - 200 + rs["col"] * 200 + 80
-                            ry = 220 + rs["row"] * 130 + 100
-                            pygame.draw.line(self.screen, (60, 55, 45), (rx, ry), (sx + 80, sy), 2)
-                            break
+                link = skill_links.get(skill["id"])
+                if link:
+                    pygame.draw.line(self.screen, (60, 55, 45), link[0], link[1], 2)
 
-                # Skill box
-                bg_color = (40, 35, 25) if cur > 0 else (20, 18, 14)
-                border_color = C_GOLD if cur > 0 else ((80, 70, 55) if not locked else (40, 35, 30))
-                if locked:
-                    bg_color = (12, 10, 8)
-                pygame.draw.rect(self.screen, bg_color, (sx, sy, 160, 100), border_radius=6)
-                pygame.draw.rect(self.screen, border_color, (sx, sy, 160, 100), 2 if cur > 0 else 1,
-                                 border_radius=6)
-
-                # Skill name
-                name_color = C_GOLD if cur > 0 else ((180, 170, 140) if not locked else (80, 75, 65))
-                nt = self.font.render(skill["name"], True, name_color)
-                self.screen.blit(nt, (sx + 80 - nt.get_width() // 2, sy + 8))
-
-                # Level indicator
-                level_txt = self.font.render(f"{cur}/{maxl}", True, C_GOLD if cur > 0 else (120, 115, 100))
-                self.screen.blit(level_txt, (sx + 80 - level_txt.get_width() // 2, sy + 32))
-
-                # Pips
-                pip_total_w = maxl * 14
-                pip_start = sx + 80 - pip_total_w // 2
-                for pi in range(maxl):
-                    pc = C_GOLD if pi < cur else (50, 45, 35)
-                    pygame.draw.rect(self.screen, pc, (pip_start + pi * 14, sy + 56, 10, 6), border_radius=2)
+                # Skill box with name, level and pips
+                self.screen.blit(self._skill_tile(skill, cur, bool(locked)), (sx, sy))
 
                 # Description on hover
                 if sx <= mx <= sx + 160 and sy <= my <= sy + 100:
-                    desc_bg = pygame.Surface((320, 30), pygame.SRCALPHA)
-                    desc_bg.fill((10, 8, 6, 220))
-                    self.screen.blit(desc_bg, (sx - 80, sy + 102))
-                    dt = self.font.render(skill["desc"], True, (200, 190, 160))
-                    self.screen.blit(dt, (sx - 80 + 10, sy + 106))
+                    cur_rects.append(self.screen.blit(self._fill_overlay((10, 8, 6, 220), (320, 30)),
+                                                      (sx - 80, sy + 102)))
+                    dt = self._ui_label(skill["desc"], (200, 190, 160))
+                    cur_rects.append(self.screen.blit(dt, (sx - 80 + 10, sy + 106)))
 
                 # + indicator
                 if can_learn:
-                    plus = self.font.render("+", True, (100, 255, 100))
+                    plus = self._ui_label("+", (100, 255, 100))
                     self.screen.blit(plus, (sx + 140, sy + 4))
 
-            hint = self.font.render("[Click] Learn Skill   [Tab/1-3] Switch Tree   [T/Esc] Close", True, (100, 95, 85))
+            hint = self._ui_label("[Click] Learn Skill   [Tab/1-3] Switch Tree   [T/Esc] Close", (100, 95, 85))
             self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 40))
 
-            pygame.display.flip()
-            self.clock.tick(30)
+            gate.present(cur_rects)
+
+    def _skill_tile(self, skill, cur, locked):
+        """Skill-tree box for one skill at a given level, with its name, level and pips baked in."""
+        maxl = skill["max"]
+        key = (skill["id"], cur, maxl, locked)
+        surf = self._skill_tiles.get(key)
+        if surf is None:
+            surf = pygame.Surface((160, 100), pygame.SRCALPHA)
+            bg_color = (40, 35, 25) if cur > 0 else (20, 18, 14)
+            border_color = C_GOLD if cur > 0 else ((80, 70, 55) if not locked else (40, 35, 30))
+            if locked:
+                bg_color = (12, 10, 8)
+            pygame.draw.rect(surf, bg_color, (0, 0, 160, 100), border_radius=6)
+            pygame.draw.rect(surf, border_color, (0, 0, 160, 100), 2 if cur > 0 else 1, border_radius=6)
+
+            name_color = C_GOLD if cur > 0 else ((180, 170, 140) if not locked else (80, 75, 65))
+            nt = self._ui_label(skill["name"], name_color)
+            surf.blit(nt, (80 - nt.get_width() // 2, 8))
+            level_txt = self._ui_label(f"{cur}/{maxl}", C_GOLD if cur > 0 else (120, 115, 100))
+            surf.blit(level_txt, (80 - level_txt.get_width() // 2, 32))
+
+            pip_start = 80 - maxl * 14 // 2
+            for pi in range(maxl):
+                pc = C_GOLD if pi < cur else (50, 45, 35)
+                pygame.draw.rect(surf, pc, (pip_start + pi * 14, 56, 10, 6), border_radius=2)
+            surf = self._skill_tiles[key] = surf.convert_alpha()
+        return surf
 
     # ---- VENDOR SHOP SCREEN (V key near vendor) ----
     def _vendor_screen(self):
@@ -6624,10 +7893,27 @@ class Game:
         tab = 0  # 0 = buy, 1 = sell
         scroll_buy = 0
         scroll_sell = 0
+
+        def row_at(x, y, scroll, count):
+            """Index of the 64px-tall list row under (x, y), or None; rows sit 70px apart so no scan is needed."""
+            if not 200 <= x <= WIDTH - 200:
+                return None
+            i, offset = divmod(y - 160 + scroll, 70)
+            if 0 <= i < count and offset <= 64:
+                return i
+            return None
+
+        gate = ModalRedraw(self.clock)
+        hover = None
+        # (id(item), tab, hovered, unaffordable reason) -> composed list row; items stay alive while the screen is open
+        row_surfs = {}
         running = True
         while running:
             mx, my = pygame.mouse.get_pos()
+            # Hover is read from the mouse position, so motion events are flushed without reaching Python
+            pygame.event.clear(pygame.MOUSEMOTION)
             for ev in pygame.event.get():
+                gate.invalidate()
                 if ev.type == pygame.QUIT:
                     self.running = False
                     return
@@ -6645,31 +7931,29 @@ class Game:
 
                     if tab == 0:
                         # Buy from vendor
-                        for i, w in enumerate(v.stock):
-                            iy = 160 + i * 70 - scroll_buy
-                            if 200 <= mx <= WIDTH - 200 and iy <= my <= iy + 64:
-                                price = self._get_vendor_buy_price(w)
-                                if p.gold >= price and len(p.inventory) < INV_COLS * INV_ROWS:
-                                    p.gold -= price
-                                    p.inventory.append(w)
-                                    v.stock.pop(i)
-                                    self.play_sound("gold")
-                                    self.add_floating_text(p.pos.x, p.pos.y - 20,
-                                                           f"-{price}g", (255, 100, 100), 1.0)
-                                break
-                    else:
-                        # Sell to vendor
-                        for i, w in enumerate(p.inventory):
-                            iy = 160 + i * 70 - scroll_sell
-                            if 200 <= mx <= WIDTH - 200 and iy <= my <= iy + 64:
-                                price = self._get_vendor_sell_price(w)
-                                p.gold += price
-                                v.stock.append(w)
-                                p.inventory.pop(i)
+                        i = row_at(mx, my, scroll_buy, len(v.stock))
+                        if i is not None:
+                            w = v.stock[i]
+                            price = self._get_vendor_buy_price(w)
+                            if p.gold >= price and len(p.inventory) < INV_COLS * INV_ROWS:
+                                p.gold -= price
+                                p.inventory.append(w)
+                                v.stock.pop(i)
                                 self.play_sound("gold")
                                 self.add_floating_text(p.pos.x, p.pos.y - 20,
-                                                       f"+{price}g", C_GOLD, 1.0)
-                                break
+                                                       f"-{price}g", (255, 100, 100), 1.0)
+                    else:
+                        # Sell to vendor
+                        i = row_at(mx, my, scroll_sell, len(p.inventory))
+                        if i is not None:
+                            w = p.inventory[i]
+                            price = self._get_vendor_sell_price(w)
+                            p.gold += price
+                            v.stock.append(w)
+                            p.inventory.pop(i)
+                            self.play_sound("gold")
+                            self.add_floating_text(p.pos.x, p.pos.y - 20,
+                                                   f"+{price}g", C_GOLD, 1.0)
 
                 if ev.type == pygame.MOUSEBUTTONDOWN:
                     if ev.button == 4:  # scroll up
@@ -6683,17 +7967,29 @@ class Game:
                         else:
                             scroll_sell += 70
 
+            # Row highlights and tooltips follow the mouse, so only pointing at a row needs a redraw
+            if tab == 0:
+                new_hover = row_at(mx, my, scroll_buy, len(v.stock))
+            else:
+                new_hover = row_at(mx, my, scroll_sell, len(p.inventory))
+            if new_hover is not None:
+                new_hover = (mx, my)
+            if new_hover != hover:
+                hover = new_hover
+                gate.invalidate(full=False)
+
+            if not gate.should_draw():
+                continue
+
             # Draw
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 230))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._fill_overlay((0, 0, 0, 230)), (0, 0))
 
             # Header
-            title = self.bigfont.render(f"- {v.name}'s Trading Post -", True, C_GOLD)
+            title = self._ui_label(f"- {v.name}'s Trading Post -", C_GOLD, big=True)
             self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 25))
-            gold_txt = self.font.render(f"Gold: {p.gold}", True, C_GOLD)
+            gold_txt = self._ui_label(f"Gold: {p.gold}", C_GOLD)
             self.screen.blit(gold_txt, (WIDTH - 280, 30))
-            inv_txt = self.font.render(f"Inventory: {len(p.inventory)}/{INV_COLS * INV_ROWS}", True, (180, 170, 140))
+            inv_txt = self._ui_label(f"Inventory: {len(p.inventory)}/{INV_COLS * INV_ROWS}", (180, 170, 140))
             self.screen.blit(inv_txt, (WIDTH - 280, 55))
 
             # Tabs
@@ -6703,7 +7999,7 @@ class Game:
                 bg = (40, 35, 25) if is_active else (20, 18, 14)
                 pygame.draw.rect(self.screen, bg, (tx, 80, 190, 30), border_radius=5)
                 pygame.draw.rect(self.screen, color, (tx, 80, 190, 30), 2 if is_active else 1, border_radius=5)
-                tt = self.font.render(tlabel, True, color)
+                tt = self._ui_label(tlabel, color)
                 self.screen.blit(tt, (tx + 95 - tt.get_width() // 2, 85))
 
             # Separator
@@ -6712,124 +8008,106 @@ class Game:
             # Clip region for items
             clip_rect = pygame.Rect(190, 130, WIDTH - 380, HEIGHT - 200)
 
-            if tab == 0:
-                # Buy tab — show vendor stock
-                if not v.stock:
-                    no_stock = self.font.render("Sold out! Come back next level.", True, (120, 115, 100))
-                    self.screen.blit(no_stock, (WIDTH // 2 - no_stock.get_width() // 2, 250))
-                for i, w in enumerate(v.stock):
-                    iy = 160 + i * 70 - scroll_buy
-                    if iy < 125 or iy > HEIGHT - 80:
-                        continue
-                    price = self._get_vendor_buy_price(w)
-                    wc = w.get_color()
-                    can_afford = p.gold >= price and len(p.inventory) < INV_COLS * INV_ROWS
-                    # Hover highlight
-                    hovered = 200 <= mx <= WIDTH - 200 and iy <= my <= iy + 64
-                    bg = (35, 30, 22) if hovered else (22, 18, 14)
-                    pygame.draw.rect(self.screen, bg, (200, iy, WIDTH - 400, 64), border_radius=5)
-                    pygame.draw.rect(self.screen, wc if hovered else (50, 45, 35),
-                                     (200, iy, WIDTH - 400, 64), 1, border_radius=5)
-                    # Item icon
-                    pygame.draw.rect(self.screen, wc, (215, iy + 10, 44, 44), border_radius=5)
-                    icon_char = self._get_item_icon(w)
-                    it = self.font.render(icon_char, True, (20, 15, 10))
-                    self.screen.blit(it, (237 - it.get_width() // 2, iy + 22))
-                    # Item info (type-aware)
-                    nt = self.bigfont.render(w.name, True, wc)
-                    self.screen.blit(nt, (275, iy + 5))
-                    rarity = getattr(w, 'rarity', RARITY_NORMAL)
-                    rarity_label = f"[{RARITY_NAMES.get(rarity, 'Normal')}]"
-                    if isinstance(w, Weapon):
-                        rarity_label += f" {w.weapon_class.title()}  Dmg: {w.dmg_min}-{w.dmg_max}  Spd: {w.attack_speed:.1f}"
-                    elif isinstance(w, Armor):
-                        slot_name = {"body": "Armor", "helm": "Helm", "gloves": "Gloves", "boots": "Boots"}.get(w.slot, "Armor")
-                        rarity_label += f" {slot_name}  Def: {w.total_defense()}"
-                    elif isinstance(w, Ring):
-                        slot_name = "Amulet" if w.slot == "amulet" else "Ring"
-                        rarity_label += f" {slot_name}"
-                    elif isinstance(w, Jewel):
-                        rarity_label = f"[Jewel]"
-                    rt = self.font.render(rarity_label, True, (160, 155, 140))
-                    self.screen.blit(rt, (275, iy + 36))
-                    # Mods summary (compact)
-                    mod_x = WIDTH - 550
-                    mods_dict = getattr(w, 'mods', {})
-                    for mk, mv in mods_dict.items():
-                        if mv:
-                            label = mk.replace("_", " ").title()
-                            mt = self.font.render(f"+{mv} {label}", True, (100, 200, 255))
-                            self.screen.blit(mt, (mod_x, iy + 8))
-                            mod_x += mt.get_width() + 15
-                            if mod_x > WIDTH - 350:
-                                break
-                    # Price
-                    price_color = C_GOLD if can_afford else (160, 60, 60)
-                    pt = self.bigfont.render(f"{price}g", True, price_color)
-                    self.screen.blit(pt, (WIDTH - 300, iy + 15))
-                    if not can_afford:
-                        reason = "Not enough gold" if p.gold < price else "Inventory full"
-                        rt2 = self.font.render(reason, True, (140, 60, 60))
-                        self.screen.blit(rt2, (WIDTH - 300, iy + 42))
-            else:
-                # Sell tab — show player inventory
-                if not p.inventory:
-                    no_inv = self.font.render("Your inventory is empty.", True, (120, 115, 100))
-                    self.screen.blit(no_inv, (WIDTH // 2 - no_inv.get_width() // 2, 250))
-                for i, w in enumerate(p.inventory):
-                    iy = 160 + i * 70 - scroll_sell
-                    if iy < 125 or iy > HEIGHT - 80:
-                        continue
-                    price = self._get_vendor_sell_price(w)
-                    wc = w.get_color()
-                    hovered = 200 <= mx <= WIDTH - 200 and iy <= my <= iy + 64
-                    bg = (35, 30, 22) if hovered else (22, 18, 14)
-                    pygame.draw.rect(self.screen, bg, (200, iy, WIDTH - 400, 64), border_radius=5)
-                    pygame.draw.rect(self.screen, wc if hovered else (50, 45, 35),
-                                     (200, iy, WIDTH - 400, 64), 1, border_radius=5)
-                    # Item icon
-                    pygame.draw.rect(self.screen, wc, (215, iy + 10, 44, 44), border_radius=5)
-                    icon_char = self._get_item_icon(w)
-                    it = self.font.render(icon_char, True, (20, 15, 10))
-                    self.screen.blit(it, (237 - it.get_width() // 2, iy + 22))
-                    # Item info (type-aware)
-                    nt = self.bigfont.render(w.name, True, wc)
-                    self.screen.blit(nt, (275, iy + 5))
-                    rarity = getattr(w, 'rarity', RARITY_NORMAL)
-                    rarity_label = f"[{RARITY_NAMES.get(rarity, 'Normal')}]"
-                    if isinstance(w, Weapon):
-                        rarity_label += f" {w.weapon_class.title()}  Dmg: {w.dmg_min}-{w.dmg_max}  Spd: {w.attack_speed:.1f}"
-                    elif isinstance(w, Armor):
-                        slot_name = {"body": "Armor", "helm": "Helm", "gloves": "Gloves", "boots": "Boots"}.get(w.slot, "Armor")
-                        rarity_label += f" {slot_name}  Def: {w.total_defense()}"
-                    elif isinstance(w, Ring):
-                        slot_name = "Amulet" if w.slot == "amulet" else "Ring"
-                        rarity_label += f" {slot_name}"
-                    elif isinstance(w, Jewel):
-                        rarity_label = f"[Jewel]"
-                    rt = self.font.render(rarity_label, True, (160, 155, 140))
-                    self.screen.blit(rt, (275, iy + 36))
-                    # Sell price
-                    pt = self.bigfont.render(f"+{price}g", True, C_GOLD)
-                    self.screen.blit(pt, (WIDTH - 300, iy + 15))
-                    sell_label = self.font.render("Click to sell", True, (180, 170, 120) if hovered else (100, 95, 80))
-                    self.screen.blit(sell_label, (WIDTH - 300, iy + 42))
-
-            # Tooltip for hovered item
+            # Rows only change with hover and affordability, so each is composed once per state
             items_list = v.stock if tab == 0 else p.inventory
             scroll = scroll_buy if tab == 0 else scroll_sell
-            for i, w in enumerate(items_list):
+            if not items_list:
+                if tab == 0:
+                    empty = self._ui_label("Sold out! Come back next level.", (120, 115, 100))
+                else:
+                    empty = self._ui_label("Your inventory is empty.", (120, 115, 100))
+                self.screen.blit(empty, (WIDTH // 2 - empty.get_width() // 2, 250))
+            inv_full = len(p.inventory) >= INV_COLS * INV_ROWS
+            hover_idx = row_at(mx, my, scroll, len(items_list))
+            row_blits = []
+            cur_rects = []
+            # Only rows whose top lies in 125..HEIGHT-80 are drawn, so the rest are never visited
+            first = max(0, -((35 - scroll) // 70))
+            last = min(len(items_list), (HEIGHT - 240 + scroll) // 70 + 1)
+            for i in range(first, last):
+                w = items_list[i]
                 iy = 160 + i * 70 - scroll
-                if 200 <= mx <= WIDTH - 200 and iy <= my <= iy + 64 and 125 < iy < HEIGHT - 80:
-                    self._draw_item_tooltip(w, mx + 15, my)
-                    break
+                hovered = i == hover_idx
+                if hovered:
+                    cur_rects.append(pygame.Rect(200, iy, WIDTH - 200, 64))
+                reason = None
+                if tab == 0:
+                    if p.gold < self._get_vendor_buy_price(w):
+                        reason = "Not enough gold"
+                    elif inv_full:
+                        reason = "Inventory full"
+                key = (id(w), tab, hovered, reason)
+                surf = row_surfs.get(key)
+                if surf is None:
+                    surf = row_surfs[key] = self._build_vendor_row(w, tab == 1, hovered, reason)
+                row_blits.append((surf, (200, iy)))
+            if HAS_FBLITS:
+                self.screen.fblits(row_blits)
+            else:
+                self.screen.blits(row_blits, doreturn=False)
+
+            # Tooltip for hovered item
+            if hover_idx is not None and 125 < 160 + hover_idx * 70 - scroll < HEIGHT - 80:
+                cur_rects.append(self._draw_item_tooltip(items_list[hover_idx], mx + 15, my))
 
-            hint = self.font.render("[Tab] Switch Buy/Sell   [Click] Buy or Sell   [Scroll] Navigate   [V/Esc] Close",
-                                    True, (100, 95, 85))
+            hint = self._ui_label("[Tab] Switch Buy/Sell   [Click] Buy or Sell   [Scroll] Navigate   [V/Esc] Close",
+                                  (100, 95, 85))
             self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 40))
 
-            pygame.display.flip()
-            self.clock.tick(30)
+            gate.present(cur_rects)
+
+    def _build_vendor_row(self, w, selling, hovered, reason):
+        """One vendor list row (box, icon, name, stats and price) composed onto a SRCALPHA Surface."""
+        row_w = WIDTH - 400
+        # Price and reason text can run past the box's right edge, so the Surface extends to the screen edge
+        surf = pygame.Surface((WIDTH - 200, 64), pygame.SRCALPHA)
+        wc = w.get_color()
+        bg = (35, 30, 22) if hovered else (22, 18, 14)
+        pygame.draw.rect(surf, bg, (0, 0, row_w, 64), border_radius=5)
+        pygame.draw.rect(surf, wc if hovered else (50, 45, 35), (0, 0, row_w, 64), 1, border_radius=5)
+        # Item icon
+        pygame.draw.rect(surf, wc, (15, 10, 44, 44), border_radius=5)
+        it = self._ui_label(self._get_item_icon(w), (20, 15, 10))
+        surf.blit(it, (37 - it.get_width() // 2, 22))
+        # Item info (type-aware)
+        nt = self._ui_label(w.name, wc, big=True)
+        surf.blit(nt, (75, 5))
+        rarity = getattr(w, 'rarity', RARITY_NORMAL)
+        rarity_label = f"[{RARITY_NAMES.get(rarity, 'Normal')}]"
+        if isinstance(w, Weapon):
+            rarity_label = w.rarity_label()
+        elif isinstance(w, Armor):
+            slot_name = {"body": "Armor", "helm": "Helm", "gloves": "Gloves", "boots": "Boots"}.get(w.slot, "Armor")
+            rarity_label += f" {slot_name}  Def: {w.total_defense()}"
+        elif isinstance(w, Ring):
+            slot_name = "Amulet" if w.slot == "amulet" else "Ring"
+            rarity_label += f" {slot_name}"
+        elif isinstance(w, Jewel):
+            rarity_label = f"[Jewel]"
+        rt = self._ui_label(rarity_label, (160, 155, 140))
+        surf.blit(rt, (75, 36))
+        if selling:
+            pt = self._ui_label(f"+{self._get_vendor_sell_price(w)}g", C_GOLD, big=True)
+            surf.blit(pt, (WIDTH - 500, 15))
+            sell_label = self._ui_label("Click to sell", (180, 170, 120) if hovered else (100, 95, 80))
+            surf.blit(sell_label, (WIDTH - 500, 42))
+            return surf.convert_alpha()
+        # Mods summary (compact)
+        mod_x = WIDTH - 550
+        for mk, mv in getattr(w, 'mods', {}).items():
+            if mv:
+                label = _mod_label(mk)
+                mt = self._ui_label(f"+{mv} {label}", (100, 200, 255))
+                surf.blit(mt, (mod_x - 200, 8))
+                mod_x += mt.get_width() + 15
+                if mod_x > WIDTH - 350:
+                    break
+        # Price
+        pt = self._ui_label(f"{self._get_vendor_buy_price(w)}g", C_GOLD if reason is None else (160, 60, 60), big=True)
+        surf.blit(pt, (WIDTH - 500, 15))
+        if reason is not None:
+            surf.blit(self._ui_label(reason, (140, 60, 60)), (WIDTH - 500, 42))
+        return surf.convert_alpha()
 
     def _get_save_path(self) -> str:
         """Return save file path in the same directory as the game."""
@@ -6886,8 +8164,7 @@ class Game:
             },
         }
         try:
-            with open(self._get_save_path(), "w") as f:
-                json.dump(save_data, f, indent=2)
+            _write_json(self._get_save_path(), save_data)
             self.play_sound("save")
             self.add_floating_text(self.player.pos.x, self.player.pos.y - 30,
                                    "Game Saved!", (100, 255, 100), 1.5)
@@ -6985,8 +8262,7 @@ class Game:
         if not os.path.exists(path):
             return False
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            data = _read_json(path)
             if data.get("version") != 1:
                 return False
             pd = data["player"]
@@ -7063,6 +8339,7 @@ class Game:
             self.particles.clear()
             self.floating_texts.clear()
             self.corpses.clear()
+            self._corpse_version += 1
             self.chests.clear()
             self.crates.clear()
             self.lightning_chains.clear()
@@ -7089,11 +8366,10 @@ class Game:
         """Show death screen. Returns 'respawn', 'quit', or 'start'."""
         p = self.player
         # Death fade
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay = self._fill_overlay((0, 0, 0, 8))
         for i in range(30):
             for ev in pygame.event.get():
                 pass
-            overlay.fill((0, 0, 0, 8))
             self.screen.blit(overlay, (0, 0))
             pygame.display.flip()
             self.clock.tick(30)
@@ -7195,7 +8471,7 @@ class Game:
             # Ensure player is on a valid floor tile (knockback can push into walls)
             tx, ty = int(p.pos.x // TILE), int(p.pos.y // TILE)
             if (tx < 0 or tx >= MAP_W or ty < 0 or ty >= MAP_H
-                    or self.dungeon.tiles[tx][ty] != FLOOR
+                    or self.dungeon.tiles[tx, ty] != FLOOR
                     or self._circle_collides(p.pos, p.radius)):
                 # Player is stuck in a wall — find nearest floor tile
                 safe = self._safe_loot_pos(p.pos, 60)
@@ -7203,7 +8479,7 @@ class Game:
             # Clear nearby enemies so player doesn't immediately die again
             safe_dist = 250
             self.enemies = [e for e in self.enemies
-                            if (e.pos - p.pos).length() > safe_dist or isinstance(e, TreasureGoblin)]
+                            if (e.pos - p.pos).length() > safe_dist or e.kind_flags & KIND_GOBLIN]
             self.projectiles = [pr for pr in self.projectiles if not pr.hostile]
         # Restore HP, mana, and reset movement state
         p.hp = p.max_hp()
@@ -7262,7 +8538,7 @@ class Game:
                             self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
                         else:
                             self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-                        self.light_map = pygame.Surface((WIDTH, HEIGHT))
+                        self.light_map = pygame.Surface((WIDTH, HEIGHT)).convert()
             if self.paused:
                 self._pause_screen()
                 continue